@@ -1,76 +1,176 @@
 """API dependencies for dependency injection."""
 
 import uuid
-from typing import Annotated
+from typing import Annotated, AsyncGenerator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.database import get_db
+from app.core.database import get_db, get_replica_session_maker, get_session_maker
+from app.core.replica import replica_monitor
 from app.core.security import decode_token
 from app.models.user import User
+from app.schemas.user import UserPrincipal
+from app.services.analytics_cache_service import AnalyticsCacheService
 from app.services.auth_service import AuthService
+from app.services.principal_service import PrincipalService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-async def get_current_user(
+async def get_token_payload(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Get current authenticated user from JWT token."""
+) -> dict:
+    """Get the claims of a valid, unrevoked access token."""
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != "access":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
+
+async def get_token_user_id(
+    payload: Annotated[dict, Depends(get_token_payload)],
+) -> uuid.UUID:
+    """Get the user id named by a valid access token."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_token(token)
-    if payload is None:
-        raise credentials_exception
-
-    token_type = payload.get("type")
-    if token_type != "access":
-        raise credentials_exception
-
     user_id_str = payload.get("sub")
     if user_id_str is None:
         raise credentials_exception
 
     try:
-        user_id = uuid.UUID(user_id_str)
+        return uuid.UUID(user_id_str)
     except ValueError:
         raise credentials_exception
 
-    auth_service = AuthService(db)
-    user = await auth_service.get_user_by_id(user_id)
 
-    if user is None:
-        raise credentials_exception
+async def get_current_principal(
+    user_id: Annotated[uuid.UUID, Depends(get_token_user_id)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> UserPrincipal:
+    """Get the authenticated user's cached id and flags."""
+    principal = await PrincipalService(db).get_principal(user_id)
+
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user",
         )
 
+    return principal
+
+
+async def get_current_user(
+    principal: Annotated[UserPrincipal, Depends(get_current_principal)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """Get the full user record for routes that read or change it."""
+    auth_service = AuthService(db)
+    user = await auth_service.get_user_by_id(principal.id)
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     return user
 
 
 async def get_current_active_superuser(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    principal: Annotated[UserPrincipal, Depends(get_current_principal)],
+) -> UserPrincipal:
     """Get current user and verify they are a superuser."""
-    if not current_user.is_superuser:
+    if not principal.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
-    return current_user
+    return principal
+
+
+async def get_read_replica(
+    request: Request,
+    principal: Annotated[UserPrincipal, Depends(get_current_principal)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    replica_maker: Annotated[
+        Optional[async_sessionmaker[AsyncSession]],
+        Depends(get_replica_session_maker),
+    ],
+) -> Optional[async_sessionmaker[AsyncSession]]:
+    """
+    Choose where the current user's reads go.
+
+    Returns the replica session factory when the replica has replayed the
+    user's last write, or None to read on the primary. The user's data
+    version is left on ``request.state.data_version`` for the analytics
+    cache.
+    """
+    if replica_maker is None:
+        return None
+
+    version, last_write = await AnalyticsCacheService(db).get_watermark(principal.id)
+    request.state.data_version = version
+    if await replica_monitor.has_replayed(replica_maker, last_write):
+        return replica_maker
+    return None
+
+
+async def get_read_db(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    read_maker: Annotated[
+        Optional[async_sessionmaker[AsyncSession]],
+        Depends(get_read_replica),
+    ],
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a session for read-only queries.
+
+    On the replica it is a separate session that is never committed; on
+    the primary it is the request's own session, which ``get_db`` commits
+    only if something was written.
+    """
+    if read_maker is None:
+        yield db
+        return
+    async with read_maker() as session:
+        yield session
+
+
+async def get_read_session_maker(
+    session_maker: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_maker)],
+    read_maker: Annotated[
+        Optional[async_sessionmaker[AsyncSession]],
+        Depends(get_read_replica),
+    ],
+) -> async_sessionmaker[AsyncSession]:
+    """Get the session factory for concurrent read-only queries."""
+    return read_maker or session_maker
 
 
 # Type aliases for cleaner dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentSuperuser = Annotated[User, Depends(get_current_active_superuser)]
+CurrentPrincipal = Annotated[UserPrincipal, Depends(get_current_principal)]
+CurrentSuperuser = Annotated[UserPrincipal, Depends(get_current_active_superuser)]
+AccessTokenPayload = Annotated[dict, Depends(get_token_payload)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+SessionMaker = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_maker)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
+ReadSessionMaker = Annotated[async_sessionmaker[AsyncSession], Depends(get_read_session_maker)]
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.api.v1 import auth, detection, history, analysis, users
+from app.api.v1 import admin, auth, detection, history, analysis, users
 
 api_router = APIRouter()
 
@@ -11,3 +11,4 @@ api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(detection.router, prefix="/detection", tags=["Detection"])
 api_router.include_router(history.router, prefix="/history", tags=["History"])
 api_router.include_router(analysis.router, prefix="/analysis", tags=["Analysis"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
@@ -0,0 +1,109 @@
+"""Admin analytics API routes."""
+
+import uuid
+
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import CurrentSuperuser, DbSession
+from app.schemas.admin import (
+    CategoryRumorRatesResponse,
+    PlatformOverviewResponse,
+    RiskIndicatorsResponse,
+    ViewRefreshResponse,
+)
+from app.schemas.user import UserPrincipal, UserResponse
+from app.services.admin_analytics_service import AdminAnalyticsService
+from app.services.auth_service import AuthService
+
+router = APIRouter()
+
+
+@router.get("/analytics/overview", response_model=PlatformOverviewResponse)
+async def get_platform_overview(
+    current_user: CurrentSuperuser,
+    db: DbSession,
+    days: int = Query(30, ge=1, le=365),
+) -> PlatformOverviewResponse:
+    """Get platform-wide detection totals and daily activity."""
+    admin_service = AdminAnalyticsService(db)
+    return await admin_service.get_platform_overview(days)
+
+
+@router.get("/analytics/categories", response_model=CategoryRumorRatesResponse)
+async def get_category_rumor_rates(
+    current_user: CurrentSuperuser,
+    db: DbSession,
+) -> CategoryRumorRatesResponse:
+    """Get platform-wide rumor rates by category."""
+    admin_service = AdminAnalyticsService(db)
+    return await admin_service.get_category_rumor_rates()
+
+
+@router.get("/analytics/risk-indicators", response_model=RiskIndicatorsResponse)
+async def get_top_risk_indicators(
+    current_user: CurrentSuperuser,
+    db: DbSession,
+    limit: int = Query(20, ge=1, le=200),
+) -> RiskIndicatorsResponse:
+    """Get the most frequent risk indicators across all users."""
+    admin_service = AdminAnalyticsService(db)
+    return await admin_service.get_top_risk_indicators(limit)
+
+
+@router.post("/analytics/refresh", response_model=ViewRefreshResponse)
+async def refresh_views(
+    current_user: CurrentSuperuser,
+    db: DbSession,
+) -> ViewRefreshResponse:
+    """Refresh the admin materialized views now."""
+    admin_service = AdminAnalyticsService(db)
+    refreshed = await admin_service.refresh_views(force=True)
+    return ViewRefreshResponse(
+        refreshed=refreshed,
+        views=await admin_service.get_all_freshness(),
+    )
+
+
+async def _set_user_active(
+    user_id: uuid.UUID,
+    is_active: bool,
+    current_user: UserPrincipal,
+    db: AsyncSession,
+) -> UserResponse:
+    if user_id == current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot change your own account status",
+        )
+
+    auth_service = AuthService(db)
+    user = await auth_service.get_user_by_id(user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
+    user = await auth_service.set_active(user, is_active)
+    return UserResponse.model_validate(user)
+
+
+@router.post("/users/{user_id}/deactivate", response_model=UserResponse)
+async def deactivate_user(
+    user_id: uuid.UUID,
+    current_user: CurrentSuperuser,
+    db: DbSession,
+) -> UserResponse:
+    """Deactivate a user; their tokens stop working on every worker."""
+    return await _set_user_active(user_id, False, current_user, db)
+
+
+@router.post("/users/{user_id}/activate", response_model=UserResponse)
+async def activate_user(
+    user_id: uuid.UUID,
+    current_user: CurrentSuperuser,
+    db: DbSession,
+) -> UserResponse:
+    """Reactivate a deactivated user."""
+    return await _set_user_active(user_id, True, current_user, db)
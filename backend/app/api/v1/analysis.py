@@ -1,67 +1,255 @@
 """Analysis and statistics API routes."""
 
-from fastapi import APIRouter, Query
+import uuid
+from typing import Awaitable, Callable, Literal, Optional
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from app.api.deps import CurrentUser, DbSession
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import CurrentPrincipal, DbSession, ReadDbSession, ReadSessionMaker
+from app.core.config import settings
 from app.schemas.analysis import (
     CategoryResponse,
+    DashboardResponse,
     KeywordsResponse,
     OverviewStats,
     RiskDistributionResponse,
+    TermField,
+    TrendGranularity,
+    TrendingResponse,
     TrendResponse,
 )
-from app.services.analysis_service import AnalysisService
+from app.services.analysis_service import AnalysisService, trend_as_of
+from app.services.analytics_cache_service import (
+    AnalyticsCacheService,
+    etag_matches,
+    make_etag,
+)
+from app.services.trending_service import get_trending_keywords
 
 router = APIRouter()
 
 
+def _cache_key(endpoint: str, **params) -> str:
+    """Build a cache key from an endpoint name and its query parameters."""
+    return f"{endpoint}?" + urlencode(
+        sorted((name, str(value)) for name, value in params.items() if value is not None)
+    )
+
+
+async def _cached(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    key: str,
+    compute: Callable[[], Awaitable[BaseModel]],
+) -> BaseModel | Response:
+    """
+    Serve an analytics response through the versioned cache.
+
+    Replies 304 when ``If-None-Match`` carries the ETag of the user's
+    current data version, returns the stored JSON on a hit, and otherwise
+    computes and stores the response.
+    """
+    if not settings.ANALYTICS_CACHE_ENABLED:
+        return await compute()
+
+    cache = AnalyticsCacheService(db)
+    version = getattr(request.state, "data_version", None)
+    if version is None:
+        version = await cache.get_version(user_id)
+    headers = {
+        "ETag": make_etag(user_id, key, version),
+        "Cache-Control": "private, no-cache",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    payload = await cache.get(user_id, key, version)
+    if payload is not None:
+        return JSONResponse(payload, headers={**headers, "X-Cache": "hit"})
+
+    value = await compute()
+    await cache.set(user_id, key, version, value.model_dump(mode="json"))
+    response.headers.update({**headers, "X-Cache": "miss"})
+    return value
+
+
+def _validate_timezone(timezone: Optional[str]) -> None:
+    if timezone is None:
+        return
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown timezone",
+        )
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    current_user: CurrentPrincipal,
+    db: DbSession,
+    read_db: ReadDbSession,
+    session_maker: ReadSessionMaker,
+    request: Request,
+    response: Response,
+    days: int = Query(30, ge=1, le=365),
+    keyword_limit: int = Query(50, ge=10, le=200),
+) -> DashboardResponse | Response:
+    """Get all dashboard widgets in one response."""
+
+    async def compute() -> DashboardResponse:
+        analysis_service = AnalysisService(read_db)
+        dashboard, timings = await analysis_service.get_dashboard(
+            current_user.id,
+            days=days,
+            keyword_limit=keyword_limit,
+            session_maker=(
+                session_maker if settings.ANALYTICS_PARALLEL_QUERIES else None
+            ),
+        )
+        response.headers["Server-Timing"] = ", ".join(
+            f"{name};dur={duration:.1f}" for name, duration in timings.items()
+        )
+        return dashboard
+
+    key = _cache_key(
+        "dashboard",
+        days=days,
+        keyword_limit=keyword_limit,
+        as_of=trend_as_of(TrendGranularity.DAY),
+    )
+    return await _cached(request, response, db, current_user.id, key, compute)
+
+
 @router.get("/overview", response_model=OverviewStats)
 async def get_overview(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
-) -> OverviewStats:
+    read_db: ReadDbSession,
+    request: Request,
+    response: Response,
+) -> OverviewStats | Response:
     """Get overview statistics for dashboard."""
-    analysis_service = AnalysisService(db)
-    return await analysis_service.get_overview_stats(current_user.id)
+    analysis_service = AnalysisService(read_db)
+    return await _cached(
+        request,
+        response,
+        db,
+        current_user.id,
+        _cache_key("overview"),
+        lambda: analysis_service.get_overview_stats(current_user.id),
+    )
 
 
 @router.get("/trend", response_model=TrendResponse)
 async def get_trend(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
+    read_db: ReadDbSession,
+    request: Request,
+    response: Response,
     days: int = Query(30, ge=1, le=365),
-) -> TrendResponse:
+    granularity: TrendGranularity = Query(TrendGranularity.DAY),
+    timezone: Optional[str] = Query(None, max_length=64),
+) -> TrendResponse | Response:
     """Get trend data for the specified number of days."""
-    analysis_service = AnalysisService(db)
-    return await analysis_service.get_trend_data(current_user.id, days)
+    _validate_timezone(timezone)
+
+    analysis_service = AnalysisService(read_db)
+    key = _cache_key(
+        "trend",
+        days=days,
+        granularity=granularity.value,
+        timezone=timezone,
+        as_of=trend_as_of(granularity, timezone),
+    )
+    return await _cached(
+        request,
+        response,
+        db,
+        current_user.id,
+        key,
+        lambda: analysis_service.get_trend_data(
+            current_user.id, days, granularity, timezone
+        ),
+    )
 
 
 @router.get("/category", response_model=CategoryResponse)
 async def get_category_stats(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
-) -> CategoryResponse:
+    read_db: ReadDbSession,
+    request: Request,
+    response: Response,
+) -> CategoryResponse | Response:
     """Get category distribution statistics."""
-    analysis_service = AnalysisService(db)
-    return await analysis_service.get_category_stats(current_user.id)
+    analysis_service = AnalysisService(read_db)
+    return await _cached(
+        request,
+        response,
+        db,
+        current_user.id,
+        _cache_key("category"),
+        lambda: analysis_service.get_category_stats(current_user.id),
+    )
 
 
 @router.get("/keywords", response_model=KeywordsResponse)
 async def get_keywords(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
+    read_db: ReadDbSession,
+    request: Request,
+    response: Response,
     limit: int = Query(50, ge=10, le=200),
-) -> KeywordsResponse:
+    field: TermField = Query(TermField.KEYWORDS),
+) -> KeywordsResponse | Response:
     """Get keyword frequency statistics for word cloud."""
-    analysis_service = AnalysisService(db)
-    return await analysis_service.get_keywords_stats(current_user.id, limit)
+    analysis_service = AnalysisService(read_db)
+    return await _cached(
+        request,
+        response,
+        db,
+        current_user.id,
+        _cache_key("keywords", limit=limit, field=field.value),
+        lambda: analysis_service.get_keywords_stats(current_user.id, limit, field),
+    )
 
 
 @router.get("/risk-distribution", response_model=RiskDistributionResponse)
 async def get_risk_distribution(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
-) -> RiskDistributionResponse:
+    read_db: ReadDbSession,
+    request: Request,
+    response: Response,
+) -> RiskDistributionResponse | Response:
     """Get risk level distribution statistics."""
-    analysis_service = AnalysisService(db)
-    return await analysis_service.get_risk_distribution(current_user.id)
+    analysis_service = AnalysisService(read_db)
+    return await _cached(
+        request,
+        response,
+        db,
+        current_user.id,
+        _cache_key("risk-distribution"),
+        lambda: analysis_service.get_risk_distribution(current_user.id),
+    )
+
+
+@router.get("/trending", response_model=TrendingResponse)
+async def get_trending(
+    current_user: CurrentPrincipal,
+    window: Literal["hour", "day"] = Query("hour"),
+    limit: int = Query(50, ge=10, le=200),
+) -> TrendingResponse:
+    """Get platform-wide trending keywords for the last hour or day."""
+    return get_trending_keywords(window, limit)
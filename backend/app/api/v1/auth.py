@@ -1,17 +1,24 @@
 """Authentication API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import math
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.deps import CurrentUser, DbSession
+from app.api.deps import AccessTokenPayload, CurrentPrincipal, DbSession
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
 )
-from app.schemas.common import Message, Token
+from app.core.throttle import login_throttle
+from app.schemas.common import LogoutRequest, Message, RefreshTokenRequest, Token
 from app.schemas.user import UserCreate, UserResponse
 from app.services.auth_service import AuthService
+from app.services.principal_service import PrincipalService
+from app.services.token_revocation_service import TokenRevocationService
 
 router = APIRouter()
 
@@ -45,10 +52,20 @@ async def register(
 
 @router.post("/login", response_model=Token)
 async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: DbSession = None,
 ) -> Token:
     """Login and get access token."""
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = login_throttle.retry_after(form_data.username, client_ip)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
     auth_service = AuthService(db)
 
     user = await auth_service.authenticate(
@@ -57,6 +74,7 @@ async def login(
     )
 
     if not user:
+        login_throttle.record_failure(form_data.username, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -69,6 +87,7 @@ async def login(
             detail="Inactive user",
         )
 
+    login_throttle.record_success(form_data.username, client_ip)
     return Token(
         access_token=create_access_token(str(user.id)),
         refresh_token=create_refresh_token(str(user.id)),
@@ -77,11 +96,16 @@ async def login(
 
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
-    refresh_token: str,
+    token_data: RefreshTokenRequest,
     db: DbSession,
 ) -> Token:
-    """Refresh access token using refresh token."""
-    payload = decode_token(refresh_token)
+    """
+    Exchange a refresh token for a new token pair.
+
+    The refresh token is rotated: it is revoked here, so each one can be
+    used once.
+    """
+    payload = decode_token(token_data.refresh_token)
 
     if payload is None:
         raise HTTPException(
@@ -96,12 +120,26 @@ async def refresh_token(
         )
 
     user_id = payload.get("sub")
-    if not user_id:
+    if not user_id or not payload.get("jti"):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
 
+    principal = await PrincipalService(db).get_principal(uuid.UUID(user_id))
+    if principal is None or not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+
+    # Concurrent refreshes with the same token: only the first one wins
+    if not await TokenRevocationService(db).revoke(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+
     return Token(
         access_token=create_access_token(user_id),
         refresh_token=create_refresh_token(user_id),
@@ -110,11 +148,24 @@ async def refresh_token(
 
 @router.post("/logout", response_model=Message)
 async def logout(
-    current_user: CurrentUser,
+    token_payload: AccessTokenPayload,
+    current_user: CurrentPrincipal,
+    db: DbSession,
+    logout_data: Optional[LogoutRequest] = None,
 ) -> Message:
-    """Logout current user."""
-    # In a real application, you might want to:
-    # - Blacklist the current token
-    # - Clear server-side session
-    # For now, the client should just discard the token
+    """Logout current user, revoking the access token and the given refresh token."""
+    revocations = TokenRevocationService(db)
+    if token_payload.get("jti"):
+        await revocations.revoke(token_payload)
+
+    if logout_data is not None and logout_data.refresh_token:
+        refresh_payload = decode_token(logout_data.refresh_token)
+        if (
+            refresh_payload is not None
+            and refresh_payload.get("type") == "refresh"
+            and refresh_payload.get("jti")
+            and refresh_payload.get("sub") == str(current_user.id)
+        ):
+            await revocations.revoke(refresh_payload)
+
     return Message(message="Successfully logged out")
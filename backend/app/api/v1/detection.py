@@ -1,19 +1,21 @@
 """Detection API routes."""
 
 import uuid
-from typing import Optional
+from typing import Literal, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 
-from app.api.deps import CurrentUser, DbSession
+from app.api.deps import CurrentPrincipal, DbSession
 from app.schemas.detection import (
     BatchDetectionRequest,
     BatchDetectionResponse,
     DetectionRequest,
     DetectionResponse,
+    PropagationNode,
     PropagationResponse,
 )
 from app.services.detection_service import DetectionService
+from app.services.propagation_service import PropagationService
 
 router = APIRouter()
 
@@ -21,7 +23,7 @@ router = APIRouter()
 @router.post("/single", response_model=DetectionResponse)
 async def detect_single(
     request: DetectionRequest,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
 ) -> DetectionResponse:
     """Perform single text rumor detection."""
@@ -36,7 +38,7 @@ async def detect_single(
 @router.post("/batch", response_model=BatchDetectionResponse)
 async def detect_batch(
     request: BatchDetectionRequest,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
 ) -> BatchDetectionResponse:
     """Perform batch text rumor detection."""
@@ -61,7 +63,7 @@ async def detect_batch(
 @router.get("/{detection_id}", response_model=DetectionResponse)
 async def get_detection(
     detection_id: uuid.UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
 ) -> DetectionResponse:
     """Get detection by ID."""
@@ -83,7 +85,7 @@ async def get_detection(
 @router.get("/{detection_id}/analysis")
 async def get_detection_analysis(
     detection_id: uuid.UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
 ):
     """Get detailed analysis for a detection."""
@@ -112,10 +114,22 @@ async def get_detection_analysis(
 @router.get("/{detection_id}/propagation", response_model=PropagationResponse)
 async def get_propagation(
     detection_id: uuid.UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
+    node_id: Optional[str] = Query(None, max_length=100, description="Return only this node's subtree"),
+    min_depth: int = Query(0, ge=0),
+    max_depth: Optional[int] = Query(None, ge=0),
+    order: Literal["depth", "time"] = "depth",
+    page: int = Query(1, ge=1),
+    page_size: int = Query(200, ge=1, le=1000),
 ) -> PropagationResponse:
-    """Get propagation path for a detection."""
+    """
+    Get one page of a detection's propagation tree with cascade statistics.
+
+    Nodes are listed level by level (``order=depth``) or in repost order
+    (``order=time``), optionally limited to the subtree under ``node_id``
+    and to a range of depths below it.
+    """
     detection_service = DetectionService(db)
     detection = await detection_service.get_detection_by_id(
         detection_id=detection_id,
@@ -128,9 +142,22 @@ async def get_propagation(
             detail="Detection not found",
         )
 
-    # Return propagation nodes (may be empty if not available)
-    from app.schemas.detection import PropagationNode
+    propagation_service = PropagationService(db)
+    if node_id is not None and not await propagation_service.node_exists(detection.id, node_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Propagation node not found",
+        )
 
+    rows, total = await propagation_service.get_nodes(
+        detection.id,
+        root_node_id=node_id,
+        min_depth=min_depth,
+        max_depth=max_depth,
+        order=order,
+        page=page,
+        page_size=page_size,
+    )
     nodes = [
         PropagationNode(
             node_id=node.node_id,
@@ -139,11 +166,30 @@ async def get_propagation(
             user_info=node.user_info,
             engagement=node.engagement,
             timestamp=node.timestamp,
+            depth=depth,
         )
-        for node in detection.propagation_nodes
+        for node, depth in rows
     ]
 
-    return PropagationResponse(
+    response = PropagationResponse(
         detection_id=detection.id,
         nodes=nodes,
+        root_node_id=node_id,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=(total + page_size - 1) // page_size,
     )
+    stats = await propagation_service.get_stats(detection.id)
+    if stats is not None:
+        response.pattern = stats.pattern
+        response.spread_speed = stats.spread_speed
+        response.estimated_reach = stats.estimated_reach
+        response.influence_score = stats.influence_score
+        response.node_count = stats.node_count
+        response.max_depth = stats.max_depth
+        response.max_breadth = stats.max_breadth
+        response.structural_virality = stats.structural_virality
+        response.half_life_hours = stats.half_life_hours
+        response.growth = stats.growth
+    return response
@@ -7,7 +7,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel
 
-from app.api.deps import CurrentUser, DbSession
+from app.api.deps import CurrentPrincipal, DbSession, ReadDbSession
 from app.schemas.analysis import HistoryStats, RiskDistribution
 from app.schemas.common import Message, PaginatedResponse
 from app.schemas.detection import DetectionResponse
@@ -24,14 +24,17 @@ class BatchDeleteRequest(BaseModel):
 
 @router.get("", response_model=PaginatedResponse[DetectionResponse])
 async def get_history(
-    current_user: CurrentUser,
-    db: DbSession,
+    current_user: CurrentPrincipal,
+    db: ReadDbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     is_rumor: Optional[bool] = None,
     risk_level: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    keyword: Optional[str] = None,
+    fact_check_point: Optional[str] = None,
+    risk_indicator: Optional[str] = None,
 ) -> PaginatedResponse[DetectionResponse]:
     """Get paginated detection history with optional filters."""
     detection_service = DetectionService(db)
@@ -44,6 +47,9 @@ async def get_history(
         risk_level=risk_level,
         start_date=start_date,
         end_date=end_date,
+        keyword=keyword,
+        fact_check_point=fact_check_point,
+        risk_indicator=risk_indicator,
     )
 
     items = [detection_service.to_response(d) for d in detections]
@@ -58,8 +64,8 @@ async def get_history(
 
 @router.get("/stats", response_model=HistoryStats)
 async def get_history_stats(
-    current_user: CurrentUser,
-    db: DbSession,
+    current_user: CurrentPrincipal,
+    db: ReadDbSession,
 ) -> HistoryStats:
     """Get statistics for user's detection history."""
     detection_service = DetectionService(db)
@@ -91,7 +97,7 @@ async def get_history_stats(
 @router.delete("/{detection_id}", response_model=Message)
 async def delete_history_item(
     detection_id: uuid.UUID,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
 ) -> Message:
     """Delete a single detection record."""
@@ -114,7 +120,7 @@ async def delete_history_item(
 @router.delete("/batch", response_model=Message)
 async def delete_history_batch(
     request: BatchDeleteRequest,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     db: DbSession,
 ) -> Message:
     """Delete multiple detection records."""
@@ -56,7 +56,7 @@ async def update_password(
 ) -> Message:
     """Update current user password."""
     # Verify current password
-    if not verify_password(
+    if not await verify_password(
         password_data.current_password,
         current_user.hashed_password,
     ):
@@ -0,0 +1,41 @@
+"""Rebuild derived analytics tables from the detections table.
+
+Usage:
+    python -m app.commands.backfill [--user-id UUID]
+"""
+
+import argparse
+import asyncio
+import uuid
+from typing import Optional
+
+from app.core.database import async_session_maker, engine
+from app.services.rollup_service import RollupService
+from app.services.term_index_service import TermIndexService
+
+
+async def backfill(user_id: Optional[uuid.UUID] = None) -> None:
+    """Rebuild dashboard rollups and term counts in a single transaction."""
+    async with async_session_maker() as session:
+        async with session.begin():
+            rollup_rows = await RollupService(session).backfill(user_id)
+            term_rows = await TermIndexService(session).backfill(user_id)
+    print(f"detection_daily_rollups: {rollup_rows} rows rebuilt")
+    print(f"user_term_counts: {term_rows} rows rebuilt")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--user-id",
+        type=uuid.UUID,
+        default=None,
+        help="Only rebuild aggregates for this user",
+    )
+    args = parser.parse_args()
+    asyncio.run(backfill(args.user_id))
+
+
+if __name__ == "__main__":
+    main()
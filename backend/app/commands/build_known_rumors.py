@@ -0,0 +1,41 @@
+"""Rebuild the known rumor index from the processed Ma-Weibo dataset.
+
+Usage:
+    python -m app.commands.build_known_rumors [--dataset PATH] [--output PATH]
+"""
+
+import argparse
+
+from app.core.config import settings
+from app.services.known_rumor_service import DATASET_COLUMNS, KnownRumorIndex
+from app.utils.dataset import read_frame
+from app.utils.text_processor import initialize
+
+
+def build(dataset: str, output: str) -> None:
+    """Fingerprint every labeled source post and save the index."""
+    initialize()
+    index = KnownRumorIndex()
+    events = index.build(read_frame(dataset, DATASET_COLUMNS))
+    index.save(output)
+    print(f"{output}: {events} labeled events indexed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dataset",
+        default=settings.KNOWN_RUMORS_DATASET_PATH,
+        help="Source posts written by data/preprocess.py (.csv, .arrow or .parquet)",
+    )
+    parser.add_argument(
+        "--output",
+        default=settings.KNOWN_RUMORS_INDEX_PATH,
+        help="Index file to write",
+    )
+    args = parser.parse_args()
+    build(args.dataset, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Import Ma-Weibo events as detections with their repost cascades.
+
+Each event becomes a detection owned by the given user, labeled from the
+dataset, and its full repost tree is copied into propagation_nodes. Event
+files are parsed in worker processes while the main process COPYs.
+Events already imported for the user are skipped.
+
+Usage:
+    python -m app.commands.import_cascades --user-email EMAIL [--raw-dir DIR]
+        [--workers N] [--commit-every N] [--limit N]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.database import async_session_maker, engine
+from app.models.user import User
+from app.services.cascade_import_service import (
+    CascadeImportService,
+    event_tasks,
+    read_event_cascade,
+)
+from app.utils.text_processor import initialize
+
+_DONE = object()
+
+
+async def import_cascades(
+    email: str,
+    raw_dir: str,
+    workers: Optional[int] = None,
+    commit_every: int = 50,
+    limit: Optional[int] = None,
+) -> None:
+    """Import every not yet imported event, committing every ``commit_every`` events."""
+    async with async_session_maker() as session:
+        user = (
+            await session.execute(select(User).where(User.email == email))
+        ).scalar_one_or_none()
+        if user is None:
+            print(f"No user with email {email}")
+            await engine.dispose()
+            return
+
+        service = CascadeImportService(session)
+        tasks = event_tasks(raw_dir, await service.imported_event_ids(user.id))[:limit]
+        print(f"{len(tasks)} events to import")
+
+        events = nodes = skipped = 0
+        start = time.perf_counter()
+        copy_seconds = 0.0
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(workers or os.cpu_count() or 1, initializer=initialize) as pool:
+            # Unordered: one huge cascade shouldn't hold back the rest
+            results = pool.imap_unordered(read_event_cascade, tasks, chunksize=4)
+            while True:
+                # Wait for the next parsed event off the event loop
+                event = await asyncio.to_thread(next, results, _DONE)
+                if event is _DONE:
+                    break
+                if event is None:
+                    skipped += 1
+                    continue
+                copy_start = time.perf_counter()
+                nodes += await service.import_event(user.id, event)
+                events += 1
+                if events % commit_every == 0:
+                    await session.commit()
+                copy_seconds += time.perf_counter() - copy_start
+        await session.commit()
+        elapsed = time.perf_counter() - start
+
+        # Imported detections count towards the user's dashboards
+        async with session.begin():
+            await service.finish(user.id)
+
+    print(f"{events} events imported, {skipped} missing or unreadable")
+    print(f"{nodes} nodes in {elapsed:.1f}s ({nodes / max(elapsed, 1e-9):,.0f} nodes/s)")
+    print(f"insert + COPY {copy_seconds:.1f}s ({nodes / max(copy_seconds, 1e-9):,.0f} nodes/s)")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-email", required=True, help="Owner of the imported detections")
+    parser.add_argument(
+        "--raw-dir",
+        default="data/raw",
+        help="Raw dataset directory holding Weibo.txt and Weibo/",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (one per CPU by default)")
+    parser.add_argument("--commit-every", type=int, default=50, help="Events per transaction")
+    parser.add_argument("--limit", type=int, default=None, help="Import at most this many events")
+    args = parser.parse_args()
+    asyncio.run(import_cascades(
+        args.user_email,
+        args.raw_dir,
+        args.workers,
+        args.commit_every,
+        args.limit,
+    ))
+
+
+if __name__ == "__main__":
+    main()
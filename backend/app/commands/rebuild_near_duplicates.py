@@ -0,0 +1,38 @@
+"""Rebuild the near-duplicate SimHash index from the detections table.
+
+Usage:
+    python -m app.commands.rebuild_near_duplicates [--chunk-size N]
+"""
+
+import argparse
+import asyncio
+
+from app.core.database import async_session_maker, engine
+from app.services.near_duplicate_service import NearDuplicateService
+from app.utils.text_processor import initialize
+
+
+async def rebuild(chunk_size: int) -> None:
+    """Re-fingerprint every model-verified detection in a single transaction."""
+    initialize()
+    async with async_session_maker() as session:
+        async with session.begin():
+            rows = await NearDuplicateService(session).rebuild(chunk_size)
+    print(f"detection_fingerprints: {rows} rows rebuilt")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Detections fingerprinted per query",
+    )
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
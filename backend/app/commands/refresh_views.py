@@ -0,0 +1,50 @@
+"""Refresh the admin analytics materialized views.
+
+Usage:
+    python -m app.commands.refresh_views [--if-stale | --recreate]
+"""
+
+import argparse
+import asyncio
+
+from app.core.database import async_session_maker, engine
+from app.services.admin_analytics_service import AdminAnalyticsService
+
+
+async def refresh_views(force: bool = True, recreate: bool = False) -> None:
+    """Refresh (or recreate) every view and report its new freshness."""
+    async with async_session_maker() as session:
+        async with session.begin():
+            service = AdminAnalyticsService(session)
+            if recreate:
+                refreshed = await service.recreate_views()
+            else:
+                refreshed = await service.refresh_views(force=force)
+            freshness = await service.get_all_freshness()
+
+    if not refreshed:
+        print("Views not refreshed (still fresh, or another refresh is running)")
+    for name, view in freshness.items():
+        print(f"{name}: refreshed at {view.refreshed_at}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--if-stale",
+        action="store_true",
+        help="Skip views refreshed within ADMIN_VIEWS_REFRESH_INTERVAL_SECONDS",
+    )
+    mode.add_argument(
+        "--recreate",
+        action="store_true",
+        help="Drop and recreate the views (after changing ANALYTICS_TIMEZONE)",
+    )
+    args = parser.parse_args()
+    asyncio.run(refresh_views(force=not args.if_stale, recreate=args.recreate))
+
+
+if __name__ == "__main__":
+    main()
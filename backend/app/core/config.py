@@ -44,16 +44,133 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    # Connection pool (per engine, per worker)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_SLOW_CHECKOUT_MS: float = 250.0
+    # asyncpg caches; set both to 0 behind PgBouncer in transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = 256
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+    # End the session's transaction before model calls so the connection
+    # goes back to the pool instead of idling for the whole request
+    DB_RELEASE_DURING_LLM: bool = True
+
+    # Optional streaming replica for read-only routes (same credentials and
+    # database as the primary)
+    REPLICA_POSTGRES_HOST: Optional[str] = None
+    REPLICA_POSTGRES_PORT: Optional[int] = None
+    # How long a sampled replica replay position is reused
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 1.0
+    # Extra margin a user's last write must be behind the replay position
+    REPLICA_READ_YOUR_WRITES_SLACK_SECONDS: float = 1.0
+
+    @property
+    def REPLICA_DATABASE_URL(self) -> Optional[str]:
+        """Construct async replica URL, or None when no replica is configured."""
+        if not self.REPLICA_POSTGRES_HOST:
+            return None
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{self.REPLICA_POSTGRES_HOST}:{self.REPLICA_POSTGRES_PORT or self.POSTGRES_PORT}"
+            f"/{self.POSTGRES_DB}"
+        )
+
     # JWT Authentication
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Password hashing: work factor, hashing threads and queued-hash bound
+    # per worker (beyond it requests get 503)
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_MAX_THREADS: int = 2
+    BCRYPT_MAX_PENDING: int = 64
+    # Failed logins allowed per window, per account+IP and per account
+    LOGIN_MAX_ATTEMPTS: int = 5
+    LOGIN_MAX_ACCOUNT_ATTEMPTS: int = 20
+    LOGIN_WINDOW_SECONDS: int = 300
+
+    # Per-worker caches of verified tokens and of the users they name;
+    # changes are pushed to every worker with LISTEN/NOTIFY
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    # Revoked token ids are pushed with NOTIFY; polling catches up on any
+    # missed while a worker's listener was disconnected
+    TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS: int = 30
 
     # DeepSeek API
     DEEPSEEK_API_KEY: str = ""
     DEEPSEEK_API_BASE: str = "https://api.deepseek.com/v1"
     DEEPSEEK_MODEL: str = "deepseek-chat"
+    # Prompt input compression: clean posts and keep their most salient
+    # sentences within an estimated token budget (single / per batch item)
+    PROMPT_COMPRESSION_ENABLED: bool = True
+    PROMPT_MAX_INPUT_TOKENS: int = 800
+    PROMPT_BATCH_ITEM_MAX_TOKENS: int = 300
+
+    # Shared verdicts for identical content across users, re-verified with
+    # the model once older than the TTL
+    CLAIM_STORE_ENABLED: bool = True
+    CLAIM_TTL_HOURS: int = 168
+
+    # Instant verdicts for content matching a labeled Ma-Weibo event; the
+    # index is rebuilt from the dataset when it is newer than the saved file
+    KNOWN_RUMORS_ENABLED: bool = True
+    KNOWN_RUMORS_DATASET_PATH: str = "data/processed/weibo_rumors.csv"
+    KNOWN_RUMORS_INDEX_PATH: str = "data/processed/known_rumors.npz"
+    KNOWN_RUMORS_MAX_DISTANCE: int = 3
+
+    # Near-duplicate verdict reuse: SimHash over jieba tokens, looked up
+    # through LSH bands. BANDS must exceed MAX_DISTANCE; run
+    # app.commands.rebuild_near_duplicates after changing it
+    NEAR_DUPLICATE_ENABLED: bool = True
+    NEAR_DUPLICATE_MAX_DISTANCE: int = 3
+    NEAR_DUPLICATE_BANDS: int = 4
+    NEAR_DUPLICATE_MIN_TOKENS: int = 5
+
+    # Propagation trees: deepest level below the requested node that
+    # node listings descend to
+    PROPAGATION_MAX_DEPTH: int = 100
+
+    # Analytics
+    ANALYTICS_PARALLEL_QUERIES: bool = True
+    # IANA zone defining rollup days and the default trend timezone. Stored
+    # days don't move with it: after changing this, run
+    # python -m app.commands.backfill and
+    # python -m app.commands.refresh_views --recreate
+    ANALYTICS_TIMEZONE: str = "Asia/Shanghai"
+    # Versioned response cache (per-worker LRU in front of a shared table)
+    ANALYTICS_CACHE_ENABLED: bool = True
+    ANALYTICS_CACHE_SIZE: int = 1024
+    ANALYTICS_CACHE_TTL_SECONDS: int = 300
+
+    # Admin analytics materialized views (0 disables scheduled refresh)
+    ADMIN_VIEWS_REFRESH_INTERVAL_SECONDS: int = 300
+
+    # Trending keywords (in-memory sketches, snapshotted for restarts)
+    TRENDING_CAPACITY: int = 200
+    TRENDING_CMS_WIDTH: int = 1024
+    TRENDING_CMS_DEPTH: int = 4
+    TRENDING_HLL_PRECISION: int = 10
+    # Each worker writes <stem>.<pid>.json next to it; startup merges them all
+    TRENDING_SNAPSHOT_PATH: str = "data/cache/trending_snapshot.json"
+    TRENDING_SNAPSHOT_INTERVAL_SECONDS: int = 60
+
+    # Chinese segmentation: where jieba caches its prefix dictionary (keep
+    # it on persistent storage so new workers skip the build) and an
+    # optional user dictionary of Weibo slang and entities
+    JIEBA_CACHE_DIR: str = "data/cache"
+    JIEBA_USER_DICT_PATH: Optional[str] = "data/lexicon/weibo_userdict.txt"
+    # Exaggeration pattern lexicons, one <category>.txt per category
+    LEXICON_PATTERNS_DIR: str = "data/lexicon/patterns"
+    # Batch text processing: worker processes (None = one per CPU) and
+    # texts per task
+    TEXT_PROCESS_WORKERS: Optional[int] = None
+    TEXT_PROCESS_CHUNK_SIZE: int = 500
 
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
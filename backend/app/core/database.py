@@ -1,11 +1,13 @@
 """Database connection and session management."""
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
 
 from app.core.config import settings
+from app.core.pool import InstrumentedAsyncPool
 
 
 class Base(DeclarativeBase):
@@ -14,14 +16,27 @@ class Base(DeclarativeBase):
     pass
 
 
+def _engine_options() -> dict:
+    """Pool and driver options shared by the primary and replica engines."""
+    return {
+        "echo": settings.DEBUG,
+        "pool_pre_ping": True,
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "connect_args": {
+            # asyncpg's own statement cache
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            # SQLAlchemy's per-connection prepared statement cache
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    }
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+engine = create_async_engine(settings.DATABASE_URL, **_engine_options())
 
 # Create async session factory
 async_session_maker = async_sessionmaker(
@@ -32,13 +47,67 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Optional read replica for history and analytics reads
+replica_engine = (
+    create_async_engine(settings.REPLICA_DATABASE_URL, **_engine_options())
+    if settings.REPLICA_DATABASE_URL
+    else None
+)
+
+replica_session_maker = (
+    async_sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    if replica_engine is not None
+    else None
+)
+
+
+# Track whether a session has written anything since its last commit, so
+# request-scoped sessions that only read can skip the COMMIT round trip.
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_writes(session: Session, *args) -> None:
+    session.info.pop("has_writes", None)
+
+
+def mark_written(session: AsyncSession) -> None:
+    """Make ``get_db`` commit even if only SELECTs ran (e.g. ``pg_notify``)."""
+    session.info["has_writes"] = True
+
+
+def has_pending_writes(session: AsyncSession) -> bool:
+    """Whether committing the session would change anything."""
+    return bool(
+        session.info.get("has_writes")
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database session."""
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            if has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -46,6 +115,28 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def release_connection(session: AsyncSession) -> None:
+    """
+    Return a session's connection to the pool before a slow non-database wait.
+
+    Ends the current transaction by committing it. Loaded objects stay
+    usable because sessions do not expire on commit; the next statement
+    checks out a connection again.
+    """
+    if session.in_transaction():
+        await session.commit()
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Dependency for handlers that open extra sessions (e.g. concurrent queries)."""
+    return async_session_maker
+
+
+def get_replica_session_maker() -> Optional[async_sessionmaker[AsyncSession]]:
+    """Dependency for the read replica session factory (None if not configured)."""
+    return replica_session_maker
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
@@ -0,0 +1,108 @@
+"""Connection pool instrumentation."""
+
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Checkout latency statistics for one pool."""
+
+    def __init__(self, window: int = 1024):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        # Most recent waits, for percentiles
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def record(self, wait_ms: float, timed_out: bool = False) -> None:
+        """Record one checkout attempt."""
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self._recent.append(wait_ms)
+
+    def percentile(self, q: float) -> float:
+        """Get the ``q`` quantile (0-1) of recent checkout waits in milliseconds."""
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def to_dict(self) -> dict:
+        attempts = self.checkouts + self.timeouts
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_ms / attempts, 3) if attempts else 0.0,
+            "p50_wait_ms": round(self.percentile(0.5), 3),
+            "p95_wait_ms": round(self.percentile(0.95), 3),
+            "p99_wait_ms": round(self.percentile(0.99), 3),
+            "max_wait_ms": round(self.max_wait_ms, 3),
+        }
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that times every checkout.
+
+    The measured time covers waiting for a free connection, opening an
+    overflow connection and the pre-ping, i.e. everything a request waits
+    for before its first statement.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record((time.perf_counter() - start) * 1000, timed_out=True)
+            raise
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.metrics.record(wait_ms)
+        if wait_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS:
+            logger.warning(
+                f"Slow connection checkout: {wait_ms:.1f} ms "
+                f"({self.checkedout()} in use, overflow {max(self.overflow(), 0)})"
+            )
+        return connection
+
+
+def pool_status(engine: Optional[AsyncEngine]) -> Optional[dict]:
+    """
+    Describe an engine's pool occupancy and checkout latency.
+
+    Returns:
+        Dict of pool counters, or None if there is no engine
+    """
+    if engine is None:
+        return None
+    pool = engine.pool
+    status = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool counts overflow from -size until the pool is full
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    if isinstance(pool, InstrumentedAsyncPool):
+        status.update(pool.metrics.to_dict())
+    return status
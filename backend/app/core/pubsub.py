@@ -0,0 +1,86 @@
+"""Cross-worker notifications over PostgreSQL LISTEN/NOTIFY."""
+
+import asyncio
+import contextlib
+import logging
+from typing import Callable, Optional
+
+import asyncpg
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PgListener:
+    """
+    Dedicated connection that LISTENs on channels and dispatches payloads.
+
+    Handlers run on the event loop and must not block. Notifications sent
+    while the connection is down are lost, so after every (re)connect the
+    ``on_connect`` callbacks run to let caches drop anything they might
+    have missed.
+    """
+
+    def __init__(self, dsn: str, retry_seconds: float = 5.0):
+        self.dsn = dsn
+        self.retry_seconds = retry_seconds
+        self._handlers: dict[str, list[Callable[[str], None]]] = {}
+        self._connect_callbacks: list[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, channel: str, handler: Callable[[str], None]) -> None:
+        """Call ``handler(payload)`` for every notification on ``channel``."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_connect(self, callback: Callable[[], None]) -> None:
+        """Call ``callback()`` whenever the listening connection is (re)established."""
+        self._connect_callbacks.append(callback)
+
+    def _dispatch(self, connection, pid, channel: str, payload: str) -> None:
+        for handler in self._handlers.get(channel, []):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception(f"Notification handler for {channel} failed")
+
+    async def _listen_once(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        try:
+            for channel in self._handlers:
+                await connection.add_listener(channel, self._dispatch)
+            for callback in self._connect_callbacks:
+                callback()
+            await closed.wait()
+        finally:
+            with contextlib.suppress(Exception):
+                await connection.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"LISTEN connection lost, retrying: {e}")
+            await asyncio.sleep(self.retry_seconds)
+
+    def start(self) -> None:
+        """Start listening in a background task."""
+        if self._task is None and self._handlers:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+# Process-wide listener; services subscribe at import time
+pg_listener = PgListener(settings.DATABASE_URL.replace("+asyncpg", ""))
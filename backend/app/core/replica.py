@@ -0,0 +1,83 @@
+"""Read replica lag tracking for read-your-writes routing."""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaMonitor:
+    """
+    Decide whether the replica is recent enough to serve a user's reads.
+
+    The replica's last replayed commit time is sampled at most once per
+    ``REPLICA_LAG_CHECK_INTERVAL_SECONDS`` per worker. A user whose last
+    write is newer than that position (minus a slack for the write's own
+    commit) reads from the primary instead.
+    """
+
+    def __init__(self):
+        self._sampled_at = 0.0
+        self._replayed_at: Optional[datetime] = None
+        self._caught_up = False
+
+    async def _sample(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        now = time.monotonic()
+        if now - self._sampled_at < settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS:
+            return
+        self._sampled_at = now
+        try:
+            async with session_maker() as session:
+                result = await session.execute(
+                    select(
+                        func.pg_is_in_recovery(),
+                        func.pg_last_xact_replay_timestamp(),
+                    )
+                )
+                in_recovery, replayed_at = result.one()
+        except Exception as e:
+            logger.warning(f"Replica unavailable, reading from primary: {e}")
+            self._caught_up = False
+            self._replayed_at = None
+            return
+
+        # A server that is not in recovery is not lagging (e.g. a test database)
+        self._caught_up = not in_recovery
+        self._replayed_at = replayed_at
+
+    async def has_replayed(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        last_write: Optional[datetime],
+    ) -> bool:
+        """
+        Check whether the replica has replayed a user's last write.
+
+        Args:
+            session_maker: Replica session factory
+            last_write: When the user's data last changed on the primary
+
+        Returns:
+            True if reads may be served by the replica
+        """
+        await self._sample(session_maker)
+        if self._caught_up:
+            return True
+        if self._replayed_at is None:
+            # Unreachable, or nothing replayed since the replica started
+            return False
+        if last_write is None:
+            return True
+        slack = timedelta(seconds=settings.REPLICA_READ_YOUR_WRITES_SLACK_SECONDS)
+        return self._replayed_at >= last_write + slack
+
+
+# Process-wide monitor shared by all requests
+replica_monitor = ReplicaMonitor()
@@ -0,0 +1,52 @@
+"""In-memory list of revoked token ids."""
+
+import time
+from typing import Iterable, Optional
+
+
+class RevocationList:
+    """
+    Per-worker set of revoked ``jti`` claims.
+
+    Each id is kept until the token it belongs to would have expired
+    anyway, so the set only ever holds tokens revoked within the refresh
+    token lifetime. Lookups are a dict probe with no I/O.
+    """
+
+    def __init__(self):
+        # jti -> token expiry (epoch seconds)
+        self._revoked: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        """Whether the token id has been revoked."""
+        return jti is not None and jti in self._revoked
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """Mark a token id revoked until ``expires_at``."""
+        if expires_at > time.time():
+            self._revoked[jti] = expires_at
+
+    def update(self, entries: Iterable[tuple[str, float]]) -> None:
+        """Mark several ``(jti, expires_at)`` pairs revoked."""
+        for jti, expires_at in entries:
+            self.add(jti, expires_at)
+
+    def prune(self) -> int:
+        """
+        Forget ids whose tokens have expired.
+
+        Returns:
+            Number of ids removed
+        """
+        now = time.time()
+        expired = [jti for jti, expires_at in self._revoked.items() if expires_at <= now]
+        for jti in expired:
+            del self._revoked[jti]
+        return len(expired)
+
+
+# Process-wide revocation list consulted by decode_token
+revoked_tokens = RevocationList()
@@ -1,29 +1,90 @@
 """Security utilities for authentication and password hashing."""
 
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
 import bcrypt
 from jose import JWTError, jwt
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.revocation import revoked_tokens
 
+# Verified token payloads, so repeat requests skip signature verification
+_verified_tokens: TTLCache[dict] = TTLCache(
+    settings.TOKEN_CACHE_SIZE,
+    settings.TOKEN_CACHE_TTL_SECONDS,
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+T = TypeVar("T")
+
+# bcrypt releases the GIL, so hashing threads run in parallel with the loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_MAX_THREADS,
+    thread_name_prefix="bcrypt",
+)
+_pending_hashes = 0
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hashes are already queued."""
+
+
+async def _run_hash(func: Callable[..., T], *args) -> T:
+    """Run a bcrypt call on the hashing pool, shedding load past the queue bound."""
+    global _pending_hashes
+    if _pending_hashes >= settings.BCRYPT_MAX_PENDING:
+        raise PasswordHasherBusy()
+    _pending_hashes += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        _pending_hashes -= 1
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
-    return bcrypt.checkpw(
+    return await _run_hash(
+        bcrypt.checkpw,
         plain_password.encode('utf-8'),
-        hashed_password.encode('utf-8')
+        hashed_password.encode('utf-8'),
     )
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+async def get_password_hash(password: str) -> str:
+    """Hash a password with ``BCRYPT_ROUNDS``."""
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    hashed = await _run_hash(bcrypt.hashpw, password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a hash was made with a work factor other than ``BCRYPT_ROUNDS``."""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+
+_dummy_hash: Optional[str] = None
+
+
+async def verify_dummy_password(password: str) -> bool:
+    """Take as long as a real check, so unknown accounts can't be told apart by timing."""
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = await get_password_hash("dummy-password")
+    await verify_password(password, _dummy_hash)
+    return False
+
+
 def create_access_token(
     subject: str | Any,
     expires_delta: Optional[timedelta] = None,
@@ -40,6 +101,7 @@ def create_access_token(
         "exp": expire,
         "sub": str(subject),
         "type": "access",
+        "jti": uuid.uuid4().hex,
     }
     encoded_jwt = jwt.encode(
         to_encode,
@@ -65,6 +127,7 @@ def create_refresh_token(
         "exp": expire,
         "sub": str(subject),
         "type": "refresh",
+        "jti": uuid.uuid4().hex,
     }
     encoded_jwt = jwt.encode(
         to_encode,
@@ -75,13 +138,32 @@ def create_refresh_token(
 
 
 def decode_token(token: str) -> Optional[dict]:
-    """Decode and validate a JWT token."""
+    """
+    Decode and validate a JWT token.
+
+    Valid payloads are cached for at most ``TOKEN_CACHE_TTL_SECONDS`` and
+    never beyond the token's own expiry. Revoked tokens are rejected,
+    cached or not.
+    """
+    payload = _verified_tokens.get(token)
+    if payload is not None:
+        return None if revoked_tokens.is_revoked(payload.get("jti")) else payload
+
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM],
         )
-        return payload
     except JWTError:
         return None
+
+    if revoked_tokens.is_revoked(payload.get("jti")):
+        return None
+
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        _verified_tokens.set(
+            token, payload, ttl=min(remaining, settings.TOKEN_CACHE_TTL_SECONDS)
+        )
+    return payload
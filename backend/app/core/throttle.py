@@ -0,0 +1,73 @@
+"""Failed-attempt throttling."""
+
+import time
+from typing import Hashable
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class AttemptLimiter:
+    """Allow at most ``limit`` failures per key within a fixed window."""
+
+    def __init__(self, limit: int, window: float, maxsize: int = 100_000):
+        self.limit = limit
+        self.window = window
+        # key -> (failures, window start)
+        self._attempts: TTLCache[tuple[int, float]] = TTLCache(maxsize, window)
+
+    def retry_after(self, key: Hashable) -> float:
+        """Seconds until ``key`` may try again (0 if it may try now)."""
+        entry = self._attempts.get(key)
+        if entry is None or entry[0] < self.limit:
+            return 0.0
+        return max(entry[1] + self.window - time.monotonic(), 0.0)
+
+    def record_failure(self, key: Hashable) -> None:
+        now = time.monotonic()
+        count, started = self._attempts.get(key) or (0, now)
+        self._attempts.set(key, (count + 1, started), ttl=started + self.window - now)
+
+    def reset(self, key: Hashable) -> None:
+        self._attempts.pop(key)
+
+
+class LoginThrottle:
+    """
+    Throttle failed logins per account and IP, and per account overall.
+
+    The account+IP limit stops one client guessing a password; the looser
+    per-account limit caps guesses spread across many IPs. Checks run
+    before any password hashing, so a login storm costs no bcrypt time.
+    Counters are per worker.
+    """
+
+    def __init__(self):
+        self.by_account_ip = AttemptLimiter(
+            settings.LOGIN_MAX_ATTEMPTS,
+            settings.LOGIN_WINDOW_SECONDS,
+        )
+        self.by_account = AttemptLimiter(
+            settings.LOGIN_MAX_ACCOUNT_ATTEMPTS,
+            settings.LOGIN_WINDOW_SECONDS,
+        )
+
+    def retry_after(self, account: str, ip: str) -> float:
+        """Seconds the client must wait before another attempt (0 if allowed)."""
+        account = account.strip().lower()
+        return max(
+            self.by_account_ip.retry_after((account, ip)),
+            self.by_account.retry_after(account),
+        )
+
+    def record_failure(self, account: str, ip: str) -> None:
+        account = account.strip().lower()
+        self.by_account_ip.record_failure((account, ip))
+        self.by_account.record_failure(account)
+
+    def record_success(self, account: str, ip: str) -> None:
+        self.by_account_ip.reset((account.strip().lower(), ip))
+
+
+# Process-wide throttle used by the login route
+login_throttle = LoginThrottle()
@@ -1,16 +1,66 @@
 """FastAPI application entry point."""
 
+import asyncio
+import contextlib
+import logging
 import traceback
 from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Optional
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.api.deps import CurrentSuperuser
 from app.api.v1 import api_router
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import async_session_maker, engine, init_db, replica_engine
+from app.core.pool import pool_status
+from app.core.pubsub import pg_listener
+from app.core.security import PasswordHasherBusy
+from app.services.admin_analytics_service import AdminAnalyticsService
+from app.services.known_rumor_service import known_rumors
+from app.services.token_revocation_service import TokenRevocationService
+from app.services.trending_service import trending_tracker
+from app.utils import text_batch, text_processor
+
+logger = logging.getLogger(__name__)
+
+
+async def snapshot_trending_periodically() -> None:
+    """Persist trending sketches so a restart does not lose the windows."""
+    while True:
+        await asyncio.sleep(settings.TRENDING_SNAPSHOT_INTERVAL_SECONDS)
+        data = trending_tracker.to_dict()
+        await asyncio.to_thread(trending_tracker.save_snapshot, None, data)
+
+
+async def refresh_admin_views_periodically() -> None:
+    """Refresh admin materialized views; only one worker refreshes at a time."""
+    while True:
+        await asyncio.sleep(settings.ADMIN_VIEWS_REFRESH_INTERVAL_SECONDS)
+        try:
+            async with async_session_maker() as session:
+                async with session.begin():
+                    await AdminAnalyticsService(session).refresh_views()
+        except Exception:
+            logger.exception("Admin materialized view refresh failed")
+
+
+async def sync_revoked_tokens_periodically(since: Optional[datetime]) -> None:
+    """Catch up on revocations missed by LISTEN and purge expired ones."""
+    while True:
+        await asyncio.sleep(settings.TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS)
+        try:
+            async with async_session_maker() as session:
+                async with session.begin():
+                    revocations = TokenRevocationService(session)
+                    since = await revocations.sync(since)
+                    await revocations.purge_expired()
+        except Exception:
+            logger.exception("Revoked token sync failed")
 
 
 @asynccontextmanager
@@ -18,8 +68,31 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     await init_db()
+    # Load segmentation dictionaries now rather than on the first request
+    await asyncio.to_thread(text_processor.initialize)
+    if settings.KNOWN_RUMORS_ENABLED:
+        events = await asyncio.to_thread(known_rumors.load)
+        logger.info(f"Known rumor index: {events} labeled events")
+    trending_tracker.load_snapshot()
+    async with async_session_maker() as session:
+        revoked_since = await TokenRevocationService(session).sync()
+    pg_listener.start()
+    tasks = [
+        asyncio.create_task(snapshot_trending_periodically()),
+        asyncio.create_task(sync_revoked_tokens_periodically(revoked_since)),
+    ]
+    if settings.ADMIN_VIEWS_REFRESH_INTERVAL_SECONDS > 0:
+        tasks.append(asyncio.create_task(refresh_admin_views_periodically()))
     yield
     # Shutdown
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await pg_listener.stop()
+    text_batch.shutdown_pool()
+    trending_tracker.save_snapshot()
 
 
 app = FastAPI(
@@ -91,6 +164,16 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """Shed password hashing load instead of queueing without bound."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Global exception handler for debugging
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -115,6 +198,15 @@ async def health_check():
     return {"status": "healthy", "version": settings.APP_VERSION}
 
 
+@app.get("/health/db")
+async def database_health(current_user: CurrentSuperuser):
+    """Connection pool occupancy and checkout latency for this worker (superusers only)."""
+    return {
+        "primary": pool_status(engine),
+        "replica": pool_status(replica_engine),
+    }
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -1,6 +1,29 @@
 """Database models."""
 
 from app.models.user import User
-from app.models.detection import Detection, Analysis, PropagationNode
+from app.models.claim import Claim
+from app.models.detection import Detection, DetectionFingerprint, Analysis, PropagationNode, PropagationStats
+from app.models.analytics import (
+    AnalyticsCacheEntry,
+    DetectionDailyRollup,
+    UserDataVersion,
+    UserTermCount,
+)
+from app.models.admin_views import MaterializedViewRefresh
+from app.models.token import RevokedToken
 
-__all__ = ["User", "Detection", "Analysis", "PropagationNode"]
+__all__ = [
+    "User",
+    "Claim",
+    "Detection",
+    "DetectionFingerprint",
+    "Analysis",
+    "PropagationNode",
+    "PropagationStats",
+    "DetectionDailyRollup",
+    "UserTermCount",
+    "UserDataVersion",
+    "AnalyticsCacheEntry",
+    "MaterializedViewRefresh",
+    "RevokedToken",
+]
@@ -0,0 +1,136 @@
+"""Platform-wide materialized views for admin analytics."""
+
+from datetime import datetime
+
+from sqlalchemy import DDL, DateTime, Float, String, column, event, func, table
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.config import settings
+from app.core.database import Base
+
+# view name -> (defining query, columns of its unique index); {tz} is
+# ANALYTICS_TIMEZONE when the views are created
+MATERIALIZED_VIEWS: dict[str, tuple[str, str]] = {
+    "mv_platform_daily_stats": (
+        """
+        SELECT
+            (timezone('{tz}', d.created_at))::date AS day,
+            count(*) AS total,
+            count(*) FILTER (WHERE d.is_rumor) AS rumors,
+            sum(d.confidence) AS confidence_sum,
+            count(*) FILTER (WHERE d.risk_level = 'low') AS risk_low,
+            count(*) FILTER (WHERE d.risk_level = 'medium') AS risk_medium,
+            count(*) FILTER (WHERE d.risk_level = 'high') AS risk_high,
+            count(*) FILTER (WHERE d.risk_level = 'critical') AS risk_critical,
+            count(DISTINCT d.user_id) AS active_users
+        FROM detections d
+        GROUP BY 1
+        """,
+        "day",
+    ),
+    "mv_category_rumor_rates": (
+        """
+        SELECT
+            coalesce(a.category, 'other') AS category,
+            count(*) AS total,
+            count(*) FILTER (WHERE d.is_rumor) AS rumors
+        FROM detections d
+        LEFT JOIN analyses a ON a.detection_id = d.id
+        GROUP BY 1
+        """,
+        "category",
+    ),
+    "mv_top_risk_indicators": (
+        """
+        SELECT
+            left(btrim(t.value), 200) AS indicator,
+            count(*) AS occurrences,
+            count(*) FILTER (WHERE d.is_rumor) AS rumor_occurrences
+        FROM detections d
+        JOIN analyses a ON a.detection_id = d.id
+        JOIN jsonb_array_elements_text(a.risk_indicators) AS t(value) ON true
+        WHERE jsonb_typeof(a.risk_indicators) = 'array'
+          AND btrim(t.value) <> ''
+        GROUP BY 1
+        """,
+        "indicator",
+    ),
+}
+
+# Lightweight selectables for querying the views
+platform_daily_stats = table(
+    "mv_platform_daily_stats",
+    column("day"),
+    column("total"),
+    column("rumors"),
+    column("confidence_sum"),
+    column("risk_low"),
+    column("risk_medium"),
+    column("risk_high"),
+    column("risk_critical"),
+    column("active_users"),
+)
+category_rumor_rates = table(
+    "mv_category_rumor_rates",
+    column("category"),
+    column("total"),
+    column("rumors"),
+)
+top_risk_indicators = table(
+    "mv_top_risk_indicators",
+    column("indicator"),
+    column("occurrences"),
+    column("rumor_occurrences"),
+)
+
+
+def create_view_statements() -> list[str]:
+    """SQL creating every view with the unique index ``CONCURRENTLY`` needs."""
+    tz = settings.ANALYTICS_TIMEZONE.replace("'", "''")
+    statements = []
+    for name, (query, unique_columns) in MATERIALIZED_VIEWS.items():
+        query = query.replace("{tz}", tz)
+        statements.append(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {name} AS {query}")
+        statements.append(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{name} ON {name} ({unique_columns})"
+        )
+    statements.append(
+        "CREATE INDEX IF NOT EXISTS ix_mv_top_risk_indicators_occurrences "
+        "ON mv_top_risk_indicators (occurrences DESC)"
+    )
+    return statements
+
+
+def drop_view_statements() -> list[str]:
+    return [f"DROP MATERIALIZED VIEW IF EXISTS {name}" for name in MATERIALIZED_VIEWS]
+
+
+class MaterializedViewRefresh(Base):
+    """When each admin materialized view was last refreshed."""
+
+    __tablename__ = "materialized_view_refreshes"
+
+    view_name: Mapped[str] = mapped_column(
+        String(63),
+        primary_key=True,
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    duration_ms: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
+
+    def __repr__(self) -> str:
+        return f"<MaterializedViewRefresh(view_name={self.view_name})>"
+
+
+# Keep metadata.create_all()/drop_all() (init_db, tests) in step with migrations
+for _statement in create_view_statements():
+    event.listen(Base.metadata, "after_create", DDL(_statement))
+for _statement in drop_view_statements():
+    event.listen(Base.metadata, "before_drop", DDL(_statement))
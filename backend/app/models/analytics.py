@@ -0,0 +1,185 @@
+"""Pre-aggregated analytics database models."""
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class DetectionDailyRollup(Base):
+    """Per-user daily detection aggregates maintained on every write."""
+
+    __tablename__ = "detection_daily_rollups"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+    )
+    total: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    rumors: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    confidence_sum: Mapped[Decimal] = mapped_column(
+        Numeric(14, 4),
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    risk_low: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    risk_medium: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    risk_high: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    risk_critical: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    category_counts: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=text("'{}'::jsonb"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DetectionDailyRollup(user_id={self.user_id}, day={self.day})>"
+
+
+class UserTermCount(Base):
+    """Per-user occurrence counts of analysis terms, maintained on every write."""
+
+    __tablename__ = "user_term_counts"
+    __table_args__ = (
+        Index("ix_user_term_counts_user_field_count", "user_id", "field", "count"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    field: Mapped[str] = mapped_column(
+        String(30),
+        primary_key=True,
+    )
+    term: Mapped[str] = mapped_column(
+        String(200),
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<UserTermCount(user_id={self.user_id}, field={self.field}, term={self.term})>"
+
+
+class UserDataVersion(Base):
+    """Per-user watermark bumped whenever the user's detections change."""
+
+    __tablename__ = "user_data_versions"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<UserDataVersion(user_id={self.user_id}, version={self.version})>"
+
+
+class AnalyticsCacheEntry(Base):
+    """Cached analytics response shared by all workers.
+
+    The table is unlogged: entries are disposable, so they skip the WAL and
+    are simply emptied after a crash.
+    """
+
+    __tablename__ = "analytics_cache"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    cache_key: Mapped[str] = mapped_column(
+        Text,
+        primary_key=True,
+    )
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    payload: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AnalyticsCacheEntry(user_id={self.user_id}, cache_key={self.cache_key})>"
@@ -0,0 +1,88 @@
+"""Canonical claim verdict database model."""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, Numeric, String, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class Claim(Base):
+    """
+    One model verdict for a piece of content, shared by all users.
+
+    Keyed by the fingerprint of the normalized content and the model and
+    prompt that produced the verdict, so changing either starts afresh.
+    Detections of the same content reference the claim instead of storing
+    their own copy of the response. Re-verification adds a newer claim for
+    the same key; claims are never changed once written.
+    """
+
+    __tablename__ = "claims"
+    __table_args__ = (
+        # Newest claim for a key
+        Index(
+            "ix_claims_fingerprint_version_verified",
+            "fingerprint",
+            "verdict_version",
+            "verified_at",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    # SHA-256 of the normalized content
+    fingerprint: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    # Model and prompt hash, e.g. "deepseek-chat:3f9a0c1d2e4b"
+    verdict_version: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+    is_rumor: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+    )
+    confidence: Mapped[Decimal] = mapped_column(
+        Numeric(5, 4),
+        nullable=False,
+    )
+    raw_response: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+    # Detections served from this claim without calling the model
+    hit_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    # When the model last produced the verdict
+    verified_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    last_hit_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<Claim(id={self.id}, is_rumor={self.is_rumor})>"
@@ -5,13 +5,14 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text, Boolean
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Index, Numeric, SmallInteger, String, Text, Boolean, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
 if TYPE_CHECKING:
+    from app.models.claim import Claim
     from app.models.user import User
 
 
@@ -19,6 +20,16 @@ class Detection(Base):
     """Detection record model for storing rumor detection results."""
 
     __tablename__ = "detections"
+    __table_args__ = (
+        # Each dataset event is imported at most once per user
+        Index(
+            "ix_detections_user_dataset_event",
+            "user_id",
+            "dataset_event_id",
+            unique=True,
+            postgresql_where=text("dataset_event_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -52,10 +63,34 @@ class Detection(Base):
         Text,
         nullable=True,
     )
+    # Model response; None when the verdict is held by ``claim``
     raw_response: Mapped[Optional[dict]] = mapped_column(
         JSONB,
         nullable=True,
     )
+    claim_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        # The detection's details live on the claim, so it can't go first
+        ForeignKey("claims.id", ondelete="RESTRICT"),
+        nullable=True,
+        index=True,
+    )
+    # Ma-Weibo event this detection was imported from
+    dataset_event_id: Mapped[Optional[str]] = mapped_column(
+        String(32),
+        nullable=True,
+    )
+    # Earlier detection whose verdict was reused for near-duplicate content
+    matched_detection_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("detections.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    # SimHash distance to the matched detection
+    match_distance: Mapped[Optional[int]] = mapped_column(
+        SmallInteger,
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -67,26 +102,102 @@ class Detection(Base):
         "User",
         back_populates="detections",
     )
+    claim: Mapped[Optional["Claim"]] = relationship(
+        "Claim",
+        lazy="joined",
+    )
     analysis: Mapped[Optional["Analysis"]] = relationship(
         "Analysis",
         back_populates="detection",
         uselist=False,
         cascade="all, delete-orphan",
     )
+    # Cascades can hold 100k+ nodes: read them through PropagationService,
+    # and let the foreign key delete them rather than loading each one
     propagation_nodes: Mapped[list["PropagationNode"]] = relationship(
         "PropagationNode",
         back_populates="detection",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
+    @property
+    def verdict(self) -> dict:
+        """The model response behind this detection, wherever it is stored."""
+        if self.raw_response is not None:
+            return self.raw_response
+        return self.claim.raw_response if self.claim is not None else {}
+
     def __repr__(self) -> str:
         return f"<Detection(id={self.id}, is_rumor={self.is_rumor})>"
 
 
+class DetectionFingerprint(Base):
+    """
+    SimHash of a model-verified detection, for near-duplicate lookup.
+
+    ``bands`` holds the fingerprint's LSH band keys; candidates are rows
+    sharing any key, found through the GIN index.
+    """
+
+    __tablename__ = "detection_fingerprints"
+    __table_args__ = (
+        Index(
+            "ix_detection_fingerprints_bands",
+            "bands",
+            postgresql_using="gin",
+        ),
+    )
+
+    detection_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("detections.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Unsigned 64-bit SimHash stored as a signed BIGINT
+    simhash: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    bands: Mapped[list[int]] = mapped_column(
+        ARRAY(BigInteger),
+        nullable=False,
+    )
+    # Model and prompt of the verdict, as on claims; NULL if unknown, and
+    # then never reused
+    verdict_version: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<DetectionFingerprint(detection_id={self.detection_id})>"
+
+
 class Analysis(Base):
     """Analysis result model for detailed rumor analysis."""
 
     __tablename__ = "analyses"
+    __table_args__ = (
+        Index(
+            "ix_analyses_keywords",
+            "keywords",
+            postgresql_using="gin",
+            postgresql_ops={"keywords": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_analyses_fact_check_points",
+            "fact_check_points",
+            postgresql_using="gin",
+            postgresql_ops={"fact_check_points": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_analyses_risk_indicators",
+            "risk_indicators",
+            postgresql_using="gin",
+            postgresql_ops={"risk_indicators": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -120,6 +231,10 @@ class Analysis(Base):
         JSONB,
         nullable=True,
     )
+    risk_indicators: Mapped[Optional[list]] = mapped_column(
+        JSONB,
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -139,6 +254,12 @@ class PropagationNode(Base):
     """Propagation node model for tracking rumor spread paths."""
 
     __tablename__ = "propagation_nodes"
+    __table_args__ = (
+        # Children of a node, for walking subtrees with a recursive CTE
+        Index("ix_propagation_nodes_detection_parent", "detection_id", "parent_id"),
+        # A node by its id, for subtree roots and orphan checks
+        Index("ix_propagation_nodes_detection_node", "detection_id", "node_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -149,7 +270,6 @@ class PropagationNode(Base):
         UUID(as_uuid=True),
         ForeignKey("detections.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     node_id: Mapped[str] = mapped_column(
         String(100),
@@ -188,3 +308,69 @@ class PropagationNode(Base):
 
     def __repr__(self) -> str:
         return f"<PropagationNode(id={self.id}, node_id={self.node_id})>"
+
+
+class PropagationStats(Base):
+    """
+    Cached cascade analytics of a detection's propagation nodes.
+
+    Recomputed when the detection's node count no longer matches
+    ``node_count``.
+    """
+
+    __tablename__ = "propagation_stats"
+
+    detection_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("detections.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    node_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    max_depth: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    max_breadth: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    structural_virality: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+    pattern: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    spread_speed: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        nullable=True,
+    )
+    estimated_reach: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+    influence_score: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+    # Nodes per time window since the source post
+    growth: Mapped[list] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+    half_life_hours: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PropagationStats(detection_id={self.detection_id}, node_count={self.node_count})>"
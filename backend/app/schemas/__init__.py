@@ -5,6 +5,7 @@ from app.schemas.user import (
     UserUpdate,
     UserResponse,
     UserInDB,
+    UserPrincipal,
 )
 from app.schemas.detection import (
     DetectionRequest,
@@ -17,6 +18,8 @@ from app.schemas.detection import (
 from app.schemas.common import (
     Token,
     TokenPayload,
+    RefreshTokenRequest,
+    LogoutRequest,
     Message,
     PaginatedResponse,
 )
@@ -26,6 +29,7 @@ __all__ = [
     "UserUpdate",
     "UserResponse",
     "UserInDB",
+    "UserPrincipal",
     "DetectionRequest",
     "DetectionResponse",
     "BatchDetectionRequest",
@@ -34,6 +38,8 @@ __all__ = [
     "RiskLevel",
     "Token",
     "TokenPayload",
+    "RefreshTokenRequest",
+    "LogoutRequest",
     "Message",
     "PaginatedResponse",
 ]
@@ -0,0 +1,74 @@
+"""Admin analytics schemas."""
+
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.analysis import RiskDistribution
+
+
+class ViewFreshness(BaseModel):
+    """When the materialized view behind a response was last refreshed."""
+
+    refreshed_at: Optional[datetime] = None
+    age_seconds: Optional[float] = None
+
+
+class PlatformDailyStats(BaseModel):
+    """Schema for one day of platform-wide detection counts."""
+
+    day: date
+    total: int
+    rumors: int
+    active_users: int
+
+
+class PlatformOverviewResponse(BaseModel):
+    """Schema for platform-wide detection totals."""
+
+    total_detections: int = 0
+    total_rumors: int = 0
+    rumor_rate: float = Field(0.0, ge=0.0, le=1.0)
+    avg_confidence: float = Field(0.0, ge=0.0, le=1.0)
+    risk: RiskDistribution
+    daily: list[PlatformDailyStats]
+    freshness: ViewFreshness
+
+
+class CategoryRumorRate(BaseModel):
+    """Schema for detections and rumor rate of one category."""
+
+    category: str
+    total: int
+    rumors: int
+    rumor_rate: float = Field(0.0, ge=0.0, le=1.0)
+
+
+class CategoryRumorRatesResponse(BaseModel):
+    """Schema for platform-wide rumor rates by category."""
+
+    data: list[CategoryRumorRate]
+    freshness: ViewFreshness
+
+
+class RiskIndicatorStats(BaseModel):
+    """Schema for how often a risk indicator was reported."""
+
+    indicator: str
+    occurrences: int
+    rumor_occurrences: int
+
+
+class RiskIndicatorsResponse(BaseModel):
+    """Schema for the most frequent risk indicators platform-wide."""
+
+    data: list[RiskIndicatorStats]
+    freshness: ViewFreshness
+
+
+class ViewRefreshResponse(BaseModel):
+    """Schema for the outcome of a materialized view refresh."""
+
+    refreshed: bool
+    views: dict[str, ViewFreshness]
@@ -1,6 +1,7 @@
 """Analysis schemas for dashboard and statistics."""
 
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -16,20 +17,27 @@ class OverviewStats(BaseModel):
     avg_confidence: float = Field(0.0, ge=0.0, le=1.0)
 
 
-class TrendDataPoint(BaseModel):
-    """Schema for trend chart data point."""
+class TrendGranularity(str, Enum):
+    """Bucket size for trend series."""
 
-    date: str
-    rumors: int = 0
-    verified: int = 0
-    total: int = 0
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
 
 
 class TrendResponse(BaseModel):
-    """Schema for trend analysis response."""
+    """Schema for trend analysis response as parallel column arrays.
+
+    ``buckets[i]`` is the local start of bucket ``i`` in ``timezone``;
+    ``total[i]``, ``rumors[i]`` and ``verified[i]`` are its counts.
+    """
 
-    data: list[TrendDataPoint]
     period: str = "daily"
+    timezone: str = "UTC"
+    buckets: list[str] = Field(default_factory=list)
+    total: list[int] = Field(default_factory=list)
+    rumors: list[int] = Field(default_factory=list)
+    verified: list[int] = Field(default_factory=list)
 
 
 class CategoryStats(BaseModel):
@@ -47,6 +55,14 @@ class CategoryResponse(BaseModel):
     total: int
 
 
+class TermField(str, Enum):
+    """Analysis fields whose terms are indexed for statistics and filtering."""
+
+    KEYWORDS = "keywords"
+    FACT_CHECK_POINTS = "fact_check_points"
+    RISK_INDICATORS = "risk_indicators"
+
+
 class KeywordStats(BaseModel):
     """Schema for keyword statistics."""
 
@@ -60,6 +76,17 @@ class KeywordsResponse(BaseModel):
 
     data: list[KeywordStats]
     total_keywords: int
+    field: TermField = TermField.KEYWORDS
+
+
+class TrendingResponse(BaseModel):
+    """Schema for platform-wide trending keywords response."""
+
+    window: str
+    data: list[KeywordStats]
+    distinct_keywords: int = 0
+    distinct_users: int = 0
+    generated_at: datetime
 
 
 class RiskDistribution(BaseModel):
@@ -78,6 +105,16 @@ class RiskDistributionResponse(BaseModel):
     total: int
 
 
+class DashboardResponse(BaseModel):
+    """Schema for all dashboard widgets in one response."""
+
+    overview: OverviewStats
+    trend: TrendResponse
+    category: CategoryResponse
+    keywords: KeywordsResponse
+    risk: RiskDistributionResponse
+
+
 class HistoryFilter(BaseModel):
     """Schema for history filtering options."""
 
@@ -87,6 +124,8 @@ class HistoryFilter(BaseModel):
     risk_level: Optional[str] = None
     category: Optional[str] = None
     keyword: Optional[str] = None
+    fact_check_point: Optional[str] = None
+    risk_indicator: Optional[str] = None
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
 
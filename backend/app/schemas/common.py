@@ -21,6 +21,19 @@ class TokenPayload(BaseModel):
     sub: str
     exp: int
     type: str
+    jti: str
+
+
+class RefreshTokenRequest(BaseModel):
+    """Refresh token request schema."""
+
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """Logout request schema."""
+
+    refresh_token: Optional[str] = None
 
 
 class Message(BaseModel):
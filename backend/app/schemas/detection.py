@@ -92,14 +92,32 @@ class PropagationNode(BaseModel):
     user_info: Optional[dict] = None
     engagement: Optional[dict] = None
     timestamp: Optional[datetime] = None
+    # Levels below the requested node, or below the cascade's root
+    depth: Optional[int] = None
 
 
 class PropagationResponse(BaseModel):
-    """Schema for propagation analysis response."""
+    """
+    Schema for propagation analysis response.
+
+    ``nodes`` is one page of the requested (sub)tree; the statistics
+    describe the whole cascade.
+    """
 
     detection_id: uuid.UUID
     nodes: list[PropagationNode]
+    root_node_id: Optional[str] = None
+    total: int = 0
+    page: int = 1
+    page_size: int = 0
+    total_pages: int = 0
     pattern: Optional[str] = None
     spread_speed: Optional[str] = None
     estimated_reach: Optional[int] = None
     influence_score: Optional[float] = None
+    node_count: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_breadth: Optional[int] = None
+    structural_virality: Optional[float] = None
+    half_life_hours: Optional[float] = None
+    growth: Optional[list[dict]] = None
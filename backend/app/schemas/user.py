@@ -56,6 +56,16 @@ class UserResponse(UserBase):
     model_config = {"from_attributes": True}
 
 
+class UserPrincipal(BaseModel):
+    """Schema for the authenticated user fields needed to authorize requests."""
+
+    id: uuid.UUID
+    is_active: bool
+    is_superuser: bool
+
+    model_config = {"from_attributes": True, "frozen": True}
+
+
 class UserInDB(UserResponse):
     """Schema for user in database (includes hashed password)."""
 
@@ -0,0 +1,254 @@
+"""Admin analytics service backed by materialized views."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.admin_views import (
+    MATERIALIZED_VIEWS,
+    MaterializedViewRefresh,
+    category_rumor_rates,
+    create_view_statements,
+    drop_view_statements,
+    platform_daily_stats,
+    top_risk_indicators,
+)
+from app.schemas.admin import (
+    CategoryRumorRate,
+    CategoryRumorRatesResponse,
+    PlatformDailyStats,
+    PlatformOverviewResponse,
+    RiskIndicatorsResponse,
+    RiskIndicatorStats,
+    ViewFreshness,
+)
+from app.schemas.analysis import RiskDistribution
+
+# pg_advisory lock id ensuring a single refresher across workers
+REFRESH_LOCK_ID = 0x524C5631
+
+
+class AdminAnalyticsService:
+    """Service for platform-wide analytics.
+
+    Queries read the ``mv_*`` materialized views rather than scanning every
+    user's detections. The views are rebuilt with ``REFRESH MATERIALIZED
+    VIEW CONCURRENTLY`` so reads never block, and every response reports
+    how old its view is.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_freshness(self, view_name: str) -> ViewFreshness:
+        """Get when a view was last refreshed."""
+        result = await self.db.execute(
+            select(MaterializedViewRefresh.refreshed_at).where(
+                MaterializedViewRefresh.view_name == view_name
+            )
+        )
+        return self._freshness(result.scalar_one_or_none())
+
+    @staticmethod
+    def _freshness(refreshed_at: Optional[datetime]) -> ViewFreshness:
+        if refreshed_at is None:
+            return ViewFreshness()
+        age = datetime.now(timezone.utc) - refreshed_at
+        return ViewFreshness(
+            refreshed_at=refreshed_at,
+            age_seconds=max(age.total_seconds(), 0.0),
+        )
+
+    async def get_platform_overview(self, days: int = 30) -> PlatformOverviewResponse:
+        """Get all-time platform totals and the daily series for recent days."""
+        stats = platform_daily_stats.c
+        totals_result = await self.db.execute(
+            select(
+                func.coalesce(func.sum(stats.total), 0).label("total"),
+                func.coalesce(func.sum(stats.rumors), 0).label("rumors"),
+                func.sum(stats.confidence_sum).label("confidence_sum"),
+                func.coalesce(func.sum(stats.risk_low), 0).label("low"),
+                func.coalesce(func.sum(stats.risk_medium), 0).label("medium"),
+                func.coalesce(func.sum(stats.risk_high), 0).label("high"),
+                func.coalesce(func.sum(stats.risk_critical), 0).label("critical"),
+            )
+        )
+        totals = totals_result.one()
+
+        start = (
+            datetime.now(ZoneInfo(settings.ANALYTICS_TIMEZONE)) - timedelta(days=days)
+        ).date()
+        daily_result = await self.db.execute(
+            select(stats.day, stats.total, stats.rumors, stats.active_users)
+            .where(stats.day >= start)
+            .order_by(stats.day)
+        )
+
+        total = int(totals.total)
+        rumors = int(totals.rumors)
+        return PlatformOverviewResponse(
+            total_detections=total,
+            total_rumors=rumors,
+            rumor_rate=rumors / total if total > 0 else 0.0,
+            avg_confidence=(
+                float(totals.confidence_sum) / total
+                if total > 0 and totals.confidence_sum is not None
+                else 0.5
+            ),
+            risk=RiskDistribution(
+                low=int(totals.low),
+                medium=int(totals.medium),
+                high=int(totals.high),
+                critical=int(totals.critical),
+            ),
+            daily=[
+                PlatformDailyStats(
+                    day=row.day,
+                    total=row.total,
+                    rumors=row.rumors,
+                    active_users=row.active_users,
+                )
+                for row in daily_result.all()
+            ],
+            freshness=await self.get_freshness(platform_daily_stats.name),
+        )
+
+    async def get_category_rumor_rates(self) -> CategoryRumorRatesResponse:
+        """Get detections and rumor rate per category, largest first."""
+        rates = category_rumor_rates.c
+        result = await self.db.execute(
+            select(rates.category, rates.total, rates.rumors).order_by(
+                rates.total.desc(), rates.category
+            )
+        )
+
+        return CategoryRumorRatesResponse(
+            data=[
+                CategoryRumorRate(
+                    category=row.category,
+                    total=row.total,
+                    rumors=row.rumors,
+                    rumor_rate=row.rumors / row.total if row.total else 0.0,
+                )
+                for row in result.all()
+            ],
+            freshness=await self.get_freshness(category_rumor_rates.name),
+        )
+
+    async def get_top_risk_indicators(self, limit: int = 20) -> RiskIndicatorsResponse:
+        """Get the most frequently reported risk indicators."""
+        indicators = top_risk_indicators.c
+        result = await self.db.execute(
+            select(
+                indicators.indicator,
+                indicators.occurrences,
+                indicators.rumor_occurrences,
+            )
+            .order_by(indicators.occurrences.desc(), indicators.indicator)
+            .limit(limit)
+        )
+
+        return RiskIndicatorsResponse(
+            data=[
+                RiskIndicatorStats(
+                    indicator=row.indicator,
+                    occurrences=row.occurrences,
+                    rumor_occurrences=row.rumor_occurrences,
+                )
+                for row in result.all()
+            ],
+            freshness=await self.get_freshness(top_risk_indicators.name),
+        )
+
+    async def get_all_freshness(self) -> dict[str, ViewFreshness]:
+        """Get the refresh time of every view."""
+        result = await self.db.execute(
+            select(
+                MaterializedViewRefresh.view_name,
+                MaterializedViewRefresh.refreshed_at,
+            )
+        )
+        refreshed = dict(result.all())
+        return {name: self._freshness(refreshed.get(name)) for name in MATERIALIZED_VIEWS}
+
+    async def refresh_views(self, force: bool = False) -> bool:
+        """
+        Refresh every admin view concurrently in the current transaction.
+
+        A transaction-scoped advisory lock makes concurrent callers (one
+        scheduler per worker) skip instead of queueing, and unless
+        ``force`` is set, views refreshed within the last interval are left
+        alone.
+
+        Args:
+            force: Refresh even if the views are still fresh
+
+        Returns:
+            True if the views were refreshed
+        """
+        locked = await self.db.scalar(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_ID))
+        )
+        if not locked:
+            return False
+
+        if not force:
+            freshness = await self.get_all_freshness()
+            interval = settings.ADMIN_VIEWS_REFRESH_INTERVAL_SECONDS
+            if all(
+                f.age_seconds is not None and f.age_seconds < interval * 0.9
+                for f in freshness.values()
+            ):
+                return False
+
+        for name in MATERIALIZED_VIEWS:
+            start = time.perf_counter()
+            await self.db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+            await self._record_refresh(name, (time.perf_counter() - start) * 1000)
+        return True
+
+    async def recreate_views(self) -> bool:
+        """
+        Drop and recreate every admin view in the current transaction.
+
+        Needed after changing ``ANALYTICS_TIMEZONE``, which the daily view
+        buckets by when it is created. Readers block until the transaction
+        commits.
+
+        Returns:
+            True if the views were recreated, False if a refresh is running
+        """
+        locked = await self.db.scalar(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_ID))
+        )
+        if not locked:
+            return False
+
+        start = time.perf_counter()
+        for statement in drop_view_statements() + create_view_statements():
+            await self.db.execute(text(statement))
+        duration_ms = (time.perf_counter() - start) * 1000
+        for name in MATERIALIZED_VIEWS:
+            await self._record_refresh(name, duration_ms)
+        return True
+
+    async def _record_refresh(self, name: str, duration_ms: float) -> None:
+        stmt = insert(MaterializedViewRefresh).values(
+            view_name=name,
+            refreshed_at=func.now(),
+            duration_ms=duration_ms,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MaterializedViewRefresh.view_name],
+            set_={
+                "refreshed_at": stmt.excluded.refreshed_at,
+                "duration_ms": stmt.excluded.duration_ms,
+            },
+        )
+        await self.db.execute(stmt)
@@ -1,51 +1,91 @@
 """Analysis service for dashboard and statistics."""
 
+import asyncio
+import time
 import uuid
-from collections import Counter
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Optional
+from zoneinfo import ZoneInfo
 
-from sqlalchemy import Integer, and_, case, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import DateTime, Integer, and_, case, cast, func, literal, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.models.detection import Analysis, Detection
+from app.core.config import settings
+from app.models.analytics import DetectionDailyRollup
+from app.models.detection import Detection
 from app.schemas.analysis import (
     CategoryResponse,
     CategoryStats,
+    DashboardResponse,
     KeywordsResponse,
     KeywordStats,
     OverviewStats,
     RiskDistribution,
     RiskDistributionResponse,
-    TrendDataPoint,
+    TermField,
+    TrendGranularity,
     TrendResponse,
 )
+from app.services.term_index_service import TermIndexService
+
+
+# granularity -> (series step, period name, bucket label format)
+TREND_STEPS: dict[TrendGranularity, tuple[timedelta, str, str]] = {
+    TrendGranularity.HOUR: (timedelta(hours=1), "hourly", 'YYYY-MM-DD"T"HH24:00'),
+    TrendGranularity.DAY: (timedelta(days=1), "daily", "YYYY-MM-DD"),
+    TrendGranularity.WEEK: (timedelta(weeks=1), "weekly", "YYYY-MM-DD"),
+}
+
+
+def _truncate(value: datetime, granularity: TrendGranularity) -> datetime:
+    """Truncate a naive local time like PostgreSQL ``date_trunc``."""
+    if granularity == TrendGranularity.HOUR:
+        return value.replace(minute=0, second=0, microsecond=0)
+    day = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == TrendGranularity.WEEK:
+        day -= timedelta(days=day.weekday())
+    return day
+
+
+def trend_as_of(granularity: TrendGranularity, tz: Optional[str] = None) -> str:
+    """Start of the newest trend bucket; a trend series changes when it rolls over."""
+    now_local = datetime.now(ZoneInfo(tz or settings.ANALYTICS_TIMEZONE))
+    return _truncate(now_local.replace(tzinfo=None), granularity).isoformat()
 
 
 class AnalysisService:
-    """Service for analytics and statistics."""
+    """Service for analytics and statistics.
+
+    Overview, trend, category and risk figures are read from the per-day
+    ``detection_daily_rollups`` table, so their cost grows with the number of
+    active days rather than the number of detections. Term statistics come
+    from the normalized ``user_term_counts`` table.
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_overview_stats(
-        self,
-        user_id: uuid.UUID,
-    ) -> OverviewStats:
-        """Get overview statistics for dashboard."""
-        # Total detections
-        total_query = select(func.count()).select_from(Detection).where(
-            Detection.user_id == user_id
-        )
-        total_result = await self.db.execute(total_query)
-        total = total_result.scalar() or 0
+    async def _get_rollup_totals(self, user_id: uuid.UUID):
+        """Sum all rollup counters for a user in a single query."""
+        rollup = DetectionDailyRollup
+        query = select(
+            func.coalesce(func.sum(rollup.total), 0).label("total"),
+            func.coalesce(func.sum(rollup.rumors), 0).label("rumors"),
+            func.sum(rollup.confidence_sum).label("confidence_sum"),
+            func.coalesce(func.sum(rollup.risk_low), 0).label("low"),
+            func.coalesce(func.sum(rollup.risk_medium), 0).label("medium"),
+            func.coalesce(func.sum(rollup.risk_high), 0).label("high"),
+            func.coalesce(func.sum(rollup.risk_critical), 0).label("critical"),
+        ).where(rollup.user_id == user_id)
 
-        # Rumors count
-        rumors_query = select(func.count()).select_from(Detection).where(
-            and_(Detection.user_id == user_id, Detection.is_rumor == True)
-        )
-        rumors_result = await self.db.execute(rumors_query)
-        rumors = rumors_result.scalar() or 0
+        result = await self.db.execute(query)
+        return result.one()
+
+    @staticmethod
+    def _build_overview(row) -> OverviewStats:
+        total = int(row.total)
+        rumors = int(row.rumors)
 
         # Verified (non-rumors) count
         verified = total - rumors
@@ -54,11 +94,11 @@ class AnalysisService:
         rumor_rate = rumors / total if total > 0 else 0.0
 
         # Average confidence
-        avg_query = select(func.avg(Detection.confidence)).where(
-            Detection.user_id == user_id
+        avg_confidence = (
+            float(row.confidence_sum) / total
+            if total > 0 and row.confidence_sum is not None
+            else 0.5
         )
-        avg_result = await self.db.execute(avg_query)
-        avg_confidence = float(avg_result.scalar() or 0.5)
 
         return OverviewStats(
             total_detections=total,
@@ -68,78 +108,157 @@ class AnalysisService:
             avg_confidence=avg_confidence,
         )
 
+    @staticmethod
+    def _build_risk_distribution(row) -> RiskDistributionResponse:
+        distribution = RiskDistribution(
+            low=int(row.low),
+            medium=int(row.medium),
+            high=int(row.high),
+            critical=int(row.critical),
+        )
+
+        return RiskDistributionResponse(
+            distribution=distribution,
+            total=int(row.total),
+        )
+
+    async def get_overview_stats(
+        self,
+        user_id: uuid.UUID,
+    ) -> OverviewStats:
+        """Get overview statistics for dashboard."""
+        return self._build_overview(await self._get_rollup_totals(user_id))
+
+    async def get_summary(
+        self,
+        user_id: uuid.UUID,
+    ) -> tuple[OverviewStats, RiskDistributionResponse]:
+        """Get overview and risk distribution from one rollup query."""
+        row = await self._get_rollup_totals(user_id)
+        return self._build_overview(row), self._build_risk_distribution(row)
+
     async def get_trend_data(
         self,
         user_id: uuid.UUID,
         days: int = 30,
+        granularity: TrendGranularity = TrendGranularity.DAY,
+        tz: Optional[str] = None,
     ) -> TrendResponse:
-        """Get trend data for the specified number of days."""
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=days)
+        """
+        Get trend data for the specified number of days.
+
+        Buckets are generated with ``generate_series`` in local time and
+        left-joined to the counts, so gaps are zero-filled and the columns
+        are aggregated into arrays by the database. Daily and weekly series
+        in ``ANALYTICS_TIMEZONE`` read the rollups; hourly series and other
+        timezones bucket the user's detections in range.
+
+        Args:
+            user_id: The user whose detections are counted
+            days: How far back the series starts
+            granularity: Bucket size
+            tz: IANA timezone for bucket boundaries (defaults to ``ANALYTICS_TIMEZONE``)
+        """
+        tz_name = tz or settings.ANALYTICS_TIMEZONE
+        step, period, label_format = TREND_STEPS[granularity]
+        unit = literal(granularity.value)
+
+        now_local = datetime.now(ZoneInfo(tz_name)).replace(tzinfo=None)
+        first = _truncate(now_local - timedelta(days=days), granularity)
+        last = _truncate(now_local, granularity)
+
+        series = (
+            func.generate_series(first, last, step)
+            .table_valued("bucket")
+            .render_derived(name="series")
+        )
 
-        # Query detections grouped by date
-        query = (
-            select(
-                func.date(Detection.created_at).label("date"),
-                func.count().label("total"),
-                func.sum(case((Detection.is_rumor == True, 1), else_=0)).label(
-                    "rumors"
-                ),
-            )
-            .where(
-                and_(
-                    Detection.user_id == user_id,
-                    Detection.created_at >= start_date,
-                    Detection.created_at <= end_date,
+        if granularity != TrendGranularity.HOUR and tz_name == settings.ANALYTICS_TIMEZONE:
+            rollup = DetectionDailyRollup
+            bucket = func.date_trunc(unit, cast(rollup.day, DateTime))
+            counts = (
+                select(
+                    bucket.label("bucket"),
+                    func.sum(rollup.total).label("total"),
+                    func.sum(rollup.rumors).label("rumors"),
                 )
+                .where(
+                    and_(
+                        rollup.user_id == user_id,
+                        rollup.day >= first.date(),
+                        rollup.day <= now_local.date(),
+                    )
+                )
+                .group_by(bucket)
+                .subquery()
             )
-            .group_by(func.date(Detection.created_at))
-            .order_by(func.date(Detection.created_at))
-        )
-
-        result = await self.db.execute(query)
-        rows = result.all()
-
-        # Build trend data points
-        data_map = {
-            str(row.date): TrendDataPoint(
-                date=str(row.date),
-                total=row.total or 0,
-                rumors=row.rumors or 0,
-                verified=(row.total or 0) - (row.rumors or 0),
+        else:
+            bucket = func.date_trunc(
+                unit, func.timezone(literal(tz_name), Detection.created_at)
             )
-            for row in rows
-        }
-
-        # Fill in missing dates
-        data = []
-        current = start_date
-        while current <= end_date:
-            date_str = current.strftime("%Y-%m-%d")
-            if date_str in data_map:
-                data.append(data_map[date_str])
-            else:
-                data.append(
-                    TrendDataPoint(date=date_str, total=0, rumors=0, verified=0)
+            counts = (
+                select(
+                    bucket.label("bucket"),
+                    func.count().label("total"),
+                    func.sum(case((Detection.is_rumor == True, 1), else_=0)).label(
+                        "rumors"
+                    ),
+                )
+                .where(
+                    and_(
+                        Detection.user_id == user_id,
+                        Detection.created_at >= first.replace(tzinfo=ZoneInfo(tz_name)),
+                    )
                 )
-            current += timedelta(days=1)
+                .group_by(bucket)
+                .subquery()
+            )
 
-        return TrendResponse(data=data, period="daily")
+        order = series.c.bucket
+        total = func.coalesce(counts.c.total, 0)
+        rumors = func.coalesce(counts.c.rumors, 0)
+        query = select(
+            func.array_agg(
+                aggregate_order_by(func.to_char(series.c.bucket, label_format), order)
+            ).label("buckets"),
+            func.array_agg(aggregate_order_by(total, order)).label("total"),
+            func.array_agg(aggregate_order_by(rumors, order)).label("rumors"),
+            func.array_agg(aggregate_order_by(total - rumors, order)).label("verified"),
+        ).select_from(series.outerjoin(counts, counts.c.bucket == series.c.bucket))
+
+        result = await self.db.execute(query)
+        row = result.one()
+
+        return TrendResponse(
+            period=period,
+            timezone=tz_name,
+            buckets=row.buckets or [],
+            total=row.total or [],
+            rumors=row.rumors or [],
+            verified=row.verified or [],
+        )
 
     async def get_category_stats(
         self,
         user_id: uuid.UUID,
     ) -> CategoryResponse:
         """Get category distribution statistics."""
+        counts = func.jsonb_each_text(
+            DetectionDailyRollup.category_counts
+        ).table_valued("key", "value").render_derived()
+        count = func.sum(counts.c.value.cast(Integer))
+
         query = (
             select(
-                Analysis.category,
-                func.count().label("count"),
+                counts.c.key.label("category"),
+                count.label("count"),
             )
-            .join(Detection, Detection.id == Analysis.detection_id)
-            .where(Detection.user_id == user_id)
-            .group_by(Analysis.category)
-            .order_by(func.count().desc())
+            .select_from(DetectionDailyRollup)
+            .join(counts, true())
+            .where(DetectionDailyRollup.user_id == user_id)
+            .group_by(counts.c.key)
+            .having(count > 0)
+            .order_by(count.desc())
         )
 
         result = await self.db.execute(query)
@@ -162,25 +281,12 @@ class AnalysisService:
         self,
         user_id: uuid.UUID,
         limit: int = 50,
+        field: TermField = TermField.KEYWORDS,
     ) -> KeywordsResponse:
         """Get keyword frequency statistics for word cloud."""
-        query = (
-            select(Analysis.keywords)
-            .join(Detection, Detection.id == Analysis.detection_id)
-            .where(Detection.user_id == user_id)
+        top_keywords, total_keywords = await TermIndexService(self.db).get_top_terms(
+            user_id, field, limit
         )
-
-        result = await self.db.execute(query)
-        rows = result.all()
-
-        # Count keyword frequencies
-        keyword_counter: Counter = Counter()
-        for row in rows:
-            if row.keywords:
-                keyword_counter.update(row.keywords)
-
-        # Get top keywords
-        top_keywords = keyword_counter.most_common(limit)
         max_count = top_keywords[0][1] if top_keywords else 1
 
         data = [
@@ -194,7 +300,8 @@ class AnalysisService:
 
         return KeywordsResponse(
             data=data,
-            total_keywords=len(keyword_counter),
+            total_keywords=total_keywords,
+            field=field,
         )
 
     async def get_risk_distribution(
@@ -202,34 +309,58 @@ class AnalysisService:
         user_id: uuid.UUID,
     ) -> RiskDistributionResponse:
         """Get risk level distribution statistics."""
-        query = (
-            select(
-                Detection.risk_level,
-                func.count().label("count"),
-            )
-            .where(Detection.user_id == user_id)
-            .group_by(Detection.risk_level)
-        )
-
-        result = await self.db.execute(query)
-        rows = result.all()
+        return self._build_risk_distribution(await self._get_rollup_totals(user_id))
 
-        distribution = RiskDistribution()
-        total = 0
-
-        for row in rows:
-            count = row.count or 0
-            total += count
-            if row.risk_level == "low":
-                distribution.low = count
-            elif row.risk_level == "medium":
-                distribution.medium = count
-            elif row.risk_level == "high":
-                distribution.high = count
-            elif row.risk_level == "critical":
-                distribution.critical = count
-
-        return RiskDistributionResponse(
-            distribution=distribution,
-            total=total,
+    async def get_dashboard(
+        self,
+        user_id: uuid.UUID,
+        days: int = 30,
+        keyword_limit: int = 50,
+        session_maker: Optional[async_sessionmaker[AsyncSession]] = None,
+    ) -> tuple[DashboardResponse, dict[str, float]]:
+        """
+        Get every dashboard widget in one call.
+
+        Overview and risk share a single rollup query, so the dashboard
+        costs four statements. When ``session_maker`` is given, each one
+        runs concurrently on its own pooled connection; otherwise they run
+        in sequence on this service's session.
+
+        Returns:
+            Tuple of (dashboard response, per-widget durations in milliseconds)
+        """
+        timings: dict[str, float] = {}
+
+        async def run(name: str, compute):
+            start = time.perf_counter()
+            if session_maker is None:
+                value = await compute(self)
+            else:
+                async with session_maker() as session:
+                    value = await compute(AnalysisService(session))
+            timings[name] = (time.perf_counter() - start) * 1000
+            return value
+
+        widgets = [
+            run("summary", lambda service: service.get_summary(user_id)),
+            run("trend", lambda service: service.get_trend_data(user_id, days)),
+            run("category", lambda service: service.get_category_stats(user_id)),
+            run(
+                "keywords",
+                lambda service: service.get_keywords_stats(user_id, keyword_limit),
+            ),
+        ]
+        if session_maker is None:
+            results = [await widget for widget in widgets]
+        else:
+            results = await asyncio.gather(*widgets)
+        (overview, risk), trend, category, keywords = results
+
+        dashboard = DashboardResponse(
+            overview=overview,
+            trend=trend,
+            category=category,
+            keywords=keywords,
+            risk=risk,
         )
+        return dashboard, timings
@@ -0,0 +1,158 @@
+"""Versioned cache for analytics responses."""
+
+import hashlib
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.analytics import AnalyticsCacheEntry, UserDataVersion
+
+# Per-worker copy of recently served payloads, keyed by (user, key, version)
+_local_cache: TTLCache[dict] = TTLCache(
+    settings.ANALYTICS_CACHE_SIZE,
+    settings.ANALYTICS_CACHE_TTL_SECONDS,
+)
+
+
+def make_etag(user_id: uuid.UUID, key: str, version: int) -> str:
+    """Build the ETag for a cached response."""
+    digest = hashlib.sha1(f"{user_id}:{key}:{version}".encode("utf-8")).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against an ETag."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+class AnalyticsCacheService:
+    """
+    Service for the per-user data version and the analytics response cache.
+
+    Every detection insert or delete bumps the user's version in the same
+    transaction, so a cached payload is valid exactly when it was computed
+    at the current version. Entries live in the unlogged ``analytics_cache``
+    table, shared by all workers, with a small per-worker LRU in front.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_version(self, user_id: uuid.UUID) -> int:
+        """Get the user's current data version (0 before any write)."""
+        version, _ = await self.get_watermark(user_id)
+        return version
+
+    async def get_watermark(
+        self,
+        user_id: uuid.UUID,
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Get the user's data version and when it last changed.
+
+        Returns:
+            Tuple of (version, last write time or None before any write)
+        """
+        result = await self.db.execute(
+            select(UserDataVersion.version, UserDataVersion.updated_at).where(
+                UserDataVersion.user_id == user_id
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return 0, None
+        return row.version, row.updated_at
+
+    async def bump_version(self, user_id: uuid.UUID) -> None:
+        """Advance the user's data version and drop their shared entries."""
+        # clock_timestamp() rather than now(): the transaction may have
+        # started long before, while waiting on the model
+        stmt = insert(UserDataVersion).values(
+            user_id=user_id,
+            version=1,
+            updated_at=func.clock_timestamp(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserDataVersion.user_id],
+            set_={
+                "version": UserDataVersion.version + 1,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.execute(
+            delete(AnalyticsCacheEntry).where(AnalyticsCacheEntry.user_id == user_id)
+        )
+
+    async def get(
+        self,
+        user_id: uuid.UUID,
+        key: str,
+        version: int,
+    ) -> Optional[dict]:
+        """
+        Get a cached payload computed at ``version``.
+
+        Args:
+            user_id: Owner of the cached data
+            key: Endpoint and parameters identifying the response
+            version: The user's current data version
+
+        Returns:
+            The JSON payload, or None on a miss
+        """
+        payload = _local_cache.get((user_id, key, version))
+        if payload is not None:
+            return payload
+
+        result = await self.db.execute(
+            select(AnalyticsCacheEntry.payload).where(
+                AnalyticsCacheEntry.user_id == user_id,
+                AnalyticsCacheEntry.cache_key == key,
+                AnalyticsCacheEntry.version == version,
+            )
+        )
+        payload = result.scalar_one_or_none()
+        if payload is not None:
+            _local_cache.set((user_id, key, version), payload)
+        return payload
+
+    async def set(
+        self,
+        user_id: uuid.UUID,
+        key: str,
+        version: int,
+        payload: dict,
+    ) -> None:
+        """Store a payload computed at ``version``, never replacing a newer one."""
+        _local_cache.set((user_id, key, version), payload)
+
+        stmt = insert(AnalyticsCacheEntry).values(
+            user_id=user_id,
+            cache_key=key,
+            version=version,
+            payload=payload,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AnalyticsCacheEntry.user_id, AnalyticsCacheEntry.cache_key],
+            set_={
+                "version": stmt.excluded.version,
+                "payload": stmt.excluded.payload,
+                "created_at": func.now(),
+            },
+            where=AnalyticsCacheEntry.version < stmt.excluded.version,
+        )
+        await self.db.execute(stmt)
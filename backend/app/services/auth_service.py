@@ -6,9 +6,15 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    get_password_hash,
+    password_needs_rehash,
+    verify_dummy_password,
+    verify_password,
+)
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.principal_service import PrincipalService
 
 
 class AuthService:
@@ -16,6 +22,7 @@ class AuthService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.principals = PrincipalService(db)
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
@@ -43,7 +50,7 @@ class AuthService:
         user = User(
             email=user_data.email,
             username=user_data.username,
-            hashed_password=get_password_hash(user_data.password),
+            hashed_password=await get_password_hash(user_data.password),
         )
         self.db.add(user)
         await self.db.flush()
@@ -60,6 +67,7 @@ class AuthService:
         for field, value in update_data.items():
             setattr(user, field, value)
         await self.db.flush()
+        await self.principals.invalidate(user.id)
         await self.db.refresh(user)
         return user
 
@@ -69,8 +77,21 @@ class AuthService:
         new_password: str,
     ) -> User:
         """Update user password."""
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await get_password_hash(new_password)
         await self.db.flush()
+        await self.principals.invalidate(user.id)
+        await self.db.refresh(user)
+        return user
+
+    async def set_active(
+        self,
+        user: User,
+        is_active: bool,
+    ) -> User:
+        """Activate or deactivate a user; takes effect on every worker at commit."""
+        user.is_active = is_active
+        await self.db.flush()
+        await self.principals.invalidate(user.id)
         await self.db.refresh(user)
         return user
 
@@ -82,9 +103,15 @@ class AuthService:
         """Authenticate user with email and password."""
         user = await self.get_user_by_email(email)
         if not user:
+            await verify_dummy_password(password)
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password(password, user.hashed_password):
             return None
+
+        # Upgrade hashes made with an old work factor
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = await get_password_hash(password)
+            await self.db.flush()
         return user
 
     async def is_email_taken(self, email: str) -> bool:
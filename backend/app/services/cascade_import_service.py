@@ -0,0 +1,192 @@
+"""Bulk import of labeled Ma-Weibo events and their repost cascades."""
+
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, NamedTuple, Optional
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.detection import Detection
+from app.schemas.detection import RiskLevel
+from app.services.analytics_cache_service import AnalyticsCacheService
+from app.services.known_rumor_service import KnownRumorMatch, known_rumor_result
+from app.services.rollup_service import RollupService
+
+# propagation_nodes columns in the order of the rows built by read_event_cascade
+NODE_COLUMNS = (
+    "id",
+    "detection_id",
+    "node_id",
+    "parent_id",
+    "content",
+    "user_info",
+    "engagement",
+    "timestamp",
+    "created_at",
+)
+
+
+class ImportedEvent(NamedTuple):
+    """A dataset event parsed into a detection result and COPY-ready node rows."""
+
+    event_id: str
+    detection_id: uuid.UUID
+    content: str
+    result: dict
+    nodes: list[tuple]
+
+
+def read_event_labels(path: str) -> dict[str, int]:
+    """Read the ``eid:<id>\\tlabel:<0|1>`` lines of the dataset's Weibo.txt."""
+    labels = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.strip().split("\t")
+            if len(parts) >= 2:
+                labels[parts[0].replace("eid:", "")] = int(parts[1].replace("label:", ""))
+    return labels
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromtimestamp(int(value), timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _json(value: dict) -> str:
+    # asyncpg's COPY takes jsonb as text
+    return json.dumps(value, ensure_ascii=False)
+
+
+def read_event_cascade(task: tuple[str, int, str, uuid.UUID]) -> Optional[ImportedEvent]:
+    """
+    Parse one event file into its detection and propagation node rows.
+
+    Meant to run in worker processes; the first post is the source post and
+    the rest are reposts, linked through ``parent``.
+
+    Args:
+        task: Tuple of (event id, label, JSON path, detection id to assign)
+
+    Returns:
+        The parsed event, or None if the file is missing, malformed or empty
+    """
+    event_id, label, path, detection_id = task
+    try:
+        with open(path, "rb") as f:
+            posts = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not posts:
+        return None
+
+    content = str(posts[0].get("text") or "")
+    result = known_rumor_result(KnownRumorMatch(event_id, label == 1, 0), content)
+    now = datetime.now(timezone.utc)
+    nodes = []
+    for index, post in enumerate(posts):
+        nodes.append((
+            uuid.uuid4(),
+            detection_id,
+            str(post.get("mid") or post.get("id") or index)[:100],
+            str(post["parent"])[:100] if post.get("parent") else None,
+            post.get("text"),
+            _json({
+                "uid": post.get("uid"),
+                "username": post.get("username"),
+                "screen_name": post.get("screen_name"),
+                "verified": post.get("verified", False),
+                "followers_count": post.get("followers_count", 0),
+            }),
+            _json({
+                "reposts": post.get("reposts_count", 0),
+                "comments": post.get("comments_count", 0),
+                "attitudes": post.get("attitudes_count", 0),
+            }),
+            _timestamp(post.get("t")),
+            now,
+        ))
+    return ImportedEvent(event_id, detection_id, content, result, nodes)
+
+
+class CascadeImportService:
+    """
+    Service writing dataset events as detections with their cascades.
+
+    Node rows go through asyncpg's binary ``COPY`` on the session's own
+    connection, so a detection and its cascade commit together.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def imported_event_ids(self, user_id: uuid.UUID) -> set[str]:
+        """Dataset events already imported for a user."""
+        result = await self.db.execute(
+            select(Detection.dataset_event_id).where(
+                Detection.user_id == user_id,
+                Detection.dataset_event_id.is_not(None),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def import_event(self, user_id: uuid.UUID, event: ImportedEvent) -> int:
+        """
+        Insert an event's detection and COPY its cascade into propagation_nodes.
+
+        Runs in the caller's transaction.
+
+        Returns:
+            Number of nodes copied
+        """
+        result = event.result
+        self.db.add(Detection(
+            id=event.detection_id,
+            user_id=user_id,
+            content=event.content,
+            is_rumor=result["is_rumor"],
+            confidence=result["confidence"],
+            risk_level=RiskLevel.from_confidence(result["confidence"], result["is_rumor"]).value,
+            explanation=result["explanation"],
+            raw_response=result,
+            dataset_event_id=event.event_id,
+        ))
+        await self.db.flush()
+
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "propagation_nodes",
+            records=event.nodes,
+            columns=NODE_COLUMNS,
+        )
+        return len(event.nodes)
+
+    async def finish(self, user_id: uuid.UUID) -> None:
+        """
+        Make imported detections count in the user's analytics.
+
+        Rebuilds the user's rollups and bumps their data version, so cached
+        analytics payloads and their ETags go stale. Run in one transaction
+        after the last event is committed.
+        """
+        await RollupService(self.db).backfill(user_id)
+        await AnalyticsCacheService(self.db).bump_version(user_id)
+
+
+def event_tasks(
+    raw_dir: str,
+    skip: set[str] = frozenset(),
+) -> list[tuple[str, int, str, uuid.UUID]]:
+    """Build :func:`read_event_cascade` tasks for the events of a raw dataset directory."""
+    labels = read_event_labels(os.path.join(raw_dir, "Weibo.txt"))
+    return [
+        (event_id, label, os.path.join(raw_dir, "Weibo", f"{event_id}.json"), uuid.uuid4())
+        for event_id, label in labels.items()
+        if event_id not in skip
+    ]
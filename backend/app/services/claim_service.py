@@ -0,0 +1,107 @@
+"""Shared verdicts for identical content."""
+
+import hashlib
+import uuid
+from datetime import timedelta
+from typing import Optional, Sequence
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.claim import Claim
+from app.utils.prompt_compressor import normalize
+
+
+def claim_fingerprint(content: str) -> str:
+    """Fingerprint content after normalization, so trivially different copies share a claim."""
+    return hashlib.sha256(normalize(content).lower().encode("utf-8")).hexdigest()
+
+
+class ClaimService:
+    """
+    Service for the cross-user verdict store.
+
+    A claim is reused while it is younger than ``CLAIM_TTL_HOURS``; after
+    that the next detection of the content asks the model again and
+    :meth:`store` records a new claim. Claims are never updated, so
+    detections keep reading the verdict they were given.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def lookup(
+        self,
+        fingerprint: str,
+        versions: Sequence[str],
+    ) -> Optional[Claim]:
+        """
+        Find a fresh claim for content.
+
+        Args:
+            fingerprint: Result of :func:`claim_fingerprint`
+            versions: Acceptable verdict versions, most preferred first
+
+        Returns:
+            The claim, or None if there is none or it is due for re-verification
+        """
+        preference = case(
+            {version: rank for rank, version in enumerate(versions)},
+            value=Claim.verdict_version,
+        )
+        result = await self.db.execute(
+            select(Claim)
+            .where(
+                Claim.fingerprint == fingerprint,
+                Claim.verdict_version.in_(versions),
+                Claim.verified_at
+                >= func.now() - timedelta(hours=settings.CLAIM_TTL_HOURS),
+            )
+            .order_by(preference, Claim.verified_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def record_hit(self, claim_id: uuid.UUID) -> None:
+        """Count a detection served from a claim."""
+        await self.db.execute(
+            update(Claim)
+            .where(Claim.id == claim_id)
+            .values(hit_count=Claim.hit_count + 1, last_hit_at=func.now())
+        )
+
+    async def store(
+        self,
+        fingerprint: str,
+        version: str,
+        result: dict,
+    ) -> uuid.UUID:
+        """
+        Save a fresh model verdict as a new claim.
+
+        A stale claim for the same key is left as it is: earlier detections
+        read their details from it.
+
+        Args:
+            fingerprint: Result of :func:`claim_fingerprint`
+            version: Verdict version of the model and prompt used
+            result: Parsed model response
+
+        Returns:
+            The claim id
+        """
+        stmt = (
+            insert(Claim)
+            .values(
+                id=uuid.uuid4(),
+                fingerprint=fingerprint,
+                verdict_version=version,
+                is_rumor=result["is_rumor"],
+                confidence=result["confidence"],
+                raw_response=result,
+            )
+            .returning(Claim.id)
+        )
+        return (await self.db.execute(stmt)).scalar_one()
@@ -1,5 +1,6 @@
 """DeepSeek API integration service."""
 
+import hashlib
 import json
 import logging
 from typing import Optional
@@ -8,6 +9,7 @@ import httpx
 
 from app.core.config import settings
 from app.schemas.detection import AnalysisResult
+from app.utils.prompt_compressor import compress
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,8 @@ logger = logging.getLogger(__name__)
 class DeepSeekService:
     """Service for interacting with DeepSeek API."""
 
+    FALLBACK_EXPLANATION = "Unable to analyze content due to service error. Please try again later."
+
     DETECTION_PROMPT = """你是一个专业的谣言检测分析师。请分析以下微博文本，判断其是否为谣言。
 
 ## 待分析文本
@@ -98,6 +102,42 @@ class DeepSeekService:
         self.model = settings.DEEPSEEK_MODEL
         self.timeout = 120.0  # 批量检测需要更长超时时间
 
+    def verdict_version(self, batch: bool = False) -> str:
+        """
+        Identify the model and prompt that produce a verdict.
+
+        Args:
+            batch: Whether the verdict comes from the batch prompt
+
+        Returns:
+            Version string such as ``deepseek-chat:3f9a0c1d2e4b``
+        """
+        prompt = self.BATCH_DETECTION_PROMPT if batch else self.DETECTION_PROMPT
+        return f"{self.model}:{hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:12]}"
+
+    def prepare_content(self, content: str, budget: int) -> str:
+        """
+        Compress post text to at most ``budget`` estimated tokens.
+
+        Args:
+            content: Raw post text
+            budget: Token budget for this text
+
+        Returns:
+            Text to put in the prompt
+        """
+        if not settings.PROMPT_COMPRESSION_ENABLED:
+            return content
+        compressed = compress(content, budget)
+        if not compressed.text:
+            # Nothing left after cleaning (e.g. only a link); send it as is
+            return content
+        logger.debug(
+            f"Compressed prompt input {compressed.original_tokens} -> "
+            f"{compressed.tokens} tokens ({compressed.dropped_sentences} sentences dropped)"
+        )
+        return compressed.text
+
     async def detect_rumor(
         self,
         content: str,
@@ -111,7 +151,9 @@ class DeepSeekService:
         Returns:
             Detection result dictionary
         """
-        prompt = self.DETECTION_PROMPT.format(content=content)
+        prompt = self.DETECTION_PROMPT.format(
+            content=self.prepare_content(content, settings.PROMPT_MAX_INPUT_TOKENS),
+        )
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
@@ -172,10 +214,16 @@ class DeepSeekService:
             return []
 
         # 格式化文本列表
-        formatted_contents = "\n".join([
-            f"[{i}] {text[:500]}{'...' if len(text) > 500 else ''}"
-            for i, text in enumerate(contents)
-        ])
+        if settings.PROMPT_COMPRESSION_ENABLED:
+            formatted_contents = "\n".join([
+                f"[{i}] {self.prepare_content(text, settings.PROMPT_BATCH_ITEM_MAX_TOKENS)}"
+                for i, text in enumerate(contents)
+            ])
+        else:
+            formatted_contents = "\n".join([
+                f"[{i}] {text[:500]}{'...' if len(text) > 500 else ''}"
+                for i, text in enumerate(contents)
+            ])
 
         prompt = self.BATCH_DETECTION_PROMPT.format(contents=formatted_contents)
 
@@ -305,7 +353,7 @@ class DeepSeekService:
         return {
             "is_rumor": False,
             "confidence": 0.5,
-            "explanation": "Unable to analyze content due to service error. Please try again later.",
+            "explanation": self.FALLBACK_EXPLANATION,
             "keywords": [],
             "sentiment": "neutral",
             "category": "other",
@@ -313,6 +361,11 @@ class DeepSeekService:
             "risk_indicators": ["Analysis incomplete"],
         }
 
+    @classmethod
+    def is_fallback(cls, result: dict) -> bool:
+        """Whether a result is the placeholder returned when the API failed."""
+        return result.get("explanation") == cls.FALLBACK_EXPLANATION
+
     def extract_analysis(self, result: dict) -> AnalysisResult:
         """Extract analysis result from detection result."""
         return AnalysisResult(
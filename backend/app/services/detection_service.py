@@ -1,13 +1,16 @@
 """Detection service for rumor detection operations."""
 
+import asyncio
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
+from app.core.database import release_connection
 from app.models.detection import Analysis, Detection
 from app.schemas.detection import (
     AnalysisResult,
@@ -15,7 +18,42 @@ from app.schemas.detection import (
     DetectionResponse,
     RiskLevel,
 )
+from app.services.analytics_cache_service import AnalyticsCacheService
 from app.services.deepseek_service import DeepSeekService
+from app.services.claim_service import ClaimService, claim_fingerprint
+from app.services.known_rumor_service import known_rumor_result, known_rumors
+from app.services.near_duplicate_service import (
+    NearDuplicateMatch,
+    NearDuplicateService,
+    fingerprint_text,
+)
+from app.services.rollup_service import RollupService
+from app.services.term_index_service import TermIndexService, normalize_term, normalize_terms
+from app.services.trending_service import trending_tracker
+
+
+class _Verdict(NamedTuple):
+    """Where a detection's verdict comes from."""
+
+    # Parsed model response; None until found or fetched from the model
+    result: Optional[dict]
+    claim_id: Optional[uuid.UUID] = None
+    match: Optional[NearDuplicateMatch] = None
+    # Produced by the model for this detection
+    from_model: bool = False
+    # Content keys for storing a new verdict
+    fingerprint: Optional[int] = None
+    claim_key: Optional[str] = None
+    # Verdict version of a model verdict
+    version: Optional[str] = None
+
+
+def _known_rumor_verdict(content: str) -> Optional[dict]:
+    """Match content against the labeled events and build their verdict."""
+    known = known_rumors.lookup(content)
+    if known is None:
+        return None
+    return known_rumor_result(known, content)
 
 
 class DetectionService:
@@ -24,60 +62,164 @@ class DetectionService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.deepseek = DeepSeekService()
+        self.rollups = RollupService(db)
+        self.terms = TermIndexService(db)
+        self.analytics_cache = AnalyticsCacheService(db)
+        self.near_duplicates = NearDuplicateService(db)
+        self.claims = ClaimService(db)
 
-    async def detect_single(
+    async def _find_verdict(
         self,
-        user_id: uuid.UUID,
-        request: DetectionRequest,
-    ) -> Detection:
+        content: str,
+        versions: list[str],
+    ) -> "_Verdict":
         """
-        Perform single text detection.
+        Look up a reusable verdict before asking the model.
+
+        Tries the labeled dataset events, then the shared claim for
+        identical content, then the closest near-duplicate of an earlier
+        detection.
 
         Args:
-            user_id: The user performing the detection
-            request: Detection request with content
+            content: Text to detect
+            versions: Acceptable verdict versions, most preferred first
 
         Returns:
-            Detection record with results
+            The verdict, whose ``result`` is None if the model must be asked
         """
-        # Call DeepSeek API
-        result = await self.deepseek.detect_rumor(request.content)
-
-        # Determine risk level
+        if settings.KNOWN_RUMORS_ENABLED:
+            # jieba segmentation and keyword extraction would block the loop
+            result = await asyncio.to_thread(_known_rumor_verdict, content)
+            if result is not None:
+                return _Verdict(result)
+
+        claim_key = None
+        if settings.CLAIM_STORE_ENABLED:
+            claim_key = claim_fingerprint(content)
+            claim = await self.claims.lookup(claim_key, versions)
+            if claim is not None:
+                await self.claims.record_hit(claim.id)
+                return _Verdict(dict(claim.raw_response), claim_id=claim.id)
+
+        fingerprint = None
+        if settings.NEAR_DUPLICATE_ENABLED:
+            fingerprint = fingerprint_text(content)
+        if fingerprint is not None:
+            match = await self.near_duplicates.find_match(fingerprint, versions)
+            if match is not None:
+                if match.claim_id is not None:
+                    await self.claims.record_hit(match.claim_id)
+                return _Verdict(match.result, claim_id=match.claim_id, match=match)
+
+        return _Verdict(None, fingerprint=fingerprint, claim_key=claim_key)
+
+    async def _store_verdict(
+        self,
+        verdict: "_Verdict",
+        result: dict,
+        version: str,
+    ) -> "_Verdict":
+        """Record a fresh model verdict as a shared claim."""
+        verdict = verdict._replace(result=result, from_model=True, version=version)
+        if verdict.claim_key is None or DeepSeekService.is_fallback(result):
+            return verdict
+        claim_id = await self.claims.store(verdict.claim_key, version, result)
+        return verdict._replace(claim_id=claim_id)
+
+    def _new_detection(
+        self,
+        user_id: uuid.UUID,
+        content: str,
+        verdict: "_Verdict",
+    ) -> Detection:
+        """Build a detection; the response is stored once, on the claim if there is one."""
+        result = verdict.result
         risk_level = RiskLevel.from_confidence(
             result["confidence"],
             result["is_rumor"],
         )
-
-        # Create detection record
-        detection = Detection(
+        return Detection(
             user_id=user_id,
-            content=request.content,
+            content=content,
             is_rumor=result["is_rumor"],
             confidence=result["confidence"],
             risk_level=risk_level.value,
             explanation=result["explanation"],
-            raw_response=result,
+            raw_response=None if verdict.claim_id else result,
+            claim_id=verdict.claim_id,
+            matched_detection_id=verdict.match.detection_id if verdict.match else None,
+            match_distance=verdict.match.distance if verdict.match else None,
         )
+
+    def _index_detection(self, detection: Detection, verdict: "_Verdict") -> None:
+        """Index a detection whose verdict just came from the model."""
+        if not verdict.from_model or verdict.fingerprint is None:
+            return
+        if DeepSeekService.is_fallback(verdict.result):
+            return
+        self.near_duplicates.add(detection.id, verdict.fingerprint, verdict.version)
+
+    async def detect_single(
+        self,
+        user_id: uuid.UUID,
+        request: DetectionRequest,
+    ) -> Detection:
+        """
+        Perform single text detection.
+
+        Args:
+            user_id: The user performing the detection
+            request: Detection request with content
+
+        Returns:
+            Detection record with results
+        """
+        version = self.deepseek.verdict_version()
+        verdict = await self._find_verdict(request.content, [version])
+        if verdict.result is None:
+            # Don't hold a pooled connection while waiting on the model
+            if settings.DB_RELEASE_DURING_LLM:
+                await release_connection(self.db)
+
+            # Call DeepSeek API
+            result = await self.deepseek.detect_rumor(request.content)
+            verdict = await self._store_verdict(verdict, result, version)
+        result = verdict.result
+
+        # Create detection record
+        detection = self._new_detection(user_id, request.content, verdict)
         self.db.add(detection)
         await self.db.flush()
+        self._index_detection(detection, verdict)
 
         # Create analysis record if requested
         if request.include_analysis:
             analysis = Analysis(
                 detection_id=detection.id,
-                keywords=result.get("keywords", []),
+                keywords=normalize_terms(result.get("keywords")),
                 sentiment=result.get("sentiment", "neutral"),
                 category=result.get("category", "other"),
                 sources=result.get("sources", []),
-                fact_check_points=result.get("fact_check_points", []),
+                fact_check_points=normalize_terms(result.get("fact_check_points")),
+                risk_indicators=normalize_terms(result.get("risk_indicators")),
             )
             self.db.add(analysis)
             await self.db.flush()
             detection.analysis = analysis
+            self.terms.add(user_id, analysis)
+
+        # Update dashboard aggregates in the same transaction
+        self.rollups.add(
+            detection,
+            analysis.category if request.include_analysis else None,
+        )
+        await self.rollups.flush()
+        await self.terms.flush()
+        await self.analytics_cache.bump_version(user_id)
 
         # Commit the transaction
         await self.db.commit()
+        trending_tracker.record(result.get("keywords", []), user_id)
 
         # Reload with eager loading to avoid lazy-load issues in async context
         result = await self.db.execute(
@@ -107,51 +249,64 @@ class DetectionService:
         if not contents:
             return []
 
-        # 调用DeepSeek批量检测API（一次检测多条）
-        results = await self.deepseek.detect_batch(contents)
+        # Reuse shared and near-duplicate verdicts; only the rest go to the
+        # model. Single-detection verdicts are more detailed, so they serve
+        # batches too
+        version = self.deepseek.verdict_version(batch=True)
+        versions = [self.deepseek.verdict_version(), version]
+        verdicts = [await self._find_verdict(content, versions) for content in contents]
+        pending = [i for i, verdict in enumerate(verdicts) if verdict.result is None]
+
+        if pending:
+            if settings.DB_RELEASE_DURING_LLM:
+                await release_connection(self.db)
+
+            # 调用DeepSeek批量检测API（一次检测多条）
+            results = await self.deepseek.detect_batch([contents[i] for i in pending])
+            for i, result in zip(pending, results):
+                verdicts[i] = await self._store_verdict(verdicts[i], result, version)
 
         detections = []
-        for i, (content, result) in enumerate(zip(contents, results)):
+        for i, (content, verdict) in enumerate(zip(contents, verdicts)):
+            result = verdict.result
             try:
-                # Determine risk level
-                risk_level = RiskLevel.from_confidence(
-                    result["confidence"],
-                    result["is_rumor"],
-                )
-
                 # Create detection record
-                detection = Detection(
-                    user_id=user_id,
-                    content=content,
-                    is_rumor=result["is_rumor"],
-                    confidence=result["confidence"],
-                    risk_level=risk_level.value,
-                    explanation=result["explanation"],
-                    raw_response=result,
-                )
+                detection = self._new_detection(user_id, content, verdict)
                 self.db.add(detection)
                 await self.db.flush()
+                self._index_detection(detection, verdict)
 
                 # Create analysis record if requested
                 if include_analysis:
                     analysis = Analysis(
                         detection_id=detection.id,
-                        keywords=result.get("keywords", []),
+                        keywords=normalize_terms(result.get("keywords")),
                         sentiment=result.get("sentiment", "neutral"),
                         category=result.get("category", "other"),
                         sources=result.get("sources", []),
-                        fact_check_points=result.get("fact_check_points", []),
+                        fact_check_points=normalize_terms(result.get("fact_check_points")),
+                        risk_indicators=normalize_terms(result.get("risk_indicators")),
                     )
                     self.db.add(analysis)
                     await self.db.flush()
                     detection.analysis = analysis
+                    self.terms.add(user_id, analysis)
 
+                self.rollups.add(
+                    detection,
+                    analysis.category if include_analysis else None,
+                )
                 detections.append(detection)
+                trending_tracker.record(result.get("keywords", []), user_id)
             except Exception as e:
                 # Log error but continue with other items
                 continue
 
-        # Commit all at once
+        # Update dashboard aggregates and commit all at once
+        await self.rollups.flush()
+        await self.terms.flush()
+        if detections:
+            await self.analytics_cache.bump_version(user_id)
         await self.db.commit()
 
         # Reload with eager loading
@@ -190,6 +345,9 @@ class DetectionService:
         risk_level: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        keyword: Optional[str] = None,
+        fact_check_point: Optional[str] = None,
+        risk_indicator: Optional[str] = None,
     ) -> tuple[list[Detection], int]:
         """
         Get paginated detections for a user with optional filters.
@@ -210,6 +368,21 @@ class DetectionService:
         if end_date:
             query = query.where(Detection.created_at <= end_date)
 
+        # Term filters use JSONB containment so the GIN indexes apply
+        term_filters = [
+            getattr(Analysis, field).contains([normalize_term(value)])
+            for field, value in (
+                ("keywords", keyword),
+                ("fact_check_points", fact_check_point),
+                ("risk_indicators", risk_indicator),
+            )
+            if value
+        ]
+        if term_filters:
+            query = query.join(Analysis, Analysis.detection_id == Detection.id).where(
+                *term_filters
+            )
+
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
         total_result = await self.db.execute(count_query)
@@ -238,6 +411,16 @@ class DetectionService:
         if not detection:
             return False
 
+        self.rollups.add(
+            detection,
+            detection.analysis.category if detection.analysis else None,
+            sign=-1,
+        )
+        if detection.analysis:
+            self.terms.add(user_id, detection.analysis, sign=-1)
+        await self.rollups.flush()
+        await self.terms.flush()
+        await self.analytics_cache.bump_version(user_id)
         await self.db.delete(detection)
         return True
 
@@ -263,9 +446,10 @@ class DetectionService:
                 category=detection.analysis.category or "other",
                 sources=detection.analysis.sources or [],
                 fact_check_points=detection.analysis.fact_check_points or [],
-                risk_indicators=detection.raw_response.get("risk_indicators", [])
-                if detection.raw_response
-                else [],
+                risk_indicators=detection.analysis.risk_indicators
+                or (
+                    detection.verdict.get("risk_indicators", [])
+                ),
             )
 
         return DetectionResponse(
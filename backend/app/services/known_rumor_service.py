@@ -0,0 +1,249 @@
+"""Instant verdicts for content matching labeled Ma-Weibo events."""
+
+import logging
+import os
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.services.claim_service import claim_fingerprint
+from app.services.near_duplicate_service import fingerprint_text
+from app.utils.dataset import read_frame
+from app.utils.simhash import band_keys, hamming_distance
+from app.utils.text_processor import extract_keywords
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the saved index layout or its fingerprints change
+INDEX_FORMAT_VERSION = 1
+DATASET_COLUMNS = ["event_id", "text", "is_rumor"]
+
+
+class KnownRumorMatch(NamedTuple):
+    """A labeled dataset event matching some content."""
+
+    event_id: str
+    is_rumor: bool
+    # SimHash distance; 0 for the same normalized content
+    distance: int
+
+
+def _digest(claim_key: str) -> int:
+    # 64 bits of the SHA-256 claim fingerprint are plenty for a few
+    # thousand events and fit a uint64 array
+    return int(claim_key[:16], 16)
+
+
+class KnownRumorIndex:
+    """
+    In-memory index over the labeled source posts of the Ma-Weibo dataset.
+
+    Content is matched exactly on its claim fingerprint, then by SimHash
+    within ``KNOWN_RUMORS_MAX_DISTANCE`` through in-memory LSH bands. The
+    fingerprints can be saved to a compact ``.npz`` file so workers don't
+    re-segment the dataset at startup.
+    """
+
+    def __init__(self):
+        self._set([], [], [], [])
+
+    def __len__(self) -> int:
+        return len(self._event_ids)
+
+    def _set(
+        self,
+        event_ids: Sequence[str],
+        labels: Sequence[bool],
+        digests: Sequence[int],
+        simhashes: Sequence[Optional[int]],
+    ) -> None:
+        bands = settings.KNOWN_RUMORS_MAX_DISTANCE + 1
+        exact: dict[int, int] = {}
+        banded: dict[int, list[int]] = {}
+        for row, (digest, fingerprint) in enumerate(zip(digests, simhashes)):
+            exact.setdefault(digest, row)
+            if fingerprint is not None:
+                for key in band_keys(fingerprint, bands):
+                    banded.setdefault(key, []).append(row)
+
+        # Loaded before the app serves requests, so no locking
+        self._event_ids = list(event_ids)
+        self._labels = [bool(label) for label in labels]
+        self._digests = list(digests)
+        self._simhashes = list(simhashes)
+        self._exact = exact
+        self._bands = banded
+
+    def lookup(self, content: str) -> Optional[KnownRumorMatch]:
+        """
+        Find the labeled event closest to some content.
+
+        Args:
+            content: Text to detect
+
+        Returns:
+            The match, or None
+        """
+        if not self._event_ids:
+            return None
+
+        row = self._exact.get(_digest(claim_fingerprint(content)))
+        if row is not None:
+            return KnownRumorMatch(self._event_ids[row], self._labels[row], 0)
+
+        fingerprint = fingerprint_text(content)
+        if fingerprint is None:
+            return None
+        best: Optional[tuple[int, int]] = None
+        for key in band_keys(fingerprint, settings.KNOWN_RUMORS_MAX_DISTANCE + 1):
+            for row in self._bands.get(key, ()):
+                distance = hamming_distance(fingerprint, self._simhashes[row])
+                if distance <= settings.KNOWN_RUMORS_MAX_DISTANCE and (
+                    best is None or (distance, row) < best
+                ):
+                    best = (distance, row)
+        if best is None:
+            return None
+        distance, row = best
+        return KnownRumorMatch(self._event_ids[row], self._labels[row], distance)
+
+    def build(self, df: pd.DataFrame) -> int:
+        """
+        Index the source posts of a processed dataset.
+
+        Args:
+            df: Rows with ``event_id``, ``text`` and ``is_rumor`` columns, as
+                written by ``data/preprocess.py``
+
+        Returns:
+            Number of events indexed
+        """
+        df = df.dropna(subset=["event_id", "text"])
+        event_ids = df["event_id"]
+        if pd.api.types.is_float_dtype(event_ids):
+            # Numeric ids turn float when the column has gaps
+            event_ids = event_ids.astype("int64")
+        texts = df["text"].astype(str).tolist()
+        self._set(
+            event_ids.astype(str).tolist(),
+            df["is_rumor"].astype(bool).tolist(),
+            [_digest(claim_fingerprint(text)) for text in texts],
+            [fingerprint_text(text) for text in texts],
+        )
+        return len(self)
+
+    def save(self, path: str) -> None:
+        """Atomically write the fingerprints to an ``.npz`` file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp,
+            version=np.array(INDEX_FORMAT_VERSION),
+            event_ids=np.array(self._event_ids, dtype=str),
+            labels=np.array(self._labels, dtype=bool),
+            digests=np.array(self._digests, dtype=np.uint64),
+            simhashes=np.array([f or 0 for f in self._simhashes], dtype=np.uint64),
+            has_simhash=np.array([f is not None for f in self._simhashes], dtype=bool),
+        )
+        os.replace(tmp, path)
+
+    def load_file(self, path: str) -> bool:
+        """Load fingerprints saved by :meth:`save`. Returns False if the file is unusable."""
+        try:
+            with np.load(path) as data:
+                if int(data["version"]) != INDEX_FORMAT_VERSION:
+                    return False
+                self._set(
+                    data["event_ids"].tolist(),
+                    data["labels"].tolist(),
+                    data["digests"].tolist(),
+                    [
+                        fingerprint if present else None
+                        for fingerprint, present in zip(
+                            data["simhashes"].tolist(),
+                            data["has_simhash"].tolist(),
+                        )
+                    ],
+                )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable known rumor index {path}: {e}")
+            return False
+        return True
+
+    def load(
+        self,
+        index_path: Optional[str] = None,
+        dataset_path: Optional[str] = None,
+    ) -> int:
+        """
+        Load the index at startup.
+
+        Uses the saved index unless the dataset is newer, in which case the
+        dataset is re-indexed and the saved index rewritten. Without either
+        file the index stays empty and detection goes to the model.
+
+        Args:
+            index_path: Saved index (defaults to ``KNOWN_RUMORS_INDEX_PATH``)
+            dataset_path: Processed source posts, CSV, Arrow or Parquet
+                (defaults to ``KNOWN_RUMORS_DATASET_PATH``)
+
+        Returns:
+            Number of events indexed
+        """
+        index_path = index_path or settings.KNOWN_RUMORS_INDEX_PATH
+        dataset_path = dataset_path or settings.KNOWN_RUMORS_DATASET_PATH
+        has_index = os.path.exists(index_path)
+        has_dataset = os.path.exists(dataset_path)
+
+        if has_index and (
+            not has_dataset or os.path.getmtime(index_path) >= os.path.getmtime(dataset_path)
+        ):
+            if self.load_file(index_path):
+                return len(self)
+        if not has_dataset:
+            logger.info("No labeled dataset found; known rumor index is empty")
+            return len(self)
+
+        self.build(read_frame(dataset_path, DATASET_COLUMNS))
+        try:
+            self.save(index_path)
+        except OSError as e:
+            logger.warning(f"Could not save known rumor index {index_path}: {e}")
+        return len(self)
+
+
+def known_rumor_result(match: KnownRumorMatch, content: str) -> dict:
+    """Build a detection result, in the model's response format, citing a labeled event."""
+    label = "谣言" if match.is_rumor else "非谣言"
+    if match.distance:
+        explanation = (
+            f"该内容与 Ma-Weibo 数据集中已标注为{label}的事件 {match.event_id} "
+            f"高度相似（SimHash 距离 {match.distance}），沿用其标注结论。"
+        )
+        confidence = 0.1 if match.is_rumor else 0.9
+    else:
+        explanation = (
+            f"该内容与 Ma-Weibo 数据集中已标注为{label}的事件 {match.event_id} 一致，"
+            f"沿用其标注结论。"
+        )
+        confidence = 0.0 if match.is_rumor else 1.0
+
+    return {
+        "is_rumor": match.is_rumor,
+        "confidence": confidence,
+        "explanation": explanation,
+        "keywords": extract_keywords(content),
+        "sentiment": "neutral",
+        "category": "other",
+        "sources": [f"Ma-Weibo event {match.event_id}"],
+        "fact_check_points": [],
+        "risk_indicators": ["与已标注谣言事件匹配"] if match.is_rumor else [],
+        "known_event_id": match.event_id,
+        "known_event_distance": match.distance,
+    }
+
+
+# Process-wide index, loaded at startup
+known_rumors = KnownRumorIndex()
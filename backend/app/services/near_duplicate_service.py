@@ -0,0 +1,187 @@
+"""Near-duplicate detection reuse."""
+
+import re
+import uuid
+from datetime import timedelta
+from typing import NamedTuple, Optional, Sequence
+
+from sqlalchemy import case, cast, delete, exists, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.models.claim import Claim
+from app.models.detection import Detection, DetectionFingerprint
+from app.services.deepseek_service import DeepSeekService
+from app.utils.prompt_compressor import normalize
+from app.utils.simhash import band_keys, simhash, to_signed
+from app.utils.text_processor import segment_text
+
+# Reposts often swap topic hashtags, so they are left out of fingerprints
+_HASHTAGS = re.compile(r"#[^#\s]{1,40}#")
+
+
+class NearDuplicateMatch(NamedTuple):
+    """An earlier detection close enough to reuse its verdict."""
+
+    detection_id: uuid.UUID
+    distance: int
+    result: dict
+    # Claim holding the verdict, if any
+    claim_id: Optional[uuid.UUID]
+
+
+def fingerprint_text(text: str) -> Optional[int]:
+    """
+    SimHash a post's jieba tokens after normalization.
+
+    Normalizing first, and dropping ``#topic#`` hashtags, means reposts
+    differing only in emoji, repost markers, mentions or hashtags get the
+    same tokens.
+
+    Returns:
+        The fingerprint, or None if the text has too few tokens for a
+        meaningful comparison
+    """
+    tokens = segment_text(normalize(_HASHTAGS.sub(" ", text)))
+    if len(tokens) < settings.NEAR_DUPLICATE_MIN_TOKENS:
+        return None
+    return simhash(tokens)
+
+
+class NearDuplicateService:
+    """
+    Service for the SimHash index over model-verified detections.
+
+    Only detections whose verdict came from the model are indexed, so a
+    reused verdict is always at most ``NEAR_DUPLICATE_MAX_DISTANCE`` from
+    the text the model actually saw.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_match(
+        self,
+        fingerprint: int,
+        versions: Sequence[str],
+    ) -> Optional[NearDuplicateMatch]:
+        """
+        Find the closest indexed detection within the configured distance.
+
+        Only verdicts of an acceptable version younger than
+        ``CLAIM_TTL_HOURS`` are considered, and the distance is computed for
+        every candidate sharing a band key, so the closest of them wins.
+        Ties go to the preferred version, then to the newest verdict.
+
+        Args:
+            fingerprint: SimHash of the new text
+            versions: Acceptable verdict versions, most preferred first
+
+        Returns:
+            The match, or None
+        """
+        verified_at = func.coalesce(Claim.verified_at, Detection.created_at)
+        response = func.coalesce(Claim.raw_response, Detection.raw_response)
+        distance = func.bit_count(
+            cast(DetectionFingerprint.simhash.op("#")(to_signed(fingerprint)), BIT(64))
+        )
+        preference = case(
+            {version: rank for rank, version in enumerate(versions)},
+            value=DetectionFingerprint.verdict_version,
+        )
+        result = await self.db.execute(
+            select(DetectionFingerprint.detection_id, distance, Detection.claim_id, response)
+            .join(Detection, Detection.id == DetectionFingerprint.detection_id)
+            .outerjoin(Claim, Claim.id == Detection.claim_id)
+            .where(
+                DetectionFingerprint.bands.overlap(
+                    band_keys(fingerprint, settings.NEAR_DUPLICATE_BANDS)
+                ),
+                DetectionFingerprint.verdict_version.in_(versions),
+                verified_at >= func.now() - timedelta(hours=settings.CLAIM_TTL_HOURS),
+                distance <= settings.NEAR_DUPLICATE_MAX_DISTANCE,
+                response.is_not(None),
+            )
+            .order_by(distance, preference, verified_at.desc())
+            .limit(1)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        detection_id, distance, claim_id, response = row
+        return NearDuplicateMatch(detection_id, distance, dict(response), claim_id)
+
+    def add(self, detection_id: uuid.UUID, fingerprint: int, version: str) -> None:
+        """Index a model-verified detection."""
+        self.db.add(
+            DetectionFingerprint(
+                detection_id=detection_id,
+                simhash=to_signed(fingerprint),
+                bands=band_keys(fingerprint, settings.NEAR_DUPLICATE_BANDS),
+                verdict_version=version,
+            )
+        )
+
+    async def rebuild(self, chunk_size: int = 1000) -> int:
+        """
+        Rebuild the index from the detections table.
+
+        Needed after changing ``NEAR_DUPLICATE_BANDS`` or the tokenizer
+        dictionaries. Runs in the caller's transaction. Only model verdicts
+        are indexed, judged by provenance that outlives the source: reused
+        near-duplicates keep their ``match_distance``, dataset events their
+        event id, and of the detections sharing a claim only the first one
+        (which asked the model) is indexed. Detections without a claim are
+        skipped, as their verdict version is unknown.
+
+        Returns:
+            Number of detections indexed
+        """
+        await self.db.execute(delete(DetectionFingerprint))
+
+        earlier = aliased(Detection)
+        indexed = 0
+        last_id: Optional[uuid.UUID] = None
+        while True:
+            query = (
+                select(Detection.id, Detection.content, Claim.verdict_version)
+                .join(Claim, Claim.id == Detection.claim_id)
+                .where(
+                    # matched_detection_id is cleared when the source is deleted
+                    Detection.match_distance.is_(None),
+                    Detection.dataset_event_id.is_(None),
+                    or_(
+                        Detection.raw_response.is_(None),
+                        ~Detection.raw_response.has_key("known_event_id"),
+                    ),
+                    ~exists().where(
+                        earlier.claim_id == Detection.claim_id,
+                        earlier.created_at < Detection.created_at,
+                    ),
+                    Detection.explanation.is_distinct_from(DeepSeekService.FALLBACK_EXPLANATION),
+                )
+                .order_by(Detection.id)
+                .limit(chunk_size)
+            )
+            if last_id is not None:
+                query = query.where(Detection.id > last_id)
+            rows = (await self.db.execute(query)).all()
+            if not rows:
+                return indexed
+            last_id = rows[-1].id
+
+            values = []
+            for row in rows:
+                fingerprint = fingerprint_text(row.content)
+                if fingerprint is not None:
+                    values.append({
+                        "detection_id": row.id,
+                        "simhash": to_signed(fingerprint),
+                        "bands": band_keys(fingerprint, settings.NEAR_DUPLICATE_BANDS),
+                        "verdict_version": row.verdict_version,
+                    })
+            if values:
+                await self.db.execute(insert(DetectionFingerprint), values)
+                indexed += len(values)
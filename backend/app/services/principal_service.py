@@ -0,0 +1,74 @@
+"""Cached authentication principals."""
+
+import logging
+import uuid
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import mark_written
+from app.core.pubsub import pg_listener
+from app.models.user import User
+from app.schemas.user import UserPrincipal
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_CHANNEL = "principal_invalidated"
+
+# Per-worker cache of user id -> principal
+_principals: TTLCache[UserPrincipal] = TTLCache(
+    settings.PRINCIPAL_CACHE_SIZE,
+    settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def _on_invalidated(payload: str) -> None:
+    try:
+        _principals.pop(uuid.UUID(payload))
+    except ValueError:
+        logger.warning(f"Ignoring malformed principal invalidation: {payload!r}")
+
+
+pg_listener.subscribe(PRINCIPAL_CHANNEL, _on_invalidated)
+# Anything may have changed while the listener was disconnected
+pg_listener.on_connect(_principals.clear)
+
+
+class PrincipalService:
+    """
+    Service resolving authenticated user ids to cached principals.
+
+    Authorizing a request needs only a user's id and flags, so these are
+    cached per worker for ``PRINCIPAL_CACHE_TTL_SECONDS``. Changes to a
+    user call :meth:`invalidate`, which drops the local entry and sends a
+    NOTIFY, delivered to every worker when the transaction commits.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_principal(self, user_id: uuid.UUID) -> Optional[UserPrincipal]:
+        """Get the principal for a user, or None if the user does not exist."""
+        principal = _principals.get(user_id)
+        if principal is not None:
+            return principal
+
+        result = await self.db.execute(
+            select(User.id, User.is_active, User.is_superuser).where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        principal = UserPrincipal.model_validate(row)
+        _principals.set(user_id, principal)
+        return principal
+
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop a user's cached principal in every worker once this transaction commits."""
+        _principals.pop(user_id)
+        await self.db.execute(select(func.pg_notify(PRINCIPAL_CHANNEL, str(user_id))))
+        mark_written(self.db)
@@ -0,0 +1,176 @@
+"""Propagation trees and their cascade analytics, cached per detection."""
+
+import asyncio
+import uuid
+from typing import Literal, Optional
+
+from sqlalchemy import exists, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.models.detection import PropagationNode, PropagationStats
+from app.utils.cascade import Cascade, CascadeStats, analyze
+
+
+class PropagationService:
+    """
+    Service reading detections' propagation trees and their statistics.
+
+    Stats are stored in ``propagation_stats`` and served from there while
+    the detection's node count is unchanged; nodes are only ever appended
+    by imports, so a changed count means the cascade grew.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def node_exists(self, detection_id: uuid.UUID, node_id: str) -> bool:
+        """Whether a detection's cascade has a node."""
+        return bool(
+            await self.db.scalar(
+                select(
+                    exists().where(
+                        PropagationNode.detection_id == detection_id,
+                        PropagationNode.node_id == node_id,
+                    )
+                )
+            )
+        )
+
+    async def get_nodes(
+        self,
+        detection_id: uuid.UUID,
+        root_node_id: Optional[str] = None,
+        min_depth: int = 0,
+        max_depth: Optional[int] = None,
+        order: Literal["depth", "time"] = "depth",
+        page: int = 1,
+        page_size: int = 200,
+    ) -> tuple[list[tuple[PropagationNode, int]], int]:
+        """
+        Get a page of a cascade's nodes with their depth.
+
+        Walks the tree down from ``root_node_id`` (or from every root of the
+        cascade) with a recursive CTE, one index lookup on
+        ``(detection_id, parent_id)`` per level, stopping at ``max_depth``.
+        Roots are nodes without a parent or whose parent is not in the
+        cascade. Depths count from the starting node(s).
+
+        Args:
+            detection_id: Detection whose cascade to read
+            root_node_id: Node whose subtree to return, itself included
+            min_depth: Skip nodes above this depth
+            max_depth: Don't descend below this depth (capped at
+                ``PROPAGATION_MAX_DEPTH``)
+            order: ``depth`` for level by level, ``time`` for repost order
+            page: Page number, from 1
+            page_size: Nodes per page
+
+        Returns:
+            Tuple of ((node, depth) pairs, total nodes in range)
+        """
+        depth_limit = settings.PROPAGATION_MAX_DEPTH
+        if max_depth is not None:
+            depth_limit = min(max_depth, depth_limit)
+
+        if root_node_id is not None:
+            start = PropagationNode.node_id == root_node_id
+        else:
+            parent = aliased(PropagationNode)
+            start = or_(
+                PropagationNode.parent_id.is_(None),
+                ~exists().where(
+                    parent.detection_id == detection_id,
+                    parent.node_id == PropagationNode.parent_id,
+                ),
+            )
+        tree = (
+            select(PropagationNode.id, PropagationNode.node_id, literal_column("0").label("depth"))
+            .where(PropagationNode.detection_id == detection_id, start)
+            .cte("tree", recursive=True)
+        )
+        child = aliased(PropagationNode)
+        # UNION drops repeats of a node reached twice at the same depth
+        tree = tree.union(
+            select(child.id, child.node_id, tree.c.depth + 1).where(
+                child.detection_id == detection_id,
+                child.parent_id == tree.c.node_id,
+                tree.c.depth < depth_limit,
+            )
+        )
+
+        if order == "time":
+            ordering = (PropagationNode.timestamp, tree.c.depth, PropagationNode.id)
+        else:
+            ordering = (tree.c.depth, PropagationNode.timestamp, PropagationNode.id)
+        result = await self.db.execute(
+            select(PropagationNode, tree.c.depth, func.count().over().label("total"))
+            .join(tree, tree.c.id == PropagationNode.id)
+            .where(tree.c.depth >= min_depth)
+            .order_by(*ordering)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        rows = result.all()
+        if rows:
+            return [(row[0], row[1]) for row in rows], rows[0].total
+
+        # Past the last page: the window count came back with no rows
+        total = await self.db.scalar(
+            select(func.count()).select_from(tree).where(tree.c.depth >= min_depth)
+        )
+        return [], total
+
+    async def get_stats(self, detection_id: uuid.UUID) -> Optional[PropagationStats]:
+        """
+        Get cascade statistics of a detection, computing them if stale.
+
+        Returns:
+            The stats, or None if the detection has no propagation nodes
+        """
+        node_count = (
+            await self.db.execute(
+                select(func.count())
+                .select_from(PropagationNode)
+                .where(PropagationNode.detection_id == detection_id)
+            )
+        ).scalar_one()
+        if not node_count:
+            return None
+
+        cached = await self.db.get(PropagationStats, detection_id)
+        if cached is not None and cached.node_count == node_count:
+            return cached
+
+        stats = await self.compute(detection_id)
+        return await self._store(detection_id, stats)
+
+    async def compute(self, detection_id: uuid.UUID) -> CascadeStats:
+        """Load a detection's cascade as arrays and analyze it."""
+        result = await self.db.execute(
+            select(
+                PropagationNode.node_id,
+                PropagationNode.parent_id,
+                func.extract("epoch", PropagationNode.timestamp),
+                PropagationNode.user_info["followers_count"].astext,
+                PropagationNode.user_info["uid"].astext,
+            )
+            .where(PropagationNode.detection_id == detection_id)
+            .order_by(PropagationNode.timestamp, PropagationNode.created_at)
+        )
+        columns = list(zip(*result.all()))
+        # Large cascades take a noticeable fraction of a second; keep the loop free
+        return await asyncio.to_thread(lambda: analyze(Cascade.from_edges(*columns)))
+
+    async def _store(self, detection_id: uuid.UUID, stats: CascadeStats) -> PropagationStats:
+        values = stats._asdict()
+        stmt = insert(PropagationStats).values(detection_id=detection_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PropagationStats.detection_id],
+            set_={**{key: stmt.excluded[key] for key in values}, "computed_at": func.now()},
+        ).returning(PropagationStats)
+        return (
+            await self.db.execute(stmt, execution_options={"populate_existing": True})
+        ).scalar_one()
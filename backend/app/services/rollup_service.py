@@ -0,0 +1,270 @@
+"""Rollup service for incrementally maintained dashboard aggregates."""
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import (
+    Integer,
+    and_,
+    case,
+    delete,
+    func,
+    literal,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.analytics import DetectionDailyRollup
+from app.models.detection import Analysis, Detection
+
+RISK_LEVELS = ("low", "medium", "high", "critical")
+
+
+def rollup_day(created_at: datetime) -> date:
+    """Return the rollup bucket (``ANALYTICS_TIMEZONE`` calendar day) for a timestamp."""
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at.astimezone(ZoneInfo(settings.ANALYTICS_TIMEZONE)).date()
+
+
+@dataclass
+class _RollupDelta:
+    """Pending change to a single (user, day) rollup row."""
+
+    total: int = 0
+    rumors: int = 0
+    confidence_sum: Decimal = Decimal("0")
+    risk: dict[str, int] = field(default_factory=lambda: dict.fromkeys(RISK_LEVELS, 0))
+    categories: dict[str, int] = field(default_factory=dict)
+
+
+class RollupService:
+    """Service maintaining ``detection_daily_rollups`` alongside detection writes.
+
+    Changes are accumulated with :meth:`add` and written with :meth:`flush`
+    using the caller's session, so the rollups commit or roll back together
+    with the detections they describe.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._inserted: dict[tuple[uuid.UUID, date], _RollupDelta] = {}
+        self._deleted: dict[tuple[uuid.UUID, date], _RollupDelta] = {}
+
+    def add(
+        self,
+        detection: Detection,
+        category: Optional[str],
+        sign: int = 1,
+    ) -> None:
+        """
+        Queue a detection insert (``sign=1``) or delete (``sign=-1``).
+
+        Args:
+            detection: The detection being written or removed
+            category: Analysis category, or None if the detection has no analysis
+            sign: 1 for an insert, -1 for a delete
+        """
+        pending = self._inserted if sign > 0 else self._deleted
+        key = (detection.user_id, rollup_day(detection.created_at))
+        delta = pending.setdefault(key, _RollupDelta())
+
+        delta.total += 1
+        if detection.is_rumor:
+            delta.rumors += 1
+        delta.confidence_sum += Decimal(str(detection.confidence))
+        if detection.risk_level in delta.risk:
+            delta.risk[detection.risk_level] += 1
+        if category is not None:
+            category = category or "other"
+            delta.categories[category] = delta.categories.get(category, 0) + 1
+
+    async def flush(self) -> None:
+        """Write all queued deltas in the current transaction."""
+        for (user_id, day), delta in self._inserted.items():
+            await self._apply_insert(user_id, day, delta)
+        for (user_id, day), delta in self._deleted.items():
+            await self._apply_delete(user_id, day, delta)
+        self._inserted.clear()
+        self._deleted.clear()
+
+    async def _apply_insert(
+        self,
+        user_id: uuid.UUID,
+        day: date,
+        delta: _RollupDelta,
+    ) -> None:
+        """Upsert a positive delta into the (user, day) row."""
+        stmt = insert(DetectionDailyRollup).values(
+            user_id=user_id,
+            day=day,
+            total=delta.total,
+            rumors=delta.rumors,
+            confidence_sum=delta.confidence_sum,
+            risk_low=delta.risk["low"],
+            risk_medium=delta.risk["medium"],
+            risk_high=delta.risk["high"],
+            risk_critical=delta.risk["critical"],
+            category_counts=delta.categories,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DetectionDailyRollup.user_id, DetectionDailyRollup.day],
+            set_=self._increments(delta, 1),
+        )
+        await self.db.execute(stmt)
+
+    async def _apply_delete(
+        self,
+        user_id: uuid.UUID,
+        day: date,
+        delta: _RollupDelta,
+    ) -> None:
+        """Subtract a delta from an existing (user, day) row."""
+        await self.db.execute(
+            update(DetectionDailyRollup)
+            .where(
+                and_(
+                    DetectionDailyRollup.user_id == user_id,
+                    DetectionDailyRollup.day == day,
+                )
+            )
+            .values(**self._increments(delta, -1))
+        )
+
+    @staticmethod
+    def _increments(delta: _RollupDelta, sign: int) -> dict:
+        """Build column increment expressions for an UPDATE/ON CONFLICT clause."""
+        rollup = DetectionDailyRollup
+        counts = rollup.category_counts
+        for category, count in delta.categories.items():
+            counts = counts.op("||", return_type=JSONB)(
+                func.jsonb_build_object(
+                    literal(category),
+                    func.coalesce(
+                        rollup.category_counts[category].astext.cast(Integer), 0
+                    )
+                    + sign * count,
+                )
+            )
+
+        return {
+            "total": rollup.total + sign * delta.total,
+            "rumors": rollup.rumors + sign * delta.rumors,
+            "confidence_sum": rollup.confidence_sum + sign * delta.confidence_sum,
+            "risk_low": rollup.risk_low + sign * delta.risk["low"],
+            "risk_medium": rollup.risk_medium + sign * delta.risk["medium"],
+            "risk_high": rollup.risk_high + sign * delta.risk["high"],
+            "risk_critical": rollup.risk_critical + sign * delta.risk["critical"],
+            "category_counts": counts,
+        }
+
+    async def backfill(self, user_id: Optional[uuid.UUID] = None) -> int:
+        """
+        Rebuild rollups from the ``detections`` table.
+
+        Args:
+            user_id: Restrict the rebuild to one user; all users if None
+
+        Returns:
+            Number of rollup rows written
+        """
+        day = func.date(
+            func.timezone(literal(settings.ANALYTICS_TIMEZONE), Detection.created_at)
+        )
+        category = func.coalesce(Analysis.category, literal_column("'other'"))
+
+        def scoped(query):
+            if user_id is not None:
+                return query.where(Detection.user_id == user_id)
+            return query
+
+        def risk_count(level: str):
+            return func.sum(case((Detection.risk_level == level, 1), else_=0))
+
+        totals = scoped(
+            select(
+                Detection.user_id.label("user_id"),
+                day.label("day"),
+                func.count().label("total"),
+                func.sum(case((Detection.is_rumor == True, 1), else_=0)).label("rumors"),
+                func.sum(Detection.confidence).label("confidence_sum"),
+                risk_count("low").label("risk_low"),
+                risk_count("medium").label("risk_medium"),
+                risk_count("high").label("risk_high"),
+                risk_count("critical").label("risk_critical"),
+            ).group_by(Detection.user_id, day)
+        ).subquery()
+
+        per_category = scoped(
+            select(
+                Detection.user_id.label("user_id"),
+                day.label("day"),
+                category.label("category"),
+                func.count().label("count"),
+            )
+            .join(Analysis, Analysis.detection_id == Detection.id)
+            .group_by(Detection.user_id, day, category)
+        ).subquery()
+
+        categories = (
+            select(
+                per_category.c.user_id,
+                per_category.c.day,
+                func.jsonb_object_agg(per_category.c.category, per_category.c.count).label(
+                    "category_counts"
+                ),
+            )
+            .group_by(per_category.c.user_id, per_category.c.day)
+            .subquery()
+        )
+
+        source = select(
+            totals.c.user_id,
+            totals.c.day,
+            totals.c.total,
+            totals.c.rumors,
+            totals.c.confidence_sum,
+            totals.c.risk_low,
+            totals.c.risk_medium,
+            totals.c.risk_high,
+            totals.c.risk_critical,
+            func.coalesce(categories.c.category_counts, literal({}, JSONB)),
+        ).outerjoin(
+            categories,
+            and_(
+                categories.c.user_id == totals.c.user_id,
+                categories.c.day == totals.c.day,
+            ),
+        )
+
+        clear = delete(DetectionDailyRollup)
+        if user_id is not None:
+            clear = clear.where(DetectionDailyRollup.user_id == user_id)
+        await self.db.execute(clear)
+
+        result = await self.db.execute(
+            insert(DetectionDailyRollup).from_select(
+                [
+                    "user_id",
+                    "day",
+                    "total",
+                    "rumors",
+                    "confidence_sum",
+                    "risk_low",
+                    "risk_medium",
+                    "risk_high",
+                    "risk_critical",
+                    "category_counts",
+                ],
+                source,
+            )
+        )
+        return result.rowcount or 0
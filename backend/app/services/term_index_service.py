@@ -0,0 +1,213 @@
+"""Term index service for normalized keyword statistics."""
+
+import uuid
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy import and_, delete, func, literal, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.analytics import UserTermCount
+from app.models.detection import Analysis, Detection
+from app.schemas.analysis import TermField
+
+MAX_TERM_LENGTH = 200
+
+
+def normalize_term(term: object) -> str:
+    """Normalize an analysis term for indexing."""
+    return str(term).strip()[:MAX_TERM_LENGTH]
+
+
+def normalize_terms(terms: Optional[list]) -> list[str]:
+    """
+    Normalize the terms of an analysis field before storing them.
+
+    Stored arrays then hold exactly the indexed terms, so filtering on a
+    term from :meth:`TermIndexService.get_top_terms` finds its rows.
+    """
+    if not isinstance(terms, list):
+        return []
+    return [term for term in map(normalize_term, terms) if term]
+
+
+class TermIndexService:
+    """Service maintaining ``user_term_counts`` alongside analysis writes.
+
+    Like :class:`~app.services.rollup_service.RollupService`, changes are
+    queued with :meth:`add` and written with :meth:`flush` in the caller's
+    transaction.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._pending: dict[tuple[uuid.UUID, str], Counter] = {}
+
+    def add(
+        self,
+        user_id: uuid.UUID,
+        analysis: Analysis,
+        sign: int = 1,
+    ) -> None:
+        """
+        Queue the terms of an analysis insert (``sign=1``) or delete (``sign=-1``).
+
+        Args:
+            user_id: Owner of the analysed detection
+            analysis: The analysis record being written or removed
+            sign: 1 for an insert, -1 for a delete
+        """
+        for field in TermField:
+            terms = getattr(analysis, field.value) or []
+            counter = self._pending.setdefault((user_id, field.value), Counter())
+            for term in terms:
+                term = normalize_term(term)
+                if term:
+                    counter[term] += sign
+
+    async def flush(self) -> None:
+        """Write all queued term deltas in the current transaction."""
+        for (user_id, field), counter in self._pending.items():
+            increments = {term: n for term, n in counter.items() if n > 0}
+            decrements = {term: -n for term, n in counter.items() if n < 0}
+            if increments:
+                await self._apply_increments(user_id, field, increments)
+            if decrements:
+                await self._apply_decrements(user_id, field, decrements)
+        self._pending.clear()
+
+    async def _apply_increments(
+        self,
+        user_id: uuid.UUID,
+        field: str,
+        counts: dict[str, int],
+    ) -> None:
+        """Upsert positive term counts."""
+        stmt = insert(UserTermCount).values(
+            [
+                {"user_id": user_id, "field": field, "term": term, "count": n}
+                for term, n in counts.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                UserTermCount.user_id,
+                UserTermCount.field,
+                UserTermCount.term,
+            ],
+            set_={"count": UserTermCount.count + stmt.excluded.count},
+        )
+        await self.db.execute(stmt)
+
+    async def _apply_decrements(
+        self,
+        user_id: uuid.UUID,
+        field: str,
+        counts: dict[str, int],
+    ) -> None:
+        """Subtract term counts and drop rows that reach zero."""
+        for n in set(counts.values()):
+            terms = [term for term, count in counts.items() if count == n]
+            await self.db.execute(
+                update(UserTermCount)
+                .where(
+                    and_(
+                        UserTermCount.user_id == user_id,
+                        UserTermCount.field == field,
+                        UserTermCount.term.in_(terms),
+                    )
+                )
+                .values(count=UserTermCount.count - n)
+            )
+        await self.db.execute(
+            delete(UserTermCount).where(
+                and_(
+                    UserTermCount.user_id == user_id,
+                    UserTermCount.field == field,
+                    UserTermCount.term.in_(list(counts)),
+                    UserTermCount.count <= 0,
+                )
+            )
+        )
+
+    async def get_top_terms(
+        self,
+        user_id: uuid.UUID,
+        field: TermField = TermField.KEYWORDS,
+        limit: int = 50,
+    ) -> tuple[list[tuple[str, int]], int]:
+        """
+        Get the most frequent terms for a user.
+
+        Returns:
+            Tuple of ((term, count) list, number of distinct terms)
+        """
+        result = await self.db.execute(
+            select(
+                UserTermCount.term,
+                UserTermCount.count,
+                func.count().over().label("distinct_terms"),
+            )
+            .where(
+                and_(
+                    UserTermCount.user_id == user_id,
+                    UserTermCount.field == field.value,
+                    UserTermCount.count > 0,
+                )
+            )
+            .order_by(UserTermCount.count.desc(), UserTermCount.term)
+            .limit(limit)
+        )
+        rows = result.all()
+        top = [(row.term, row.count) for row in rows]
+        return top, rows[0].distinct_terms if rows else 0
+
+    async def backfill(self, user_id: Optional[uuid.UUID] = None) -> int:
+        """
+        Rebuild term counts from the ``analyses`` table.
+
+        Args:
+            user_id: Restrict the rebuild to one user; all users if None
+
+        Returns:
+            Number of term rows written
+        """
+        clear = delete(UserTermCount)
+        if user_id is not None:
+            clear = clear.where(UserTermCount.user_id == user_id)
+        await self.db.execute(clear)
+
+        written = 0
+        for field in TermField:
+            elements = func.jsonb_array_elements_text(
+                getattr(Analysis, field.value)
+            ).table_valued("value").render_derived()
+            term = func.left(func.btrim(elements.c.value), MAX_TERM_LENGTH)
+
+            query = (
+                select(
+                    Detection.user_id,
+                    literal(field.value),
+                    term,
+                    func.count(),
+                )
+                .select_from(Detection)
+                .join(Analysis, Analysis.detection_id == Detection.id)
+                .join(elements, literal_column("true"))
+                .where(
+                    func.jsonb_typeof(getattr(Analysis, field.value)) == "array",
+                    term != "",
+                )
+                .group_by(Detection.user_id, term)
+            )
+            if user_id is not None:
+                query = query.where(Detection.user_id == user_id)
+
+            result = await self.db.execute(
+                insert(UserTermCount).from_select(
+                    ["user_id", "field", "term", "count"], query
+                )
+            )
+            written += result.rowcount or 0
+        return written
@@ -0,0 +1,115 @@
+"""Token revocation."""
+
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pubsub import pg_listener
+from app.core.revocation import revoked_tokens
+from app.models.token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_CHANNEL = "token_revoked"
+
+# Re-read this much before the last sync, for revocations that committed
+# after later ones had already been seen
+_SYNC_OVERLAP = timedelta(minutes=1)
+
+
+def _on_revoked(payload: str) -> None:
+    try:
+        jti, expires_at = payload.split(":")
+        revoked_tokens.add(jti, float(expires_at))
+    except ValueError:
+        logger.warning(f"Ignoring malformed token revocation: {payload!r}")
+
+
+pg_listener.subscribe(REVOCATION_CHANNEL, _on_revoked)
+
+
+class TokenRevocationService:
+    """
+    Service recording revoked tokens.
+
+    ``decode_token`` only consults the per-worker :data:`revoked_tokens`
+    list, so a revocation is added there at once, NOTIFYed to every other
+    worker on commit, and stored in ``revoked_tokens`` for workers that
+    start later or miss the notification (see :meth:`sync`).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def revoke(self, payload: dict) -> bool:
+        """
+        Revoke a decoded token.
+
+        Args:
+            payload: Token claims, including ``jti``, ``sub`` and ``exp``
+
+        Returns:
+            False if the token was already revoked
+        """
+        jti = payload["jti"]
+        expires_at = float(payload["exp"])
+
+        result = await self.db.execute(
+            insert(RevokedToken)
+            .values(
+                jti=jti,
+                user_id=uuid.UUID(payload["sub"]),
+                expires_at=datetime.fromtimestamp(expires_at, timezone.utc),
+                revoked_at=func.clock_timestamp(),
+            )
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.jti)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+
+        revoked_tokens.add(jti, expires_at)
+        await self.db.execute(
+            select(func.pg_notify(REVOCATION_CHANNEL, f"{jti}:{expires_at}"))
+        )
+        return True
+
+    async def sync(self, since: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Load revocations into this worker's list.
+
+        Args:
+            since: Watermark returned by the previous call, or None for all
+
+        Returns:
+            Watermark to pass to the next call
+        """
+        query = select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at).where(
+            RevokedToken.expires_at > func.now()
+        )
+        if since is not None:
+            query = query.where(RevokedToken.revoked_at >= since - _SYNC_OVERLAP)
+
+        result = await self.db.execute(query)
+        rows = result.all()
+        revoked_tokens.update((row.jti, row.expires_at.timestamp()) for row in rows)
+        revoked_tokens.prune()
+
+        return max((row.revoked_at for row in rows), default=since)
+
+    async def purge_expired(self) -> int:
+        """
+        Delete revocations of tokens that have expired anyway.
+
+        Returns:
+            Number of rows deleted
+        """
+        result = await self.db.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= func.now())
+        )
+        return result.rowcount
@@ -0,0 +1,286 @@
+"""Platform-wide trending keyword tracking over sliding time windows."""
+
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.core.config import settings
+from app.schemas.analysis import KeywordStats, TrendingResponse
+from app.utils.sketches import CountMinSketch, HyperLogLog, SpaceSaving
+
+logger = logging.getLogger(__name__)
+
+# window name -> (number of buckets, bucket length in seconds)
+WINDOWS: dict[str, tuple[int, int]] = {
+    "hour": (60, 60),
+    "day": (24, 3600),
+}
+
+
+class _Bucket:
+    """Sketches for one time slice of a window."""
+
+    def __init__(self, epoch: int):
+        self.epoch = epoch
+        self.heavy_hitters = SpaceSaving(settings.TRENDING_CAPACITY)
+        self.frequencies = CountMinSketch(
+            settings.TRENDING_CMS_WIDTH,
+            settings.TRENDING_CMS_DEPTH,
+        )
+        self.keywords = HyperLogLog(settings.TRENDING_HLL_PRECISION)
+        self.users = HyperLogLog(settings.TRENDING_HLL_PRECISION)
+
+    def to_dict(self) -> dict:
+        return {
+            "epoch": self.epoch,
+            "heavy_hitters": self.heavy_hitters.to_dict(),
+            "frequencies": self.frequencies.to_dict(),
+            "keywords": self.keywords.to_dict(),
+            "users": self.users.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_Bucket":
+        bucket = cls.__new__(cls)
+        bucket.epoch = data["epoch"]
+        bucket.heavy_hitters = SpaceSaving.from_dict(data["heavy_hitters"])
+        bucket.frequencies = CountMinSketch.from_dict(data["frequencies"])
+        bucket.keywords = HyperLogLog.from_dict(data["keywords"])
+        bucket.users = HyperLogLog.from_dict(data["users"])
+        return bucket
+
+
+class TrendingTracker:
+    """
+    Track trending keywords across all users with bounded memory.
+
+    Each window is a ring of fixed-length buckets; a bucket holds a
+    Space-Saving summary for top-k candidates, a Count-Min sketch for
+    tighter frequency estimates and HyperLogLogs for distinct keywords and
+    users. Memory is fixed by the window and sketch sizes, independent of
+    traffic. State is per process and can be snapshotted to disk.
+
+    Each process snapshots to its own file, named after its pid. Loading
+    merges every process's snapshot: the process's own file is restored
+    into its rings, the others are kept read-only alongside them and never
+    written back, so no count is saved twice.
+    """
+
+    def __init__(self):
+        self._rings: dict[str, list[Optional[_Bucket]]] = {
+            name: [None] * size for name, (size, _) in WINDOWS.items()
+        }
+        # Buckets restored from other processes' snapshots
+        self._restored: dict[str, list[_Bucket]] = {name: [] for name in WINDOWS}
+
+    def _bucket(self, window: str, now: float) -> _Bucket:
+        size, seconds = WINDOWS[window]
+        epoch = int(now // seconds)
+        ring = self._rings[window]
+        slot = epoch % size
+        bucket = ring[slot]
+        if bucket is None or bucket.epoch != epoch:
+            bucket = ring[slot] = _Bucket(epoch)
+        return bucket
+
+    def record(
+        self,
+        keywords: Iterable[str],
+        user_id: Optional[uuid.UUID] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Record the keywords of one detection.
+
+        Args:
+            keywords: Keywords returned by the detection model
+            user_id: User who ran the detection
+            now: Event time as a UNIX timestamp (defaults to the current time)
+        """
+        now = time.time() if now is None else now
+        terms = [str(k).strip() for k in keywords if str(k).strip()]
+        if not terms:
+            return
+
+        for window in WINDOWS:
+            bucket = self._bucket(window, now)
+            for term in terms:
+                bucket.heavy_hitters.add(term)
+                bucket.frequencies.add(term)
+                bucket.keywords.add(term)
+            if user_id is not None:
+                bucket.users.add(str(user_id))
+
+    def top(
+        self,
+        window: str = "hour",
+        limit: int = 50,
+        now: Optional[float] = None,
+    ) -> tuple[list[tuple[str, int]], int, int]:
+        """
+        Get the trending keywords for a window.
+
+        Returns:
+            Tuple of ((keyword, estimated count) list, distinct keywords,
+            distinct users)
+        """
+        now = time.time() if now is None else now
+        size, seconds = WINDOWS[window]
+        oldest = int(now // seconds) - size + 1
+
+        live = [
+            b
+            for b in self._rings[window] + self._restored[window]
+            if b is not None and b.epoch >= oldest
+        ]
+        if not live:
+            return [], 0, 0
+
+        candidates = SpaceSaving(settings.TRENDING_CAPACITY)
+        frequencies = CountMinSketch(
+            settings.TRENDING_CMS_WIDTH,
+            settings.TRENDING_CMS_DEPTH,
+        )
+        keywords = HyperLogLog(settings.TRENDING_HLL_PRECISION)
+        users = HyperLogLog(settings.TRENDING_HLL_PRECISION)
+        for bucket in live:
+            candidates.merge(bucket.heavy_hitters)
+            frequencies.merge(bucket.frequencies)
+            keywords.merge(bucket.keywords)
+            users.merge(bucket.users)
+
+        # Both summaries overestimate, so the smaller figure is tighter
+        ranked = sorted(
+            (
+                (term, min(count, frequencies.estimate(term)))
+                for term, count in candidates.counts.items()
+            ),
+            key=lambda kv: (-kv[1], kv[0]),
+        )
+        return ranked[:limit], keywords.count(), users.count()
+
+    def to_dict(self) -> dict:
+        return {
+            "windows": {
+                name: [b.to_dict() for b in ring if b is not None]
+                for name, ring in self._rings.items()
+            }
+        }
+
+    def load_dict(self, data: dict, restored: bool = False) -> None:
+        """
+        Merge state produced by :meth:`to_dict`.
+
+        Args:
+            data: Saved state
+            restored: Keep the buckets apart from this tracker's own, so
+                :meth:`to_dict` leaves them out
+        """
+        for name, buckets in data.get("windows", {}).items():
+            if name not in WINDOWS:
+                continue
+            size, _ = WINDOWS[name]
+            ring = self._rings[name]
+            for raw in buckets:
+                bucket = _Bucket.from_dict(raw)
+                if restored:
+                    self._restored[name].append(bucket)
+                    continue
+                slot = bucket.epoch % size
+                current = ring[slot]
+                if current is None or current.epoch < bucket.epoch:
+                    ring[slot] = bucket
+                elif current.epoch == bucket.epoch:
+                    current.heavy_hitters.merge(bucket.heavy_hitters)
+                    current.frequencies.merge(bucket.frequencies)
+                    current.keywords.merge(bucket.keywords)
+                    current.users.merge(bucket.users)
+
+    @staticmethod
+    def _snapshot_base(path: Optional[str]) -> Path:
+        return Path(path or settings.TRENDING_SNAPSHOT_PATH)
+
+    @staticmethod
+    def _process_snapshot(base: Path, pid: int) -> Path:
+        return base.with_name(f"{base.stem}.{pid}{base.suffix}")
+
+    def save_snapshot(
+        self,
+        path: Optional[str] = None,
+        data: Optional[dict] = None,
+    ) -> None:
+        """
+        Atomically write this process's state to its JSON snapshot file.
+
+        Args:
+            path: Snapshot file (defaults to ``TRENDING_SNAPSHOT_PATH``); the
+                pid is inserted before its suffix
+            data: Pre-captured :meth:`to_dict` output, so the file write can
+                run in a worker thread while the tracker keeps changing
+        """
+        target = self._process_snapshot(self._snapshot_base(path), os.getpid())
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_text(json.dumps(data or self.to_dict()), encoding="utf-8")
+        os.replace(tmp, target)
+
+    def load_snapshot(self, path: Optional[str] = None) -> bool:
+        """
+        Merge the snapshots of every process. Returns False if none was loaded.
+
+        Snapshots not written for longer than the longest window hold only
+        expired buckets and are deleted.
+        """
+        base = self._snapshot_base(path)
+        own = self._process_snapshot(base, os.getpid())
+        max_age = max(size * seconds for size, seconds in WINDOWS.values())
+        # The unsuffixed file is a snapshot from before per-process files
+        sources = sorted(base.parent.glob(f"{base.stem}.*{base.suffix}")) + [base]
+
+        loaded = False
+        for source in sources:
+            try:
+                if source != own and time.time() - source.stat().st_mtime > max_age:
+                    source.unlink()
+                    continue
+                self.load_dict(
+                    json.loads(source.read_text(encoding="utf-8")),
+                    restored=source != own,
+                )
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable trending snapshot {source}: {e}")
+                continue
+            loaded = True
+        return loaded
+
+
+# Process-wide tracker fed by DetectionService
+trending_tracker = TrendingTracker()
+
+
+def get_trending_keywords(
+    window: str = "hour",
+    limit: int = 50,
+    tracker: TrendingTracker = trending_tracker,
+) -> TrendingResponse:
+    """Build the trending keywords response for a window."""
+    top, distinct_keywords, distinct_users = tracker.top(window, limit)
+    max_count = top[0][1] if top else 1
+
+    return TrendingResponse(
+        window=window,
+        data=[
+            KeywordStats(keyword=keyword, count=count, weight=count / max_count)
+            for keyword, count in top
+        ],
+        distinct_keywords=distinct_keywords,
+        distinct_users=distinct_users,
+        generated_at=datetime.now(timezone.utc),
+    )
@@ -0,0 +1,56 @@
+"""Loading the preprocessed Ma-Weibo dataset for offline tools."""
+
+from typing import Optional, Sequence
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # CSV only
+    pa = None
+
+
+def _require_pyarrow(path: str) -> None:
+    if pa is None:
+        raise RuntimeError(f"Reading {path} requires pyarrow")
+
+
+def load_table(path: str, columns: Optional[Sequence[str]] = None) -> "pa.Table":
+    """
+    Load a columnar dataset file written by ``data/preprocess.py``.
+
+    Arrow IPC files are memory-mapped and their columns reference the
+    mapping directly, so loading costs no copies and only the pages of
+    columns actually read are paged in. Parquet is decompressed, reading
+    through a memory map.
+
+    Args:
+        path: ``.arrow`` or ``.parquet`` file
+        columns: Columns to keep (all by default)
+
+    Returns:
+        The table
+    """
+    _require_pyarrow(path)
+    if path.endswith(".parquet"):
+        return pq.read_table(path, columns=columns, memory_map=True)
+
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return table.select(list(columns)) if columns else table
+
+
+def read_frame(path: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Load a dataset file as a DataFrame, whatever its format.
+
+    CSV event ids are read as strings so long ids don't lose precision.
+
+    Args:
+        path: ``.csv``, ``.arrow`` or ``.parquet`` file
+        columns: Columns to keep (all by default)
+    """
+    if path.endswith(".csv"):
+        return pd.read_csv(path, usecols=columns, dtype={"event_id": str})
+    return load_table(path, columns).to_pandas()
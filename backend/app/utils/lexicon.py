@@ -0,0 +1,160 @@
+"""Multi-pattern phrase matching over category lexicons (Aho-Corasick)."""
+
+import os
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Mapping, NamedTuple, Optional, Sequence
+
+from app.core.config import settings
+
+# Exaggeration pattern categories, in the order they are reported
+PATTERN_CATEGORIES = ("urgent_language", "vague_source", "emotional_manipulation")
+
+
+class LexiconMatch(NamedTuple):
+    """One occurrence of a lexicon term in a text."""
+
+    category: str
+    term: str
+    # Character span, ``text[start:end] == term``
+    start: int
+    end: int
+
+
+class LexiconMatcher:
+    """
+    Aho-Corasick automaton over the terms of several category lexicons.
+
+    The automaton is built once; each text is then scanned in a single
+    pass regardless of how many terms there are. Every occurrence is
+    reported, overlapping ones included.
+    """
+
+    def __init__(self, lexicons: Mapping[str, Iterable[str]]):
+        self.categories = list(lexicons)
+        # Per node: transitions, failure link, (category, term) outputs
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[str, str]]] = [[]]
+        # (category, term) -> position in its lexicon, for stable ordering
+        self._rank: dict[tuple[str, str], tuple[int, int]] = {}
+
+        for category_index, (category, terms) in enumerate(lexicons.items()):
+            for term_index, term in enumerate(terms):
+                if not term or (category, term) in self._rank:
+                    continue
+                self._rank[(category, term)] = (category_index, term_index)
+                self._insert(category, term)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._rank)
+
+    def _insert(self, category: str, term: str) -> None:
+        node = 0
+        for char in term:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+        self._out[node].append((category, term))
+
+    def _link(self) -> None:
+        # Breadth-first, so a node's failure target is always linked first
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit the outputs of the longest proper suffix
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> list[LexiconMatch]:
+        """
+        Find every lexicon term occurring in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matches ordered by end position
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for category, term in out[node]:
+                end = position + 1
+                matches.append(LexiconMatch(category, term, end - len(term), end))
+        return matches
+
+    def find_all_batch(self, texts: Iterable[str]) -> list[list[LexiconMatch]]:
+        """Find lexicon terms in each of several texts, in input order."""
+        return [self.find_all(text) for text in texts]
+
+    def matched_terms(self, text: str) -> list[tuple[str, str]]:
+        """
+        Get the distinct ``(category, term)`` pairs occurring in a text.
+
+        Returns:
+            Pairs in lexicon order: by category, then by the term's position
+            in its lexicon file
+        """
+        found = {(match.category, match.term) for match in self.find_all(text)}
+        return sorted(found, key=self._rank.__getitem__)
+
+    @classmethod
+    def from_directory(
+        cls,
+        path: str,
+        categories: Sequence[str] = (),
+    ) -> "LexiconMatcher":
+        """
+        Build a matcher from a directory of ``<category>.txt`` lexicons.
+
+        Files hold one term per line; blank lines and lines starting with
+        ``#`` are ignored.
+
+        Args:
+            path: Lexicon directory
+            categories: Categories to order first; the rest follow by name
+        """
+        found = sorted(
+            os.path.splitext(name)[0]
+            for name in os.listdir(path)
+            if name.endswith(".txt")
+        )
+        ordered = [c for c in categories if c in found]
+        ordered += [c for c in found if c not in ordered]
+        return cls({c: load_lexicon(os.path.join(path, f"{c}.txt")) for c in ordered})
+
+
+def load_lexicon(path: str) -> list[str]:
+    """Read one lexicon file, keeping term order."""
+    with open(path, encoding="utf-8") as f:
+        return [
+            line.strip()
+            for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+@lru_cache
+def get_pattern_matcher(path: Optional[str] = None) -> LexiconMatcher:
+    """Get the process-wide matcher for ``LEXICON_PATTERNS_DIR``, built on first use."""
+    return LexiconMatcher.from_directory(
+        path or settings.LEXICON_PATTERNS_DIR,
+        PATTERN_CATEGORIES,
+    )
@@ -0,0 +1,72 @@
+"""SimHash fingerprints and LSH banding for near-duplicate text."""
+
+from typing import Iterable
+
+from app.utils.sketches import stable_hash
+
+FINGERPRINT_BITS = 64
+
+
+def simhash(tokens: Iterable[str]) -> int:
+    """
+    Compute the 64-bit SimHash of a set of tokens.
+
+    Texts differing in a few tokens get fingerprints differing in a few
+    bits, so Hamming distance approximates textual distance. Each distinct
+    token counts once: in short posts a repeated hashtag would otherwise
+    outweigh real edits.
+
+    Args:
+        tokens: Tokens of the text
+
+    Returns:
+        Unsigned 64-bit fingerprint
+    """
+    weights = [0] * FINGERPRINT_BITS
+    for token in set(tokens):
+        h = stable_hash(token)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin((a ^ b) & ((1 << FINGERPRINT_BITS) - 1)).count("1")
+
+
+def band_keys(fingerprint: int, bands: int) -> list[int]:
+    """
+    Split a fingerprint into ``bands`` keys for LSH lookup.
+
+    Two fingerprints within distance ``bands - 1`` agree exactly on at
+    least one band, so a lookup on any shared key finds every such match.
+    Each key encodes the band number with its bits so keys of different
+    bands never collide.
+
+    Args:
+        fingerprint: Unsigned 64-bit fingerprint
+        bands: Number of bands; at least 2, so each key fits a signed
+            64-bit column
+
+    Returns:
+        One key per band
+    """
+    width = -(-FINGERPRINT_BITS // bands)
+    mask = (1 << width) - 1
+    return [(band << width) | (fingerprint >> (band * width) & mask) for band in range(bands)]
+
+
+def to_signed(fingerprint: int) -> int:
+    """Map an unsigned 64-bit fingerprint into PostgreSQL's BIGINT range."""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def to_unsigned(value: int) -> int:
+    """Inverse of :func:`to_signed`."""
+    return value + (1 << 64) if value < 0 else value
@@ -0,0 +1,187 @@
+"""Bounded-memory streaming sketches for frequency and cardinality estimates."""
+
+import base64
+import hashlib
+import math
+from array import array
+from typing import Iterable
+
+
+def stable_hash(value: str, seed: int = 0) -> int:
+    """
+    Hash a string to an unsigned 64-bit integer.
+
+    Unlike the built-in ``hash``, the result is stable across processes, so
+    sketches can be snapshotted and restored after a restart.
+
+    Args:
+        value: String to hash
+        seed: Distinguishes independent hash functions
+
+    Returns:
+        64-bit hash value
+    """
+    digest = hashlib.blake2b(
+        value.encode("utf-8"),
+        digest_size=8,
+        salt=seed.to_bytes(8, "little"),
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _encode_array(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode_array(typecode: str, encoded: str) -> array:
+    values = array(typecode)
+    values.frombytes(base64.b64decode(encoded))
+    return values
+
+
+class CountMinSketch:
+    """Count-Min sketch: never underestimates, overestimates by at most eN/width."""
+
+    def __init__(self, width: int = 1024, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.table = array("Q", bytes(8 * width * depth))
+
+    def _cells(self, item: str) -> Iterable[int]:
+        for row in range(self.depth):
+            yield row * self.width + stable_hash(item, row) % self.width
+
+    def add(self, item: str, count: int = 1) -> None:
+        """Add occurrences of an item."""
+        for cell in self._cells(item):
+            self.table[cell] += count
+
+    def estimate(self, item: str) -> int:
+        """Estimate how many times an item was added."""
+        return min(self.table[cell] for cell in self._cells(item))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Add another sketch with identical dimensions into this one."""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge Count-Min sketches of different sizes")
+        for i, value in enumerate(other.table):
+            if value:
+                self.table[i] += value
+
+    def to_dict(self) -> dict:
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "table": _encode_array(self.table),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CountMinSketch":
+        sketch = cls(data["width"], data["depth"])
+        sketch.table = _decode_array("Q", data["table"])
+        return sketch
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitter summary holding at most ``capacity`` counters.
+
+    Every item whose true frequency exceeds N/capacity is guaranteed to be
+    tracked; tracked counts overestimate by at most the recorded error.
+    """
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+
+    def add(self, item: str, count: int = 1) -> None:
+        """Add occurrences of an item, evicting the minimum counter if full."""
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            return
+
+        victim = min(self.counts, key=self.counts.__getitem__)
+        floor = self.counts.pop(victim)
+        self.errors.pop(victim, None)
+        self.counts[item] = floor + count
+        self.errors[item] = floor
+
+    def top(self, limit: int) -> list[tuple[str, int]]:
+        """Return the ``limit`` largest counters."""
+        return sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Merge another summary, keeping the ``capacity`` largest counters."""
+        for item, count in other.counts.items():
+            self.counts[item] = self.counts.get(item, 0) + count
+            self.errors[item] = self.errors.get(item, 0) + other.errors.get(item, 0)
+        if len(self.counts) > self.capacity:
+            keep = dict(self.top(self.capacity))
+            self.errors = {item: self.errors[item] for item in keep}
+            self.counts = keep
+
+    def to_dict(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "counts": self.counts,
+            "errors": self.errors,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpaceSaving":
+        summary = cls(data["capacity"])
+        summary.counts = dict(data["counts"])
+        summary.errors = dict(data["errors"])
+        return summary
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter with 2**precision one-byte registers."""
+
+    def __init__(self, precision: int = 10):
+        if not 4 <= precision <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, item: str) -> None:
+        """Observe an item."""
+        value = stable_hash(item)
+        index = value >> (64 - self.precision)
+        remaining = value & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        """Estimate the number of distinct items observed."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Union another counter with the same precision into this one."""
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLogs of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def to_dict(self) -> dict:
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(bytes(self.registers)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HyperLogLog":
+        counter = cls(data["precision"])
+        counter.registers = bytearray(base64.b64decode(data["registers"]))
+        return counter
@@ -0,0 +1,146 @@
+"""Batched, multi-process segmentation and keyword extraction."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional, Sequence
+
+from app.core.config import settings
+from app.utils import text_processor
+
+
+class ProcessedText(NamedTuple):
+    """Segmentation and keywords for one text."""
+
+    words: list[str]
+    keywords: list[str]
+
+
+class BatchStats(NamedTuple):
+    """Throughput of one batch run."""
+
+    texts: int
+    workers: int
+    seconds: float
+
+    @property
+    def texts_per_second(self) -> float:
+        return self.texts / self.seconds if self.seconds else 0.0
+
+    @property
+    def texts_per_second_per_worker(self) -> float:
+        return self.texts_per_second / self.workers
+
+
+def _process_chunk(texts: Sequence[str], top_n: int) -> list[ProcessedText]:
+    text_processor.initialize()
+    return [
+        ProcessedText(
+            text_processor.segment_text(text),
+            text_processor.extract_keywords(text, top_n),
+        )
+        for text in texts
+    ]
+
+
+def _default_workers() -> int:
+    return settings.TEXT_PROCESS_WORKERS or os.cpu_count() or 1
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn, not fork: the caller may be a threaded server process
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=text_processor.initialize,
+    )
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _new_pool(_default_workers())
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the shared worker processes, if they were started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def _map_chunks(
+    pool: ProcessPoolExecutor,
+    chunks: list[Sequence[str]],
+    top_n: int,
+) -> list[ProcessedText]:
+    results = []
+    # map() yields in submission order, so results line up with the input
+    for chunk_results in pool.map(_process_chunk, chunks, [top_n] * len(chunks)):
+        results.extend(chunk_results)
+    return results
+
+
+def process_texts(
+    texts: Sequence[str],
+    top_n: int = 10,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> tuple[list[ProcessedText], BatchStats]:
+    """
+    Segment texts and extract their keywords across worker processes.
+
+    Texts are processed in chunks of ``chunk_size`` by worker processes
+    that each warm jieba once. By default they go to a shared pool of
+    ``TEXT_PROCESS_WORKERS`` processes (one per CPU if unset) that lives
+    until :func:`shutdown_pool`; an explicit ``workers`` count gets a
+    dedicated pool for this call. A single chunk, or ``workers=1``, runs
+    in-process.
+
+    Args:
+        texts: Texts to process
+        top_n: Keywords per text
+        workers: Worker processes for a dedicated pool
+        chunk_size: Texts per task (defaults to ``TEXT_PROCESS_CHUNK_SIZE``)
+
+    Returns:
+        Tuple of (results in input order, throughput stats)
+    """
+    chunk_size = chunk_size or settings.TEXT_PROCESS_CHUNK_SIZE
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    start = time.perf_counter()
+    if workers == 1 or len(chunks) <= 1:
+        used_workers = 1
+        results = _process_chunk(texts, top_n)
+    elif workers is None:
+        used_workers = min(_default_workers(), len(chunks))
+        results = _map_chunks(_get_pool(), chunks, top_n)
+    else:
+        used_workers = min(workers, len(chunks))
+        with _new_pool(used_workers) as pool:
+            results = _map_chunks(pool, chunks, top_n)
+
+    stats = BatchStats(len(texts), used_workers, time.perf_counter() - start)
+    return results, stats
+
+
+async def process_texts_async(
+    texts: Sequence[str],
+    top_n: int = 10,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> tuple[list[ProcessedText], BatchStats]:
+    """Run :func:`process_texts` without blocking the event loop."""
+    return await asyncio.to_thread(process_texts, texts, top_n, workers, chunk_size)
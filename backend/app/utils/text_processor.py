@@ -1,10 +1,68 @@
 """Text processing utilities for rumor detection."""
 
+import importlib
+import logging
+import os
 import re
-from typing import List
+import threading
+from typing import Iterable, List
 
 import jieba
 
+from app.core.config import settings
+from app.utils.lexicon import get_pattern_matcher
+
+logger = logging.getLogger(__name__)
+
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def initialize() -> None:
+    """
+    Load jieba's dictionaries ahead of the first request.
+
+    Builds (or reads from ``JIEBA_CACHE_DIR``) the prefix dictionary,
+    loads the user dictionary and the keyword IDF table, and compiles the
+    exaggeration pattern lexicons. Safe to call
+    repeatedly and from several threads; only the first call does work.
+    """
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+
+        os.makedirs(settings.JIEBA_CACHE_DIR, exist_ok=True)
+        jieba.dt.tmp_dir = settings.JIEBA_CACHE_DIR
+        jieba.initialize()
+
+        user_dict = settings.JIEBA_USER_DICT_PATH
+        if user_dict and os.path.exists(user_dict):
+            jieba.load_userdict(user_dict)
+        elif user_dict:
+            logger.warning(f"jieba user dictionary not found: {user_dict}")
+
+        # Importing jieba.analyse loads the IDF table
+        importlib.import_module("jieba.analyse")
+        get_pattern_matcher()
+
+        _initialized = True
+
+
+_URLS = re.compile(r"http[s]?://\S+")
+_MENTIONS = re.compile(r"@\S+")
+_HASHTAGS = re.compile(r"#(\S+)#")
+_WHITESPACE = re.compile(r"\s+")
+
+# Single characters are dropped anyway; these are common multi-use words
+STOPWORDS = frozenset({
+    "的", "了", "是", "在", "我", "有", "和", "就", "不", "人",
+    "都", "一", "一个", "上", "也", "很", "到", "说", "要", "去",
+    "你", "会", "着", "没有", "看", "好", "自己", "这", "那", "他",
+})
+
 
 def clean_text(text: str) -> str:
     """
@@ -17,16 +75,16 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove URLs
-    text = re.sub(r"http[s]?://\S+", "", text)
+    text = _URLS.sub("", text)
 
     # Remove @mentions
-    text = re.sub(r"@\S+", "", text)
+    text = _MENTIONS.sub("", text)
 
     # Remove hashtags (keep the text, remove #)
-    text = re.sub(r"#(\S+)#", r"\1", text)
+    text = _HASHTAGS.sub(r"\1", text)
 
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE.sub(" ", text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -44,6 +102,8 @@ def segment_text(text: str) -> List[str]:
     Returns:
         List of words
     """
+    initialize()
+
     # Clean text first
     cleaned = clean_text(text)
 
@@ -51,17 +111,11 @@ def segment_text(text: str) -> List[str]:
     words = jieba.cut(cleaned, cut_all=False)
 
     # Filter out single characters and common stopwords
-    stopwords = {
-        "的", "了", "是", "在", "我", "有", "和", "就", "不", "人",
-        "都", "一", "一个", "上", "也", "很", "到", "说", "要", "去",
-        "你", "会", "着", "没有", "看", "好", "自己", "这", "那", "他",
-    }
-
-    filtered = [
-        word.strip()
-        for word in words
-        if len(word.strip()) > 1 and word.strip() not in stopwords
-    ]
+    filtered = []
+    for word in words:
+        word = word.strip()
+        if len(word) > 1 and word not in STOPWORDS:
+            filtered.append(word)
 
     return filtered
 
@@ -77,44 +131,43 @@ def extract_keywords(text: str, top_n: int = 10) -> List[str]:
     Returns:
         List of keywords
     """
+    initialize()
     import jieba.analyse
 
     keywords = jieba.analyse.extract_tags(text, topK=top_n)
     return list(keywords)
 
 
+_LARGE_NUMBERS = re.compile(r"[0-9]+万|[0-9]+亿|数万|数十万|数百万")
+
+
 def detect_exaggeration_patterns(text: str) -> List[str]:
     """
     Detect common exaggeration patterns in text.
 
+    Lexicon phrases are matched in a single pass with the automaton from
+    :func:`app.utils.lexicon.get_pattern_matcher`.
+
     Args:
         text: Text to analyze
 
     Returns:
-        List of detected patterns
+        List of detected patterns, e.g. ``large_numbers`` or
+        ``urgent_language:紧急``
     """
     patterns = []
 
     # Check for exaggerated numbers
-    if re.search(r"[0-9]+万|[0-9]+亿|数万|数十万|数百万", text):
+    if _LARGE_NUMBERS.search(text):
         patterns.append("large_numbers")
 
-    # Check for urgent language
-    urgent_words = ["紧急", "速看", "快转", "震惊", "惊爆", "重磅", "突发"]
-    for word in urgent_words:
-        if word in text:
-            patterns.append(f"urgent_language:{word}")
+    # Urgent language, vague sources and emotional manipulation
+    for category, term in get_pattern_matcher().matched_terms(text):
+        patterns.append(f"{category}:{term}")
 
-    # Check for vague sources
-    vague_sources = ["据说", "听说", "有人说", "网传", "传言"]
-    for source in vague_sources:
-        if source in text:
-            patterns.append(f"vague_source:{source}")
+    return patterns
 
-    # Check for emotional manipulation
-    emotional_words = ["一定要看", "不转不是", "良心", "必须转发"]
-    for word in emotional_words:
-        if word in text:
-            patterns.append(f"emotional_manipulation:{word}")
 
-    return patterns
+def detect_exaggeration_patterns_batch(texts: Iterable[str]) -> List[List[str]]:
+    """Detect exaggeration patterns in each of several texts, in input order."""
+    return [detect_exaggeration_patterns(text) for text in texts]
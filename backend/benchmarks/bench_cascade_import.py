@@ -0,0 +1,128 @@
+"""
+Cascade import throughput: ORM inserts vs. asyncpg COPY.
+
+Writes synthetic repost cascades in the Ma-Weibo JSON layout, parses them
+with ``read_event_cascade`` and stores each one twice, once as ORM
+``PropagationNode`` objects flushed in a batch and once through
+``CascadeImportService`` (COPY). Runs against the configured database
+inside a transaction that is rolled back, so nothing is kept.
+
+Usage (from backend/):
+    python -m benchmarks.bench_cascade_import [--nodes 20000] [--cascades 3]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+import uuid
+
+from app.core.database import async_session_maker, engine
+from app.models.detection import Detection, PropagationNode
+from app.models.user import User
+from app.services.cascade_import_service import CascadeImportService, read_event_cascade
+from app.utils.text_processor import initialize
+
+
+def _write_cascade(path: str, nodes: int, rng: random.Random) -> None:
+    start = 1_400_000_000
+    posts = [{"id": "0", "mid": "0", "text": "网传某市明天将全面封城，请大家提前囤货", "uid": 1, "t": start}]
+    for i in range(1, nodes):
+        # Preferential attachment: early and popular posts collect reposts
+        parent = posts[int(rng.random() ** 3 * i)]["mid"]
+        posts.append({
+            "mid": str(i),
+            "parent": parent,
+            "uid": rng.randrange(10**9),
+            "username": f"user{i}",
+            "followers_count": int(rng.paretovariate(1.2) * 50),
+            "reposts_count": 0,
+            "t": start + int(rng.expovariate(1 / 3600) * (1 + i / nodes)),
+            "text": "转发微博",
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(posts, f, ensure_ascii=False)
+
+
+async def _orm_insert(session, user_id: uuid.UUID, event) -> float:
+    detection_id = uuid.uuid4()
+    session.add(Detection(
+        id=detection_id,
+        user_id=user_id,
+        content=event.content,
+        is_rumor=True,
+        confidence=0.0,
+        risk_level="critical",
+    ))
+    start = time.perf_counter()
+    session.add_all(
+        PropagationNode(
+            detection_id=detection_id,
+            node_id=node[2],
+            parent_id=node[3],
+            content=node[4],
+            user_info=json.loads(node[5]),
+            engagement=json.loads(node[6]),
+            timestamp=node[7],
+        )
+        for node in event.nodes
+    )
+    await session.flush()
+    return time.perf_counter() - start
+
+
+async def main(nodes: int, cascades: int, seed: int) -> None:
+    initialize()
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        parsed = []
+        parse_seconds = 0.0
+        for i in range(cascades):
+            path = os.path.join(tmp, f"{i}.json")
+            _write_cascade(path, nodes, rng)
+            start = time.perf_counter()
+            parsed.append(read_event_cascade((f"bench{i}", 1, path, uuid.uuid4())))
+            parse_seconds += time.perf_counter() - start
+
+    total = nodes * cascades
+    print(f"{cascades} cascades of {nodes} nodes")
+    print(f"  parse              {parse_seconds:8.2f}s  {total / parse_seconds:>12,.0f} nodes/s")
+
+    async with async_session_maker() as session:
+        transaction = await session.begin()
+        user = User(
+            email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            username=f"bench-{uuid.uuid4().hex[:8]}",
+            hashed_password="x",
+        )
+        session.add(user)
+        await session.flush()
+
+        orm_seconds = 0.0
+        for event in parsed:
+            orm_seconds += await _orm_insert(session, user.id, event)
+
+        service = CascadeImportService(session)
+        start = time.perf_counter()
+        for event in parsed:
+            await service.import_event(user.id, event)
+        copy_seconds = time.perf_counter() - start
+
+        await transaction.rollback()
+
+    print(f"  ORM add_all+flush  {orm_seconds:8.2f}s  {total / orm_seconds:>12,.0f} nodes/s")
+    print(f"  COPY               {copy_seconds:8.2f}s  {total / copy_seconds:>12,.0f} nodes/s")
+    print(f"  speedup            {orm_seconds / copy_seconds:8.1f}x")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark cascade import")
+    parser.add_argument("--nodes", type=int, default=20000, help="Nodes per cascade")
+    parser.add_argument("--cascades", type=int, default=3, help="Number of cascades")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    asyncio.run(main(args.nodes, args.cascades, args.seed))
@@ -0,0 +1,93 @@
+"""
+Exaggeration lexicon matching: per-term substring scans vs. Aho-Corasick.
+
+Pads the shipped pattern lexicons with synthetic phrases up to ``--terms``
+entries, generates ``--posts`` Weibo-length posts, and times both
+approaches over the same inputs, checking they agree.
+
+Usage (from backend/):
+    python -m benchmarks.bench_lexicon [--posts 10000] [--terms 3000]
+"""
+
+import argparse
+import random
+import time
+
+from app.core.config import settings
+from app.utils.lexicon import PATTERN_CATEGORIES, LexiconMatcher, load_lexicon
+
+# Common characters to build filler text and synthetic phrases from
+ALPHABET = (
+    "的一是不了人我在有他这为之大来以个中上们到说国和地也子时道出而要于就下得可你年生"
+    "自会那后能对着事其里所去行过家十用发天如然作方成者多日都三小军二无同么经法当起与"
+    "好看学进种将还分此心前面又定见只主没公从"
+)
+
+
+def _build_lexicons(terms: int, rng: random.Random) -> dict[str, list[str]]:
+    path = settings.LEXICON_PATTERNS_DIR
+    lexicons = {c: load_lexicon(f"{path}/{c}.txt") for c in PATTERN_CATEGORIES}
+    total = sum(len(words) for words in lexicons.values())
+    for i in range(max(terms - total, 0)):
+        phrase = "".join(rng.choices(ALPHABET, k=rng.randint(3, 6)))
+        lexicons[PATTERN_CATEGORIES[i % len(PATTERN_CATEGORIES)]].append(phrase)
+    return lexicons
+
+
+def _build_posts(posts: int, lexicons: dict[str, list[str]], rng: random.Random) -> list[str]:
+    vocabulary = [term for words in lexicons.values() for term in words]
+    texts = []
+    for _ in range(posts):
+        parts = ["".join(rng.choices(ALPHABET, k=rng.randint(20, 60))) for _ in range(3)]
+        for _ in range(rng.randint(0, 3)):
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(vocabulary))
+        texts.append("，".join(parts))
+    return texts
+
+
+def _naive(texts: list[str], lexicons: dict[str, list[str]]) -> list[list[tuple[str, str]]]:
+    results = []
+    for text in texts:
+        found = []
+        for category, words in lexicons.items():
+            for word in dict.fromkeys(words):
+                if word in text:
+                    found.append((category, word))
+        results.append(found)
+    return results
+
+
+def main(posts: int, terms: int, seed: int) -> None:
+    rng = random.Random(seed)
+    lexicons = _build_lexicons(terms, rng)
+    texts = _build_posts(posts, lexicons, rng)
+    chars = sum(len(text) for text in texts)
+    print(f"{posts} posts ({chars / posts:.0f} chars avg), {sum(map(len, lexicons.values()))} terms")
+
+    start = time.perf_counter()
+    expected = _naive(texts, lexicons)
+    naive_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = LexiconMatcher(lexicons)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [matcher.matched_terms(text) for text in texts]
+    scan_seconds = time.perf_counter() - start
+
+    assert actual == expected, "automaton and substring scan disagree"
+    print(f"substring scan  {naive_seconds:8.3f} s  {posts / naive_seconds:10.0f} posts/s")
+    print(
+        f"aho-corasick    {scan_seconds:8.3f} s  {posts / scan_seconds:10.0f} posts/s"
+        f"  (build {build_seconds * 1000:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark exaggeration lexicon matching")
+    parser.add_argument("--posts", type=int, default=10_000, help="Number of posts")
+    parser.add_argument("--terms", type=int, default=3_000, help="Total lexicon size")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    main(args.posts, args.terms, args.seed)
@@ -0,0 +1,78 @@
+"""
+Event-loop lag during a login storm.
+
+Runs N concurrent bcrypt verifications either inline on the event loop
+(the old behaviour) or on the bounded hashing pool in ``app.core.security``
+while a ticker measures how late the loop wakes up. Lag is what every
+other request on the worker would wait.
+
+Usage (from backend/):
+    python -m benchmarks.bench_login_storm [--logins 50] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import bcrypt
+
+from app.core import security
+
+TICK_SECONDS = 0.005
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(time.perf_counter() - expected, 0.0) * 1000)
+
+
+async def _inline_verify(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+
+async def _run(verify, logins: int, password: str, hashed: str) -> tuple[list[float], float]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(TICK_SECONDS * 2)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(verify(password, hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    return lags, elapsed
+
+
+def _report(label: str, lags: list[float], elapsed: float, logins: int) -> None:
+    ordered = sorted(lags) or [0.0]
+    p99 = ordered[min(int(0.99 * len(ordered)), len(ordered) - 1)]
+    print(
+        f"{label:<10} loop lag p50={statistics.median(ordered):8.1f} ms  "
+        f"p99={p99:8.1f} ms  max={ordered[-1]:8.1f} ms  "
+        f"throughput={logins / elapsed:6.1f} logins/s"
+    )
+
+
+async def main(logins: int, rounds: int) -> None:
+    password = "correct horse battery staple"
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+    print(f"{logins} concurrent logins, bcrypt cost {rounds}, pool of {security.settings.BCRYPT_MAX_THREADS}")
+
+    lags, elapsed = await _run(_inline_verify, logins, password, hashed)
+    _report("inline", lags, elapsed, logins)
+
+    lags, elapsed = await _run(security.verify_password, logins, password, hashed)
+    _report("offloaded", lags, elapsed, logins)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure event-loop lag under concurrent logins")
+    parser.add_argument("--logins", type=int, default=50, help="Concurrent verifications")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds))
@@ -0,0 +1,56 @@
+"""
+Throughput of batched segmentation and keyword extraction.
+
+Processes the same synthetic posts in-process and on worker pools of
+increasing size, reporting texts/s overall and per worker.
+
+Usage (from backend/):
+    python -m benchmarks.bench_text_batch [--posts 20000] [--workers 1 2 4]
+"""
+
+import argparse
+import os
+import random
+
+from app.utils.text_batch import process_texts
+
+SENTENCES = [
+    "网传某地自来水被污染，市民请勿饮用",
+    "官方通报称该消息不实，已对造谣者依法处理",
+    "专家提醒，秋冬季节要注意预防流感",
+    "吃瓜群众纷纷转发，话题迅速登上热搜",
+    "据说喝醋可以预防病毒感染，医生表示没有科学依据",
+    "突发！某高速公路发生多车追尾事故",
+    "微博辟谣：网传图片系多年前旧图",
+    "今天天气不错，适合出门散步",
+]
+
+
+def main(posts: int, worker_counts: list[int], chunk_size: int, seed: int) -> None:
+    rng = random.Random(seed)
+    texts = ["，".join(rng.choices(SENTENCES, k=rng.randint(2, 5))) for _ in range(posts)]
+    print(f"{posts} posts, chunks of {chunk_size}, {os.cpu_count()} CPUs")
+
+    baseline = None
+    for workers in worker_counts:
+        results, stats = process_texts(texts, workers=workers, chunk_size=chunk_size)
+        if baseline is None:
+            baseline = results
+        assert results == baseline, "results differ between worker counts"
+        print(
+            f"workers={workers:<3} {stats.seconds:8.2f} s  "
+            f"{stats.texts_per_second:9.0f} texts/s  "
+            f"{stats.texts_per_second_per_worker:9.0f} texts/s/worker"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched text processing")
+    parser.add_argument("--posts", type=int, default=20_000, help="Number of posts")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to try"
+    )
+    parser.add_argument("--chunk-size", type=int, default=500, help="Texts per task")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    main(args.posts, args.workers, args.chunk_size, args.seed)
@@ -0,0 +1,98 @@
+"""
+Input-token savings and accuracy impact of prompt compression.
+
+Token savings are computed offline over the whole labeled dataset (the
+source posts written by data/preprocess.py, in any of its formats). With
+``--evaluate N``, N sampled posts are also sent to the model twice, raw
+and compressed, to compare accuracy against the labels; this makes 2N API
+calls.
+
+Usage (from backend/):
+    python -m benchmarks.report_prompt_compression [--dataset PATH] [--evaluate 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+
+from app.core.config import settings
+from app.services.deepseek_service import DeepSeekService
+from app.utils.dataset import read_frame
+from app.utils.prompt_compressor import compress, estimate_tokens
+
+
+def _token_report(texts: list[str], budget: int, label: str) -> None:
+    results = [compress(text, budget) for text in texts]
+    before = [r.original_tokens for r in results]
+    after = [r.tokens for r in results]
+    trimmed = sum(1 for r in results if r.dropped_sentences)
+    saved = 1 - sum(after) / max(sum(before), 1)
+
+    print(f"\n{label} (budget {budget} tokens)")
+    print(f"  input tokens     {sum(before):>10} -> {sum(after):>10}  ({saved:.1%} saved)")
+    print(f"  mean per post    {statistics.mean(before):>10.1f} -> {statistics.mean(after):>10.1f}")
+    print(f"  max per post     {max(before):>10} -> {max(after):>10}")
+    print(f"  posts trimmed    {trimmed:>10} ({trimmed / len(results):.1%})")
+
+
+async def _evaluate(texts: list[str], labels: list[bool], concurrency: int) -> None:
+    # Inputs are prepared here, so the service must send them unchanged
+    settings.PROMPT_COMPRESSION_ENABLED = False
+    service = DeepSeekService()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def detect(text: str) -> bool:
+        async with semaphore:
+            return (await service.detect_rumor(text))["is_rumor"]
+
+    compressed = [compress(text, settings.PROMPT_MAX_INPUT_TOKENS).text or text for text in texts]
+    raw_verdicts = await asyncio.gather(*(detect(text) for text in texts))
+    compressed_verdicts = await asyncio.gather(*(detect(text) for text in compressed))
+
+    def accuracy(verdicts: list[bool]) -> float:
+        return sum(v == label for v, label in zip(verdicts, labels)) / len(labels)
+
+    agreement = sum(a == b for a, b in zip(raw_verdicts, compressed_verdicts)) / len(labels)
+    raw_tokens = sum(estimate_tokens(text) for text in texts)
+    compressed_tokens = sum(estimate_tokens(text) for text in compressed)
+
+    print(f"\nModel evaluation on {len(texts)} posts")
+    print(f"  accuracy raw          {accuracy(raw_verdicts):.1%}  ({raw_tokens} input tokens)")
+    print(f"  accuracy compressed   {accuracy(compressed_verdicts):.1%}  ({compressed_tokens} input tokens)")
+    print(f"  verdict agreement     {agreement:.1%}")
+
+
+def main(dataset: str, evaluate: int, concurrency: int, seed: int) -> None:
+    df = read_frame(dataset, ["text", "is_rumor"]).dropna(subset=["text"])
+    texts = df["text"].astype(str).tolist()
+    print(f"{len(texts)} posts from {dataset}")
+
+    _token_report(texts, settings.PROMPT_MAX_INPUT_TOKENS, "Single detection")
+    _token_report(texts, settings.PROMPT_BATCH_ITEM_MAX_TOKENS, "Batch item")
+
+    if evaluate:
+        sample = df.sample(n=min(evaluate, len(df)), random_state=seed)
+        asyncio.run(_evaluate(
+            sample["text"].astype(str).tolist(),
+            sample["is_rumor"].astype(bool).tolist(),
+            concurrency,
+        ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report prompt compression savings")
+    parser.add_argument(
+        "--dataset",
+        default="data/processed/weibo_rumors.csv",
+        help="Labeled source posts (.csv, .arrow or .parquet) with text and is_rumor columns",
+    )
+    parser.add_argument(
+        "--evaluate",
+        type=int,
+        default=0,
+        help="Also compare model accuracy on this many sampled posts",
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent API calls")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed")
+    args = parser.parse_args()
+    main(args.dataset, args.evaluate, args.concurrency, args.seed)
@@ -1,14 +1,109 @@
 #!/usr/bin/env python3
 """
 Ma-Weibo 数据集预处理脚本
-将原始数据转换为统一的 CSV 格式
+将原始数据转换为统一的 CSV 及列式（Arrow IPC / Parquet）格式
+
+事件文件由进程池并行解析，结果按块增量写出，整个数据集不会同时驻留内存。
+
+输出（位于 --output-dir）:
+    weibo_rumors.{csv,arrow,parquet}   每个事件的源帖子
+    weibo_reposts.{arrow,parquet}      完整转发链（每条帖子一行，仅列式格式）
+
+Arrow IPC 文件不压缩，可内存映射零拷贝读取（见 app/utils/dataset.py）；
+列式格式需要安装 pyarrow。
+
+用法（在 backend/ 目录下）:
+    python data/preprocess.py [--raw-dir DIR] [--output-dir DIR] [--format csv arrow parquet]
+                              [--workers N] [--chunk-size N] [--force]
+
+重新运行时按输出目录中的 manifest.json 增量处理，只解析新增或变化的事件；
+--force 忽略清单全量重建。
 """
 
+import argparse
+import hashlib
 import json
+import multiprocessing
 import os
-import pandas as pd
+import sys
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+import pandas as pd
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # 标准库解析器较慢，结果相同
+    _loads = json.loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # 只能输出 CSV
+    pa = None
+
+POSTS_NAME = 'weibo_rumors'
+REPOSTS_NAME = 'weibo_reposts'
+FORMATS = ('csv', 'arrow', 'parquet')
+MANIFEST_NAME = 'manifest.json'
+# 清单结构或输出列变化时递增，旧清单随之失效并全量重建
+MANIFEST_VERSION = 1
+
+# 源帖子各列及其 Arrow 类型（按块写出时各块列必须一致）
+POST_COLUMNS = {
+    'event_id': 'string',
+    'text': 'string',
+    'original_text': 'string',
+    'username': 'string',
+    'screen_name': 'string',
+    'uid': 'int64',
+    'verified': 'bool',
+    'followers_count': 'int64',
+    'reposts_count': 'int64',
+    'comments_count': 'int64',
+    'attitudes_count': 'int64',
+    'timestamp': 'int64',
+    'total_posts': 'int64',
+    'label': 'int8',
+    'is_rumor': 'bool',
+}
+# 转发链各列；parent_id 为空的是源帖子
+REPOST_COLUMNS = {
+    'event_id': 'string',
+    'post_id': 'string',
+    'parent_id': 'string',
+    'uid': 'int64',
+    'timestamp': 'int64',
+    'reposts_count': 'int64',
+    'comments_count': 'int64',
+    'attitudes_count': 'int64',
+}
+
+
+class PreprocessStats(NamedTuple):
+    """一次预处理的统计信息"""
+
+    events: int
+    records: int
+    rumors: int
+    missing: int
+    failed: int
+    # 转发链总行数（未输出列式格式时为 0）
+    reposts: int
+    # 本次解析的事件数、沿用上次输出的事件数、从上次输出中删除的事件数
+    parsed: int
+    reused: int
+    dropped: int
+    # 各阶段耗时（秒）
+    timings: Dict[str, float]
+    outputs: List[str]
 
 
 def parse_weibo_txt(file_path: str) -> Dict[str, int]:
@@ -25,11 +120,18 @@ def parse_weibo_txt(file_path: str) -> Dict[str, int]:
     return event_labels
 
 
-def parse_event_json(json_path: str) -> Dict[str, Any]:
+def _read_posts(json_path: str) -> List[Dict[str, Any]]:
+    with open(json_path, 'rb') as f:
+        return _loads(f.read())
+
+
+def parse_event_json(json_path: str) -> Optional[Dict[str, Any]]:
     """解析单个事件的 JSON 文件，提取源帖子信息"""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        posts = json.load(f)
+    return source_record(_read_posts(json_path))
 
+
+def source_record(posts: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """从事件的帖子列表中提取源帖子信息"""
     if not posts:
         return None
 
@@ -53,15 +155,351 @@ def parse_event_json(json_path: str) -> Dict[str, Any]:
     }
 
 
-def preprocess_dataset(raw_dir: str, output_path: str):
-    """预处理整个数据集"""
+def repost_chain(posts: List[Dict[str, Any]], event_id: str) -> Dict[str, list]:
+    """把事件的全部帖子转成转发链的列（每条帖子一行）"""
+    return {
+        'event_id': [event_id] * len(posts),
+        'post_id': [p.get('mid') or p.get('id') for p in posts],
+        'parent_id': [p.get('parent') or None for p in posts],
+        'uid': [p.get('uid') for p in posts],
+        'timestamp': [p.get('t') for p in posts],
+        'reposts_count': [p.get('reposts_count') for p in posts],
+        'comments_count': [p.get('comments_count') for p in posts],
+        'attitudes_count': [p.get('attitudes_count') for p in posts],
+    }
+
+
+class _EventResult(NamedTuple):
+    """进程池任务的结果"""
+
+    eid: str
+    # parsed / unchanged（内容哈希与清单一致，未解析）/ empty / missing / failed
+    status: str
+    record: Optional[Dict[str, Any]] = None
+    # 按列返回，跨进程传输比逐行字典小得多
+    chain: Optional[Dict[str, list]] = None
+    # 清单条目：size / mtime_ns / sha256
+    meta: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def _parse_event(task: Tuple[str, int, str, bool, Optional[str]]) -> _EventResult:
+    """进程池任务：解析一个事件；内容哈希等于 known_hash 时跳过解析"""
+    eid, label, json_path, with_chain, known_hash = task
+    try:
+        with open(json_path, 'rb') as f:
+            data = f.read()
+            stat = os.fstat(f.fileno())
+    except FileNotFoundError:
+        return _EventResult(eid, 'missing', error=f"未找到 {eid}.json")
+    meta = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': hashlib.sha256(data).hexdigest(),
+    }
+    if meta['sha256'] == known_hash:
+        return _EventResult(eid, 'unchanged', meta=meta)
+
+    try:
+        posts = _loads(data)
+        record = source_record(posts)
+    except Exception as e:
+        return _EventResult(eid, 'failed', error=f"解析 {eid}.json 时出错: {e}")
+    if not record:
+        return _EventResult(eid, 'empty', meta=meta)
+    record['label'] = label
+    record['is_rumor'] = label == 1
+    return _EventResult(
+        eid, 'parsed', record, repost_chain(posts, eid) if with_chain else None, meta,
+    )
+
+
+class _Timings:
+    """累计各阶段耗时"""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+
+
+class _Progress:
+    """在 stderr 上输出进度（最多每秒一次）"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.start = time.perf_counter()
+        self._last = 0.0
+
+    def update(self, done: int) -> None:
+        now = time.perf_counter()
+        if done < self.total and now - self._last < 1.0:
+            return
+        self._last = now
+        rate = done / max(now - self.start, 1e-9)
+        print(
+            f"\r[{done / max(self.total, 1):6.1%}] {done}/{self.total} 个事件  {rate:,.0f} 个/秒",
+            end='\n' if done >= self.total else '',
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+def _to_columns(records: List[Dict[str, Any]], columns: Dict[str, str]) -> Dict[str, list]:
+    return {name: [r.get(name) for r in records] for name in columns}
+
+
+def _coerce(value: Any, type_name: str) -> Any:
+    if value is None or value == '':
+        return None
+    if type_name == 'string':
+        return str(value)
+    if type_name == 'bool':
+        return bool(value)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _schema(columns: Dict[str, str]) -> 'pa.Schema':
+    return pa.schema([(name, pa.type_for_alias(type_name)) for name, type_name in columns.items()])
+
+
+def _record_batch(data: Dict[str, list], columns: Dict[str, str]) -> 'pa.RecordBatch':
+    return pa.record_batch(
+        [
+            pa.array([_coerce(v, type_name) for v in data[name]], pa.type_for_alias(type_name))
+            for name, type_name in columns.items()
+        ],
+        schema=_schema(columns),
+    )
+
+
+class _ChunkWriter(ABC):
+    """按块写入临时文件，完成后原子替换目标文件"""
+
+    def __init__(self, output_path: str, columns: Dict[str, str]):
+        self.output_path = output_path
+        self.tmp_path = f"{output_path}.tmp"
+        self.columns = columns
+
+    @abstractmethod
+    def write(self, data: Dict[str, list]) -> None:
+        """写入一块数据（列名到值列表）"""
+
+    @abstractmethod
+    def copy_existing(self, key: str, keep: Set[str]) -> int:
+        """把上次输出中 key 列属于 keep 的行原样写入，返回行数"""
+
+    def _finish(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._finish()
+        os.replace(self.tmp_path, self.output_path)
+
+
+class _CsvChunkWriter(_ChunkWriter):
+    """按块追加写入 CSV"""
+
+    def __init__(self, output_path: str, columns: Dict[str, str]):
+        super().__init__(output_path, columns)
+        self._header = True
+
+    def write(self, data: Dict[str, list]) -> None:
+        df = pd.DataFrame(data, columns=list(self.columns))
+        df.to_csv(self.tmp_path, mode='w' if self._header else 'a',
+                  header=self._header, index=False, encoding='utf-8')
+        self._header = False
+
+    def copy_existing(self, key: str, keep: Set[str]) -> int:
+        # 全部按字符串读写，保证沿用的行与上次输出逐字相同
+        old = pd.read_csv(self.output_path, dtype=str, keep_default_na=False)
+        old = old[old[key].isin(keep)]
+        old.to_csv(self.tmp_path, mode='w' if self._header else 'a',
+                   header=self._header, index=False, encoding='utf-8')
+        self._header = False
+        return len(old)
+
+    def _finish(self) -> None:
+        if self._header:
+            # 没有任何记录时也输出带表头的空文件
+            self.write({name: [] for name in self.columns})
+
+
+class _ArrowChunkWriter(_ChunkWriter):
+    """按块写入 Arrow IPC 文件；不压缩，读取时可内存映射零拷贝"""
+
+    def __init__(self, output_path: str, columns: Dict[str, str]):
+        super().__init__(output_path, columns)
+        self._writer = pa.ipc.new_file(self.tmp_path, _schema(columns))
+
+    def write(self, data: Dict[str, list]) -> None:
+        self._writer.write_batch(_record_batch(data, self.columns))
+
+    def copy_existing(self, key: str, keep: Set[str]) -> int:
+        with pa.memory_map(self.output_path) as source:
+            return self._write_filtered(pa.ipc.open_file(source).read_all(), key, keep)
+
+    def _write_filtered(self, table: 'pa.Table', key: str, keep: Set[str]) -> int:
+        table = table.filter(pc.is_in(table[key], value_set=pa.array(sorted(keep), pa.string())))
+        self._writer.write_table(table)
+        return table.num_rows
+
+    def _finish(self) -> None:
+        self._writer.close()
+
+
+class _ParquetChunkWriter(_ArrowChunkWriter):
+    """按块写入 Parquet 文件（每块一个 row group，zstd 压缩）"""
+
+    def __init__(self, output_path: str, columns: Dict[str, str]):
+        _ChunkWriter.__init__(self, output_path, columns)
+        self._writer = pq.ParquetWriter(self.tmp_path, _schema(columns), compression='zstd')
+
+    def copy_existing(self, key: str, keep: Set[str]) -> int:
+        return self._write_filtered(pq.read_table(self.output_path, memory_map=True), key, keep)
+
+
+_WRITERS = {'csv': _CsvChunkWriter, 'arrow': _ArrowChunkWriter, 'parquet': _ParquetChunkWriter}
+
+
+class _Outputs:
+    """把每块结果写到所有请求的格式"""
+
+    def __init__(self, output_dir: Path, formats: List[str]):
+        self.posts = [
+            _WRITERS[fmt](str(output_dir / f"{POSTS_NAME}.{fmt}"), POST_COLUMNS)
+            for fmt in formats
+        ]
+        # 转发链行数多，只输出列式格式
+        self.reposts = [
+            _WRITERS[fmt](str(output_dir / f"{REPOSTS_NAME}.{fmt}"), REPOST_COLUMNS)
+            for fmt in formats
+            if fmt != 'csv'
+        ]
+
+    @property
+    def paths(self) -> List[str]:
+        return [w.output_path for w in self.posts + self.reposts]
+
+    def write(self, records: List[Dict[str, Any]], chains: List[Dict[str, list]]) -> None:
+        posts = _to_columns(records, POST_COLUMNS)
+        for writer in self.posts:
+            writer.write(posts)
+        if self.reposts and chains:
+            reposts = {name: [v for chain in chains for v in chain[name]] for name in REPOST_COLUMNS}
+            for writer in self.reposts:
+                writer.write(reposts)
+
+    def copy_existing(self, post_ids: Set[str], eids: Set[str]) -> None:
+        """沿用上次输出中这些事件的行"""
+        if not eids:
+            return
+        for writer in self.posts:
+            writer.copy_existing('event_id', post_ids)
+        for writer in self.reposts:
+            writer.copy_existing('event_id', eids)
+
+    def close(self) -> None:
+        for writer in self.posts + self.reposts:
+            writer.close()
+
+
+def _load_manifest(output_dir: Path, formats: List[str]) -> Optional[Dict[str, Any]]:
+    """读取上次的清单；清单与现有输出不一致时返回 None（需全量重建）"""
+    try:
+        manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('formats') != sorted(formats):
+        return None
+    for name, size in manifest.get('outputs', {}).items():
+        path = output_dir / name
+        if not path.exists() or path.stat().st_size != size:
+            return None
+    return manifest
+
+
+def _save_manifest(output_dir: Path, formats: List[str], paths: List[str], events: Dict[str, Any]) -> None:
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'formats': sorted(formats),
+        # 输出文件大小，用于发现清单写入前中断等不一致
+        'outputs': {Path(path).name: os.path.getsize(path) for path in paths},
+        'events': events,
+    }
+    target = output_dir / MANIFEST_NAME
+    tmp = target.with_suffix('.json.tmp')
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False), encoding='utf-8')
+    os.replace(tmp, target)
+
+
+def _iter_results(tasks: List[Tuple[str, int, str, bool, Optional[str]]], workers: int):
+    if workers <= 1:
+        yield from map(_parse_event, tasks)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        # imap 按提交顺序返回，新解析的行保持 Weibo.txt 中的顺序
+        yield from pool.imap(_parse_event, tasks, chunksize=16)
+
+
+def default_formats() -> List[str]:
+    """默认输出格式：CSV，装有 pyarrow 时另加 Arrow IPC"""
+    return ['csv', 'arrow'] if pa is not None else ['csv']
+
+
+def preprocess_dataset(
+    raw_dir: str,
+    output_dir: str,
+    formats: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    force: bool = False,
+) -> PreprocessStats:
+    """
+    预处理整个数据集
+
+    默认增量处理：输出目录中的清单记录每个事件文件的大小、修改时间、内容哈希
+    及其在输出中的行，重新运行时只解析新增或内容变化的事件，其余沿用上次的输出，
+    已删除的事件从输出中去掉。
+
+    Args:
+        raw_dir: 原始数据目录（含 Weibo.txt 与 Weibo/）
+        output_dir: 输出目录
+        formats: 输出格式，取自 csv/arrow/parquet（默认见 default_formats）
+        workers: 解析进程数（默认每个 CPU 一个，1 表示在当前进程内解析）
+        chunk_size: 每次写出的记录数
+        force: 忽略清单，全量重建
+
+    Returns:
+        统计信息
+    """
+    formats = list(dict.fromkeys(formats or default_formats()))
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"未知的输出格式: {', '.join(sorted(unknown))}")
+    if pa is None and set(formats) - {'csv'}:
+        raise RuntimeError("输出 Arrow/Parquet 需要安装 pyarrow")
+
     raw_path = Path(raw_dir)
     weibo_txt = raw_path / 'Weibo.txt'
     weibo_dir = raw_path / 'Weibo'
+    workers = workers or os.cpu_count() or 1
+    timings = _Timings()
+    timings.seconds = dict.fromkeys(['解析标签', '比对清单', '解析事件', '写出'], 0.0)
 
     # 解析标签
     print("解析事件标签...")
-    event_labels = parse_weibo_txt(str(weibo_txt))
+    with timings.stage('解析标签'):
+        event_labels = parse_weibo_txt(str(weibo_txt))
     print(f"共 {len(event_labels)} 个事件")
 
     # 统计标签分布
@@ -69,52 +507,144 @@ def preprocess_dataset(raw_dir: str, output_path: str):
     non_rumor_count = len(event_labels) - rumor_count
     print(f"谣言: {rumor_count}, 非谣言: {non_rumor_count}")
 
-    # 解析每个事件
-    records = []
-    for eid, label in event_labels.items():
-        json_path = weibo_dir / f"{eid}.json"
-        if not json_path.exists():
-            print(f"警告: 未找到 {eid}.json")
-            continue
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    outputs = _Outputs(output_path, formats)
+    with_chain = bool(outputs.reposts)
 
-        try:
-            event_data = parse_event_json(str(json_path))
-            if event_data:
-                event_data['label'] = label
-                event_data['is_rumor'] = label == 1
-                records.append(event_data)
-        except Exception as e:
-            print(f"解析 {eid}.json 时出错: {e}")
-
-    # 创建 DataFrame
-    df = pd.DataFrame(records)
-
-    # 保存到 CSV
-    output_dir = Path(output_path).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False, encoding='utf-8')
+    # 与清单比对：大小、修改时间和标签都未变的事件直接沿用；其余交给进程池，
+    # 内容哈希未变的只更新清单条目，不重新解析
+    with timings.stage('比对清单'):
+        manifest = None if force else _load_manifest(output_path, formats)
+        previous: Dict[str, Any] = manifest['events'] if manifest else {}
+        events: Dict[str, Any] = {}
+        tasks = []
+        for eid, label in event_labels.items():
+            json_path = weibo_dir / f"{eid}.json"
+            entry = previous.get(eid)
+            if entry and entry['label'] == label:
+                try:
+                    stat = json_path.stat()
+                except FileNotFoundError:
+                    stat = None
+                if stat and (stat.st_size, stat.st_mtime_ns) == (entry['size'], entry['mtime_ns']):
+                    events[eid] = entry
+                    continue
+            known_hash = entry['sha256'] if entry and entry['label'] == label else None
+            tasks.append((eid, label, str(json_path), with_chain, known_hash))
+    if manifest:
+        print(f"增量处理: 沿用 {len(events)} 个事件，待检查 {len(tasks)} 个")
+    else:
+        print("全量处理" + ("（--force）" if force else "（没有可用的清单）"))
+
+    progress = _Progress(len(tasks))
+    records: List[Dict[str, Any]] = []
+    chains: List[Dict[str, list]] = []
+    unchanged: Dict[str, Any] = {}
+    parsed = missing = failed = 0
 
+    with timings.stage('写出'):
+        outputs.copy_existing({e['event_id'] for e in events.values()}, set(events))
+
+    # 并行解析每个事件，按块写出
+    written_before = timings.seconds['写出']
+    with timings.stage('解析事件'):
+        for done, result in enumerate(_iter_results(tasks, workers), 1):
+            if result.status == 'unchanged':
+                unchanged[result.eid] = {**previous[result.eid], **result.meta}
+            elif result.status == 'parsed':
+                records.append(result.record)
+                if result.chain:
+                    chains.append(result.chain)
+                parsed += 1
+                events[result.eid] = {
+                    **result.meta,
+                    'label': event_labels[result.eid],
+                    'event_id': str(result.record['event_id']),
+                    'posts': result.record['total_posts'],
+                }
+            elif result.status != 'empty':
+                print(f"\n警告: {result.error}", file=sys.stderr)
+                missing += result.status == 'missing'
+                failed += result.status == 'failed'
+            if len(records) >= chunk_size:
+                with timings.stage('写出'):
+                    outputs.write(records, chains)
+                records, chains = [], []
+            progress.update(done)
+
+        with timings.stage('写出'):
+            if records:
+                outputs.write(records, chains)
+            outputs.copy_existing({e['event_id'] for e in unchanged.values()}, set(unchanged))
+            outputs.close()
+            events.update(unchanged)
+            _save_manifest(output_path, formats, outputs.paths, events)
+    # 解析阶段耗时不含其中的写出时间（之前沿用旧数据的写出不在此阶段内）
+    timings.seconds['解析事件'] -= timings.seconds['写出'] - written_before
+
+    stats = PreprocessStats(
+        events=len(event_labels),
+        records=len(events),
+        rumors=sum(1 for e in events.values() if e['label'] == 1),
+        missing=missing,
+        failed=failed,
+        reposts=sum(e['posts'] for e in events.values()) if with_chain else 0,
+        parsed=parsed,
+        reused=len(events) - parsed,
+        dropped=len(set(previous) - set(events)),
+        timings=timings.seconds,
+        outputs=outputs.paths,
+    )
     print(f"\n预处理完成!")
-    print(f"总记录数: {len(df)}")
-    print(f"输出文件: {output_path}")
-    print(f"\n数据集统计:")
-    print(df.describe())
+    print(f"总记录数: {stats.records}（谣言 {stats.rumors}，缺失 {stats.missing}，出错 {stats.failed}）")
+    print(f"本次解析 {stats.parsed}，沿用 {stats.reused}，删除 {stats.dropped}")
+    if with_chain:
+        print(f"转发链帖子数: {stats.reposts}")
+    print(f"输出文件: {', '.join(stats.outputs)}")
+    print(f"解析进程数: {workers}")
+    for name, seconds in stats.timings.items():
+        print(f"  {name:<6} {seconds:8.2f} 秒")
 
-    return df
+    return stats
+
+
+def _read_head(path: str, n: int) -> pd.DataFrame:
+    if path.endswith('.csv'):
+        return pd.read_csv(path, nrows=n)
+    if path.endswith('.parquet'):
+        return pq.read_table(path).slice(0, n).to_pandas()
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all().slice(0, n).to_pandas()
 
 
 def main():
     # 路径配置
     script_dir = Path(__file__).parent
-    raw_dir = script_dir / 'raw'
-    processed_dir = script_dir / 'processed'
-    output_path = processed_dir / 'weibo_rumors.csv'
+
+    parser = argparse.ArgumentParser(description='Ma-Weibo 数据集预处理')
+    parser.add_argument('--raw-dir', default=str(script_dir / 'raw'), help='原始数据目录')
+    parser.add_argument('--output-dir', default=str(script_dir / 'processed'), help='输出目录')
+    parser.add_argument(
+        '--format',
+        nargs='+',
+        choices=FORMATS,
+        default=None,
+        help='输出格式（默认 csv，装有 pyarrow 时另加 arrow）',
+    )
+    parser.add_argument('--workers', type=int, default=None, help='解析进程数（默认每个 CPU 一个）')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='每次写出的记录数')
+    parser.add_argument('--force', action='store_true', help='忽略清单，全量重建')
+    args = parser.parse_args()
 
     # 预处理
-    df = preprocess_dataset(str(raw_dir), str(output_path))
+    stats = preprocess_dataset(
+        args.raw_dir, args.output_dir, args.format, args.workers, args.chunk_size, args.force,
+    )
 
     # 输出样例
     print("\n\n样例数据 (前5条):")
+    df = _read_head(stats.outputs[0], 5)
     print(df[['event_id', 'text', 'is_rumor', 'total_posts']].head())
 
 
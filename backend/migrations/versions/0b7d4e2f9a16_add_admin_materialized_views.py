@@ -0,0 +1,85 @@
+"""Add admin analytics materialized views
+
+Revision ID: 0b7d4e2f9a16
+Revises: f3a62d9c15b8
+Create Date: 2026-10-19 15:12:44.502917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7d4e2f9a16'
+down_revision: Union[str, None] = 'f3a62d9c15b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The default ANALYTICS_TIMEZONE; other deployments recreate the views with
+# python -m app.commands.refresh_views --recreate
+TZ = 'Asia/Shanghai'
+
+VIEWS = {
+    'mv_platform_daily_stats': (f"""
+        SELECT
+            (timezone('{TZ}', d.created_at))::date AS day,
+            count(*) AS total,
+            count(*) FILTER (WHERE d.is_rumor) AS rumors,
+            sum(d.confidence) AS confidence_sum,
+            count(*) FILTER (WHERE d.risk_level = 'low') AS risk_low,
+            count(*) FILTER (WHERE d.risk_level = 'medium') AS risk_medium,
+            count(*) FILTER (WHERE d.risk_level = 'high') AS risk_high,
+            count(*) FILTER (WHERE d.risk_level = 'critical') AS risk_critical,
+            count(DISTINCT d.user_id) AS active_users
+        FROM detections d
+        GROUP BY 1
+    """, 'day'),
+    'mv_category_rumor_rates': ("""
+        SELECT
+            coalesce(a.category, 'other') AS category,
+            count(*) AS total,
+            count(*) FILTER (WHERE d.is_rumor) AS rumors
+        FROM detections d
+        LEFT JOIN analyses a ON a.detection_id = d.id
+        GROUP BY 1
+    """, 'category'),
+    'mv_top_risk_indicators': ("""
+        SELECT
+            left(btrim(t.value), 200) AS indicator,
+            count(*) AS occurrences,
+            count(*) FILTER (WHERE d.is_rumor) AS rumor_occurrences
+        FROM detections d
+        JOIN analyses a ON a.detection_id = d.id
+        JOIN jsonb_array_elements_text(a.risk_indicators) AS t(value) ON true
+        WHERE jsonb_typeof(a.risk_indicators) = 'array'
+          AND btrim(t.value) <> ''
+        GROUP BY 1
+    """, 'indicator'),
+}
+
+
+def upgrade() -> None:
+    op.create_table('materialized_view_refreshes',
+    sa.Column('view_name', sa.String(length=63), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('duration_ms', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('view_name')
+    )
+
+    for name, (query, unique_columns) in VIEWS.items():
+        op.execute(f"CREATE MATERIALIZED VIEW {name} AS {query}")
+        op.execute(f"CREATE UNIQUE INDEX ux_{name} ON {name} ({unique_columns})")
+        op.execute(
+            f"INSERT INTO materialized_view_refreshes (view_name, duration_ms) VALUES ('{name}', 0)"
+        )
+    op.execute(
+        "CREATE INDEX ix_mv_top_risk_indicators_occurrences "
+        "ON mv_top_risk_indicators (occurrences DESC)"
+    )
+
+
+def downgrade() -> None:
+    for name in VIEWS:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name}")
+    op.drop_table('materialized_view_refreshes')
@@ -0,0 +1,49 @@
+"""Add shared claim verdicts
+
+Revision ID: 3b8e1f6d2c57
+Revises: 9d41a6c3e072
+Create Date: 2026-10-19 19:02:37.418265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e1f6d2c57'
+down_revision: Union[str, None] = '9d41a6c3e072'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('claims',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('verdict_version', sa.String(length=100), nullable=False),
+    sa.Column('is_rumor', sa.Boolean(), nullable=False),
+    sa.Column('confidence', sa.Numeric(precision=5, scale=4), nullable=False),
+    sa.Column('raw_response', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('hit_count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('verified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_hit_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('fingerprint', 'verdict_version')
+    )
+    op.add_column('detections', sa.Column('claim_id', sa.UUID(), nullable=True))
+    op.create_index(op.f('ix_detections_claim_id'), 'detections', ['claim_id'], unique=False)
+    op.create_foreign_key(
+        'detections_claim_id_fkey', 'detections', 'claims',
+        ['claim_id'], ['id'], ondelete='SET NULL',
+    )
+    # Existing detections keep their own raw_response; only new ones share claims
+
+
+def downgrade() -> None:
+    op.drop_constraint('detections_claim_id_fkey', 'detections', type_='foreignkey')
+    op.drop_index(op.f('ix_detections_claim_id'), table_name='detections')
+    op.drop_column('detections', 'claim_id')
+    op.drop_table('claims')
@@ -0,0 +1,30 @@
+"""Add dataset event id to detections
+
+Revision ID: 6f1a9c2d8b45
+Revises: 3b8e1f6d2c57
+Create Date: 2026-10-19 20:41:05.732918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '6f1a9c2d8b45'
+down_revision: Union[str, None] = '3b8e1f6d2c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('detections', sa.Column('dataset_event_id', sa.String(length=32), nullable=True))
+    op.create_index(
+        'ix_detections_user_dataset_event', 'detections', ['user_id', 'dataset_event_id'],
+        unique=True, postgresql_where=sa.text('dataset_event_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_detections_user_dataset_event', table_name='detections')
+    op.drop_column('detections', 'dataset_event_id')
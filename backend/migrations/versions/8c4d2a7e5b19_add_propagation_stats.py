@@ -0,0 +1,42 @@
+"""Add propagation stats
+
+Revision ID: 8c4d2a7e5b19
+Revises: 6f1a9c2d8b45
+Create Date: 2026-10-19 22:13:47.205613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4d2a7e5b19'
+down_revision: Union[str, None] = '6f1a9c2d8b45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'propagation_stats',
+        sa.Column('detection_id', sa.UUID(), nullable=False),
+        sa.Column('node_count', sa.BigInteger(), nullable=False),
+        sa.Column('max_depth', sa.BigInteger(), nullable=False),
+        sa.Column('max_breadth', sa.BigInteger(), nullable=False),
+        sa.Column('structural_virality', sa.Float(), nullable=False),
+        sa.Column('pattern', sa.String(length=20), nullable=False),
+        sa.Column('spread_speed', sa.String(length=20), nullable=True),
+        sa.Column('estimated_reach', sa.BigInteger(), nullable=False),
+        sa.Column('influence_score', sa.Float(), nullable=False),
+        sa.Column('growth', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('half_life_hours', sa.Float(), nullable=True),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['detection_id'], ['detections.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('detection_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('propagation_stats')
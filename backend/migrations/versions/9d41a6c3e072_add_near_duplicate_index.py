@@ -0,0 +1,44 @@
+"""Add near-duplicate fingerprint index
+
+Revision ID: 9d41a6c3e072
+Revises: 5c2e8f71a4d3
+Create Date: 2026-10-19 17:48:12.604113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9d41a6c3e072'
+down_revision: Union[str, None] = '5c2e8f71a4d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('detections', sa.Column('matched_detection_id', sa.UUID(), nullable=True))
+    op.add_column('detections', sa.Column('match_distance', sa.SmallInteger(), nullable=True))
+    op.create_foreign_key(
+        'detections_matched_detection_id_fkey', 'detections', 'detections',
+        ['matched_detection_id'], ['id'], ondelete='SET NULL',
+    )
+    op.create_table('detection_fingerprints',
+    sa.Column('detection_id', sa.UUID(), nullable=False),
+    sa.Column('simhash', sa.BigInteger(), nullable=False),
+    sa.Column('bands', postgresql.ARRAY(sa.BigInteger()), nullable=False),
+    sa.ForeignKeyConstraint(['detection_id'], ['detections.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('detection_id')
+    )
+    op.create_index('ix_detection_fingerprints_bands', 'detection_fingerprints', ['bands'], unique=False, postgresql_using='gin')
+    # Existing detections are indexed with: python -m app.commands.rebuild_near_duplicates
+
+
+def downgrade() -> None:
+    op.drop_index('ix_detection_fingerprints_bands', table_name='detection_fingerprints', postgresql_using='gin')
+    op.drop_table('detection_fingerprints')
+    op.drop_constraint('detections_matched_detection_id_fkey', 'detections', type_='foreignkey')
+    op.drop_column('detections', 'match_distance')
+    op.drop_column('detections', 'matched_detection_id')
@@ -0,0 +1,33 @@
+"""Add verdict version to near-duplicate fingerprints
+
+Revision ID: a3f6c8e2d915
+Revises: e5b9d3a1c7f4
+Create Date: 2026-10-20 14:37:09.251846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f6c8e2d915'
+down_revision: Union[str, None] = 'e5b9d3a1c7f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('detection_fingerprints', sa.Column('verdict_version', sa.String(length=100), nullable=True))
+    # Fingerprints of detections without a claim keep NULL and are no longer reused
+    op.execute("""
+        UPDATE detection_fingerprints
+        SET verdict_version = claims.verdict_version
+        FROM detections
+        JOIN claims ON claims.id = detections.claim_id
+        WHERE detections.id = detection_fingerprints.detection_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('detection_fingerprints', 'verdict_version')
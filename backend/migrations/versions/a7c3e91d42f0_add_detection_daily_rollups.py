@@ -0,0 +1,76 @@
+"""Add detection daily rollups
+
+Revision ID: a7c3e91d42f0
+Revises: 39bdbdfebbec
+Create Date: 2026-10-19 09:12:31.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91d42f0'
+down_revision: Union[str, None] = '39bdbdfebbec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('detection_daily_rollups',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('total', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('rumors', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('confidence_sum', sa.Numeric(precision=14, scale=4), server_default=sa.text('0'), nullable=False),
+    sa.Column('risk_low', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('risk_medium', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('risk_high', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('risk_critical', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('category_counts', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'day')
+    )
+
+    # Backfill from existing detections
+    op.execute("""
+        INSERT INTO detection_daily_rollups (
+            user_id, day, total, rumors, confidence_sum,
+            risk_low, risk_medium, risk_high, risk_critical, category_counts
+        )
+        SELECT t.user_id, t.day, t.total, t.rumors, t.confidence_sum,
+               t.risk_low, t.risk_medium, t.risk_high, t.risk_critical,
+               coalesce(c.category_counts, '{}'::jsonb)
+        FROM (
+            SELECT user_id,
+                   date(timezone('UTC', created_at)) AS day,
+                   count(*) AS total,
+                   sum(CASE WHEN is_rumor THEN 1 ELSE 0 END) AS rumors,
+                   sum(confidence) AS confidence_sum,
+                   sum(CASE WHEN risk_level = 'low' THEN 1 ELSE 0 END) AS risk_low,
+                   sum(CASE WHEN risk_level = 'medium' THEN 1 ELSE 0 END) AS risk_medium,
+                   sum(CASE WHEN risk_level = 'high' THEN 1 ELSE 0 END) AS risk_high,
+                   sum(CASE WHEN risk_level = 'critical' THEN 1 ELSE 0 END) AS risk_critical
+            FROM detections
+            GROUP BY user_id, date(timezone('UTC', created_at))
+        ) t
+        LEFT JOIN (
+            SELECT user_id, day, jsonb_object_agg(category, n) AS category_counts
+            FROM (
+                SELECT d.user_id,
+                       date(timezone('UTC', d.created_at)) AS day,
+                       coalesce(a.category, 'other') AS category,
+                       count(*) AS n
+                FROM detections d
+                JOIN analyses a ON a.detection_id = d.id
+                GROUP BY d.user_id, date(timezone('UTC', d.created_at)), coalesce(a.category, 'other')
+            ) per_category
+            GROUP BY user_id, day
+        ) c ON c.user_id = t.user_id AND c.day = t.day
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('detection_daily_rollups')
@@ -0,0 +1,37 @@
+"""Add propagation tree indexes
+
+Revision ID: b2e7f4c19a63
+Revises: 8c4d2a7e5b19
+Create Date: 2026-10-19 23:02:18.461930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7f4c19a63'
+down_revision: Union[str, None] = '8c4d2a7e5b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_propagation_nodes_detection_parent', 'propagation_nodes', ['detection_id', 'parent_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_propagation_nodes_detection_node', 'propagation_nodes', ['detection_id', 'node_id'],
+        unique=False,
+    )
+    # Both new indexes lead with detection_id
+    op.drop_index('ix_propagation_nodes_detection_id', table_name='propagation_nodes')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_propagation_nodes_detection_id', 'propagation_nodes', ['detection_id'], unique=False,
+    )
+    op.drop_index('ix_propagation_nodes_detection_node', table_name='propagation_nodes')
+    op.drop_index('ix_propagation_nodes_detection_parent', table_name='propagation_nodes')
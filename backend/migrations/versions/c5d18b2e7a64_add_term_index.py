@@ -0,0 +1,72 @@
+"""Add term index and analysis GIN indexes
+
+Revision ID: c5d18b2e7a64
+Revises: a7c3e91d42f0
+Create Date: 2026-10-19 11:40:02.930561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d18b2e7a64'
+down_revision: Union[str, None] = 'a7c3e91d42f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TERM_FIELDS = ('keywords', 'fact_check_points', 'risk_indicators')
+
+
+def upgrade() -> None:
+    op.add_column('analyses', sa.Column('risk_indicators', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.execute("""
+        UPDATE analyses a
+        SET risk_indicators = d.raw_response -> 'risk_indicators'
+        FROM detections d
+        WHERE d.id = a.detection_id
+          AND jsonb_typeof(d.raw_response -> 'risk_indicators') = 'array'
+    """)
+
+    for field in TERM_FIELDS:
+        op.create_index(
+            f'ix_analyses_{field}',
+            'analyses',
+            [field],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={field: 'jsonb_path_ops'},
+        )
+
+    op.create_table('user_term_counts',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('field', sa.String(length=30), nullable=False),
+    sa.Column('term', sa.String(length=200), nullable=False),
+    sa.Column('count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'field', 'term')
+    )
+    op.create_index('ix_user_term_counts_user_field_count', 'user_term_counts', ['user_id', 'field', 'count'], unique=False)
+
+    # Backfill from existing analyses
+    for field in TERM_FIELDS:
+        op.execute(f"""
+            INSERT INTO user_term_counts (user_id, field, term, count)
+            SELECT d.user_id, '{field}', left(btrim(t.value), 200), count(*)
+            FROM detections d
+            JOIN analyses a ON a.detection_id = d.id
+            JOIN jsonb_array_elements_text(a.{field}) AS t(value) ON true
+            WHERE jsonb_typeof(a.{field}) = 'array'
+              AND left(btrim(t.value), 200) <> ''
+            GROUP BY d.user_id, left(btrim(t.value), 200)
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_term_counts_user_field_count', table_name='user_term_counts')
+    op.drop_table('user_term_counts')
+    for field in TERM_FIELDS:
+        op.drop_index(f'ix_analyses_{field}', table_name='analyses')
+    op.drop_column('analyses', 'risk_indicators')
@@ -0,0 +1,74 @@
+"""Keep superseded claims
+
+Revision ID: d4a8c2f6e1b7
+Revises: b2e7f4c19a63
+Create Date: 2026-10-20 09:14:52.308417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8c2f6e1b7'
+down_revision: Union[str, None] = 'b2e7f4c19a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('claims_fingerprint_verdict_version_key', 'claims', type_='unique')
+    op.create_index(
+        'ix_claims_fingerprint_version_verified', 'claims',
+        ['fingerprint', 'verdict_version', 'verified_at'], unique=False,
+    )
+    op.drop_constraint('detections_claim_id_fkey', 'detections', type_='foreignkey')
+    op.create_foreign_key(
+        'detections_claim_id_fkey', 'detections', 'claims',
+        ['claim_id'], ['id'], ondelete='RESTRICT',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('detections_claim_id_fkey', 'detections', type_='foreignkey')
+    op.create_foreign_key(
+        'detections_claim_id_fkey', 'detections', 'claims',
+        ['claim_id'], ['id'], ondelete='SET NULL',
+    )
+    # Only the newest claim per key survives; detections of older ones take
+    # back their own copy of the response
+    op.execute(sa.text("""
+        WITH superseded AS (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY fingerprint, verdict_version
+                    ORDER BY verified_at DESC, created_at DESC
+                ) AS rank
+                FROM claims
+            ) ranked
+            WHERE rank > 1
+        )
+        UPDATE detections
+        SET raw_response = claims.raw_response, claim_id = NULL
+        FROM claims
+        WHERE detections.claim_id = claims.id
+          AND claims.id IN (SELECT id FROM superseded)
+    """))
+    op.execute(sa.text("""
+        DELETE FROM claims
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY fingerprint, verdict_version
+                    ORDER BY verified_at DESC, created_at DESC
+                ) AS rank
+                FROM claims
+            ) ranked
+            WHERE rank > 1
+        )
+    """))
+    op.drop_index('ix_claims_fingerprint_version_verified', table_name='claims')
+    op.create_unique_constraint(
+        'claims_fingerprint_verdict_version_key', 'claims', ['fingerprint', 'verdict_version'],
+    )
@@ -0,0 +1,41 @@
+"""Normalize stored analysis terms
+
+Revision ID: e5b9d3a1c7f4
+Revises: d4a8c2f6e1b7
+Create Date: 2026-10-20 10:26:41.507318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9d3a1c7f4'
+down_revision: Union[str, None] = 'd4a8c2f6e1b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TERM_FIELDS = ('keywords', 'fact_check_points', 'risk_indicators')
+
+
+def upgrade() -> None:
+    # Store terms as user_term_counts indexes them, so filters match
+    for field in TERM_FIELDS:
+        op.execute(f"""
+            UPDATE analyses
+            SET {field} = (
+                SELECT coalesce(jsonb_agg(left(btrim(t.value), 200) ORDER BY t.ordinality), '[]'::jsonb)
+                FROM jsonb_array_elements_text({field}) WITH ORDINALITY AS t(value, ordinality)
+                WHERE left(btrim(t.value), 200) <> ''
+            )
+            WHERE jsonb_typeof({field}) = 'array'
+              AND EXISTS (
+                  SELECT 1 FROM jsonb_array_elements_text({field}) AS t(value)
+                  WHERE left(btrim(t.value), 200) IS DISTINCT FROM t.value
+              )
+        """)
+
+
+def downgrade() -> None:
+    # Original spacing is not kept; normalized terms are valid before this too
+    pass
@@ -0,0 +1,71 @@
+"""Rebucket detection rollups by analytics timezone
+
+Revision ID: e81b0c47d9a3
+Revises: c5d18b2e7a64
+Create Date: 2026-10-19 14:05:47.112390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81b0c47d9a3'
+down_revision: Union[str, None] = 'c5d18b2e7a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The default ANALYTICS_TIMEZONE; other deployments re-bucket afterwards with
+# python -m app.commands.backfill
+TZ = 'Asia/Shanghai'
+
+REBUILD_ROLLUPS = """
+    INSERT INTO detection_daily_rollups (
+        user_id, day, total, rumors, confidence_sum,
+        risk_low, risk_medium, risk_high, risk_critical, category_counts
+    )
+    SELECT t.user_id, t.day, t.total, t.rumors, t.confidence_sum,
+           t.risk_low, t.risk_medium, t.risk_high, t.risk_critical,
+           coalesce(c.category_counts, '{}'::jsonb)
+    FROM (
+        SELECT user_id,
+               date(timezone(:tz, created_at)) AS day,
+               count(*) AS total,
+               sum(CASE WHEN is_rumor THEN 1 ELSE 0 END) AS rumors,
+               sum(confidence) AS confidence_sum,
+               sum(CASE WHEN risk_level = 'low' THEN 1 ELSE 0 END) AS risk_low,
+               sum(CASE WHEN risk_level = 'medium' THEN 1 ELSE 0 END) AS risk_medium,
+               sum(CASE WHEN risk_level = 'high' THEN 1 ELSE 0 END) AS risk_high,
+               sum(CASE WHEN risk_level = 'critical' THEN 1 ELSE 0 END) AS risk_critical
+        FROM detections
+        GROUP BY user_id, date(timezone(:tz, created_at))
+    ) t
+    LEFT JOIN (
+        SELECT user_id, day, jsonb_object_agg(category, n) AS category_counts
+        FROM (
+            SELECT d.user_id,
+                   date(timezone(:tz, d.created_at)) AS day,
+                   coalesce(a.category, 'other') AS category,
+                   count(*) AS n
+            FROM detections d
+            JOIN analyses a ON a.detection_id = d.id
+            GROUP BY d.user_id, date(timezone(:tz, d.created_at)), coalesce(a.category, 'other')
+        ) per_category
+        GROUP BY user_id, day
+    ) c ON c.user_id = t.user_id AND c.day = t.day
+"""
+
+
+def _rebuild(tz: str) -> None:
+    op.execute("DELETE FROM detection_daily_rollups")
+    op.execute(sa.text(REBUILD_ROLLUPS).bindparams(tz=tz))
+
+
+def upgrade() -> None:
+    # Rollup days now follow ANALYTICS_TIMEZONE instead of UTC
+    _rebuild(TZ)
+
+
+def downgrade() -> None:
+    _rebuild('UTC')
@@ -9,7 +9,13 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.core.config import settings
-from app.core.database import Base, get_db
+from app.core.database import (
+    Base,
+    get_db,
+    get_replica_session_maker,
+    get_session_maker,
+    has_pending_writes,
+)
 from app.main import app
 
 # Test database URL
@@ -17,6 +23,16 @@ TEST_DATABASE_URL = settings.DATABASE_URL.replace(
     settings.POSTGRES_DB, f"{settings.POSTGRES_DB}_test"
 )
 
+# Reads routed to the replica use a second engine: the configured replica's
+# test database, or otherwise the same test database over separate connections
+TEST_REPLICA_DATABASE_URL = (
+    settings.REPLICA_DATABASE_URL.replace(
+        settings.POSTGRES_DB, f"{settings.POSTGRES_DB}_test"
+    )
+    if settings.REPLICA_DATABASE_URL
+    else TEST_DATABASE_URL
+)
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
@@ -27,20 +43,17 @@ def event_loop() -> Generator:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
+async def session_maker() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Create a session factory bound to a fresh test database."""
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async_session = async_sessionmaker(
+    yield async_sessionmaker(
         engine, class_=AsyncSession, expire_on_commit=False
     )
 
-    async with async_session() as session:
-        yield session
-
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
@@ -48,13 +61,44 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def replica_session_maker(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Create a session factory for the read replica."""
+    engine = create_async_engine(TEST_REPLICA_DATABASE_URL, echo=False)
+
+    yield async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session."""
+    async with session_maker() as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    db_session: AsyncSession,
+    session_maker: async_sessionmaker[AsyncSession],
+    replica_session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncClient, None]:
     """Create a test HTTP client."""
 
     async def override_get_db():
         yield db_session
+        if has_pending_writes(db_session):
+            await db_session.commit()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_maker] = lambda: session_maker
+    app.dependency_overrides[get_replica_session_maker] = lambda: replica_session_maker
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
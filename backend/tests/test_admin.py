@@ -0,0 +1,167 @@
+"""Tests for admin analytics endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import AsyncMock, patch
+
+from app.models.user import User
+from app.services.principal_service import PrincipalService
+
+
+async def _register_and_login(client: AsyncClient, email: str, username: str) -> dict:
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "username": username,
+            "password": "testpass123",
+        },
+    )
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": email,
+            "password": "testpass123",
+        },
+    )
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def _make_superuser(db_session: AsyncSession, email: str) -> None:
+    result = await db_session.execute(
+        update(User)
+        .where(User.email == email)
+        .values(is_superuser=True)
+        .returning(User.id)
+    )
+    # Direct updates bypass AuthService, so drop the cached principal here
+    await PrincipalService(db_session).invalidate(result.scalar_one())
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_admin_analytics(client: AsyncClient, db_session: AsyncSession):
+    """Test platform analytics read refreshed materialized views."""
+    headers = await _register_and_login(client, "test@example.com", "testuser")
+
+    response = await client.get("/api/v1/admin/analytics/overview", headers=headers)
+    assert response.status_code == 403
+
+    await _make_superuser(db_session, "test@example.com")
+
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        return_value={
+            "is_rumor": True,
+            "confidence": 0.2,
+            "explanation": "Unverified.",
+            "keywords": ["test"],
+            "sentiment": "negative",
+            "category": "health",
+            "fact_check_points": [],
+            "risk_indicators": ["No source"],
+        },
+    ):
+        await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Test content"},
+            headers=headers,
+        )
+
+    # Views only change on refresh
+    response = await client.get("/api/v1/admin/analytics/overview", headers=headers)
+    assert response.json()["total_detections"] == 0
+
+    response = await client.post("/api/v1/admin/analytics/refresh", headers=headers)
+    data = response.json()
+    assert data["refreshed"] is True
+    assert data["views"]["mv_platform_daily_stats"]["refreshed_at"] is not None
+
+    response = await client.get("/api/v1/admin/analytics/overview", headers=headers)
+    data = response.json()
+    assert data["total_detections"] == 1
+    assert data["risk"]["critical"] == 1
+    assert data["daily"][0]["active_users"] == 1
+    assert data["freshness"]["age_seconds"] is not None
+
+    response = await client.get("/api/v1/admin/analytics/categories", headers=headers)
+    assert response.json()["data"][0] == {
+        "category": "health",
+        "total": 1,
+        "rumors": 1,
+        "rumor_rate": 1.0,
+    }
+
+    response = await client.get(
+        "/api/v1/admin/analytics/risk-indicators", headers=headers
+    )
+    assert response.json()["data"][0]["indicator"] == "No source"
+
+
+@pytest.mark.asyncio
+async def test_recreate_views_follows_analytics_timezone(
+    db_session: AsyncSession, monkeypatch
+):
+    """Test recreating the views re-buckets days in the current timezone."""
+    from datetime import date, datetime, timezone
+
+    from sqlalchemy import select
+
+    from app.core.config import settings
+    from app.models.admin_views import platform_daily_stats
+    from app.models.detection import Detection
+    from app.services.admin_analytics_service import AdminAnalyticsService
+
+    user = User(email="views@example.com", username="views", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    # 04:00 on Jan 2 in Shanghai, still Jan 1 in UTC
+    db_session.add(Detection(
+        user_id=user.id,
+        content="网传",
+        is_rumor=True,
+        confidence=0.2,
+        risk_level="critical",
+        created_at=datetime(2026, 1, 1, 20, tzinfo=timezone.utc),
+    ))
+    await db_session.commit()
+
+    service = AdminAnalyticsService(db_session)
+    assert await service.refresh_views(force=True)
+    await db_session.commit()
+    day = platform_daily_stats.c.day
+    assert (await db_session.scalars(select(day))).all() == [date(2026, 1, 2)]
+
+    monkeypatch.setattr(settings, "ANALYTICS_TIMEZONE", "UTC")
+    assert await service.recreate_views()
+    await db_session.commit()
+    assert (await db_session.scalars(select(day))).all() == [date(2026, 1, 1)]
+    freshness = await service.get_all_freshness()
+    assert all(view.refreshed_at is not None for view in freshness.values())
+
+
+@pytest.mark.asyncio
+async def test_deactivate_user(client: AsyncClient, db_session: AsyncSession):
+    """Test a deactivated user is rejected despite the principal cache."""
+    admin_headers = await _register_and_login(client, "admin@example.com", "admin")
+    await _make_superuser(db_session, "admin@example.com")
+    user_headers = await _register_and_login(client, "test@example.com", "testuser")
+
+    # Warm the principal cache
+    me = await client.get("/api/v1/users/me", headers=user_headers)
+    assert (await client.get("/api/v1/history", headers=user_headers)).status_code == 200
+
+    response = await client.post(
+        f"/api/v1/admin/users/{me.json()['id']}/deactivate",
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+    response = await client.get("/api/v1/history", headers=user_headers)
+    assert response.status_code == 403
@@ -0,0 +1,337 @@
+"""Tests for analysis endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, patch
+
+
+@pytest.fixture
+def mock_deepseek_response():
+    """Mock DeepSeek API response."""
+    return {
+        "is_rumor": True,
+        "confidence": 0.35,
+        "explanation": "This content contains unverified claims.",
+        "keywords": ["test", "rumor"],
+        "sentiment": "negative",
+        "category": "social",
+        "fact_check_points": ["Source not verified"],
+        "risk_indicators": ["Unverified claims"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_dashboard_rollups_follow_writes(
+    client: AsyncClient, mock_deepseek_response
+):
+    """Test overview, category and risk stats track inserts and deletes."""
+    # Register and login
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpass123",
+        },
+    )
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpass123",
+        },
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Create two detections
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        return_value=mock_deepseek_response,
+    ):
+        first = await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Test content 1"},
+            headers=headers,
+        )
+        await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Test content 2"},
+            headers=headers,
+        )
+
+    response = await client.get("/api/v1/analysis/overview", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_detections"] == 2
+    assert data["total_rumors"] == 2
+    assert data["avg_confidence"] == pytest.approx(0.35)
+
+    response = await client.get("/api/v1/analysis/category", headers=headers)
+    assert response.json()["data"][0] == {
+        "category": "social",
+        "count": 2,
+        "percentage": 100.0,
+    }
+
+    # Delete one detection and check the rollups are decremented
+    await client.delete(
+        f"/api/v1/history/{first.json()['id']}",
+        headers=headers,
+    )
+
+    response = await client.get("/api/v1/analysis/risk-distribution", headers=headers)
+    data = response.json()
+    assert data["total"] == 1
+    assert data["distribution"]["critical"] == 1
+
+    response = await client.get("/api/v1/analysis/trend?days=7", headers=headers)
+    data = response.json()
+    assert sum(data["total"]) == 1
+    assert len(data["buckets"]) == len(data["total"]) == 8
+
+    response = await client.get(
+        "/api/v1/analysis/trend?days=1&granularity=hour&timezone=UTC",
+        headers=headers,
+    )
+    data = response.json()
+    assert data["period"] == "hourly"
+    assert sum(data["total"]) == 1
+    assert sum(data["rumors"]) == 1
+
+    response = await client.get(
+        "/api/v1/analysis/trend?timezone=Mars/Olympus",
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_keyword_stats_and_history_filter(
+    client: AsyncClient, mock_deepseek_response
+):
+    """Test keyword counts and keyword-filtered history."""
+    # Register and login
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpass123",
+        },
+    )
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpass123",
+        },
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    other_response = {**mock_deepseek_response, "keywords": ["test", "vaccine"]}
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        side_effect=[mock_deepseek_response, other_response],
+    ):
+        await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Test content 1"},
+            headers=headers,
+        )
+        await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Test content 2"},
+            headers=headers,
+        )
+
+    response = await client.get("/api/v1/analysis/keywords", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_keywords"] == 3
+    assert data["data"][0]["keyword"] == "test"
+    assert data["data"][0]["count"] == 2
+
+    response = await client.get(
+        "/api/v1/analysis/keywords?field=risk_indicators",
+        headers=headers,
+    )
+    assert response.json()["data"][0] == {
+        "keyword": "Unverified claims",
+        "count": 2,
+        "weight": 1.0,
+    }
+
+    response = await client.get(
+        "/api/v1/history?keyword=vaccine",
+        headers=headers,
+    )
+    data = response.json()
+    assert data["total"] == 1
+    assert data["items"][0]["content"] == "Test content 2"
+
+
+@pytest.mark.asyncio
+async def test_history_filter_matches_indexed_terms(
+    client: AsyncClient, db_session, mock_deepseek_response
+):
+    """Test padded terms are stored as indexed and the backfill skips non-arrays."""
+    from sqlalchemy import select, update
+
+    from app.models.analytics import UserTermCount
+    from app.models.detection import Analysis
+    from app.services.term_index_service import TermIndexService
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "terms@example.com", "username": "terms", "password": "testpass123"},
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "terms@example.com", "password": "testpass123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    padded_response = {**mock_deepseek_response, "keywords": ["  vaccine ", " "]}
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        return_value=padded_response,
+    ):
+        await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Padded content"},
+            headers=headers,
+        )
+
+    response = await client.get("/api/v1/analysis/keywords", headers=headers)
+    assert [item["keyword"] for item in response.json()["data"]] == ["vaccine"]
+    for keyword in ("vaccine", " vaccine "):
+        response = await client.get(
+            "/api/v1/history", params={"keyword": keyword}, headers=headers
+        )
+        assert response.json()["total"] == 1
+
+    # Rows written before the fields were validated may hold a scalar
+    await db_session.execute(update(Analysis).values(risk_indicators="none"))
+    await db_session.commit()
+    await TermIndexService(db_session).backfill()
+    await db_session.commit()
+    terms = (
+        await db_session.execute(select(UserTermCount.field, UserTermCount.term))
+    ).all()
+    assert sorted(terms) == [
+        ("fact_check_points", "Source not verified"),
+        ("keywords", "vaccine"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dashboard(client: AsyncClient, mock_deepseek_response):
+    """Test all dashboard widgets are returned in one response."""
+    # Register and login
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpass123",
+        },
+    )
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpass123",
+        },
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        return_value=mock_deepseek_response,
+    ):
+        await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Test content"},
+            headers=headers,
+        )
+
+    response = await client.get("/api/v1/analysis/dashboard?days=7", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["overview"]["total_detections"] == 1
+    assert data["risk"]["distribution"]["critical"] == 1
+    assert data["category"]["total"] == 1
+    assert data["keywords"]["total_keywords"] == 2
+    assert len(data["trend"]["buckets"]) == 8
+
+    server_timing = response.headers["server-timing"]
+    for widget in ("summary", "trend", "category", "keywords"):
+        assert f"{widget};dur=" in server_timing
+
+
+@pytest.mark.asyncio
+async def test_analytics_cache_etag(client: AsyncClient, mock_deepseek_response):
+    """Test cached responses revalidate with ETags until the user writes."""
+    # Register and login
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpass123",
+        },
+    )
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpass123",
+        },
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.get("/api/v1/analysis/overview", headers=headers)
+    assert first.headers["x-cache"] == "miss"
+    etag = first.headers["etag"]
+
+    second = await client.get("/api/v1/analysis/overview", headers=headers)
+    assert second.headers["x-cache"] == "hit"
+    assert second.json() == first.json()
+
+    response = await client.get(
+        "/api/v1/analysis/overview",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+
+    # A new detection bumps the data version and invalidates the ETag
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        return_value=mock_deepseek_response,
+    ):
+        await client.post(
+            "/api/v1/detection/single",
+            json={"content": "Test content"},
+            headers=headers,
+        )
+
+    response = await client.get(
+        "/api/v1/analysis/overview",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["total_detections"] == 1
@@ -3,6 +3,9 @@
 import pytest
 from httpx import AsyncClient
 
+from app.core.revocation import revoked_tokens
+from app.core.security import create_access_token, decode_token
+
 
 @pytest.mark.asyncio
 async def test_register_user(client: AsyncClient):
@@ -131,3 +134,66 @@ async def test_get_current_user(client: AsyncClient):
     data = response.json()
     assert data["email"] == "test@example.com"
     assert data["username"] == "testuser"
+
+
+def test_decode_token_rejects_revoked():
+    """Test a revoked token is rejected even after its payload was cached."""
+    token = create_access_token("00000000-0000-0000-0000-000000000001")
+    payload = decode_token(token)
+    assert payload is not None
+
+    revoked_tokens.add(payload["jti"], payload["exp"])
+    assert decode_token(token) is None
+
+
+@pytest.mark.asyncio
+async def test_logout_and_refresh_rotation(client: AsyncClient):
+    """Test logout revokes tokens and refresh tokens can be used once."""
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpass123",
+        },
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpass123",
+        },
+    )
+    tokens = login_response.json()
+
+    # Refresh rotates the refresh token
+    response = await client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == 200
+    rotated = response.json()
+
+    response = await client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == 401
+
+    # Logout revokes the access token and the current refresh token
+    headers = {"Authorization": f"Bearer {rotated['access_token']}"}
+    response = await client.post(
+        "/api/v1/auth/logout",
+        headers=headers,
+        json={"refresh_token": rotated["refresh_token"]},
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 401
+
+    response = await client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": rotated["refresh_token"]},
+    )
+    assert response.status_code == 401
@@ -0,0 +1,41 @@
+"""Tests for in-process caching helpers."""
+
+import time
+import uuid
+
+from app.core.cache import TTLCache
+from app.services.analytics_cache_service import etag_matches, make_etag
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test the cache keeps at most maxsize entries."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    """Test entries disappear after their TTL."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_etag_depends_on_version():
+    """Test ETags change with the data version and compare weakly."""
+    user_id = uuid.uuid4()
+    etag = make_etag(user_id, "overview?", 3)
+
+    assert etag != make_etag(user_id, "overview?", 4)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,178 @@
+"""Tests for cascade analytics and propagation trees."""
+
+import pytest
+from sqlalchemy import select
+
+from app.utils.cascade import Cascade, analyze
+
+
+def _ids(n: int) -> list[str]:
+    return [str(i) for i in range(n)]
+
+
+def test_star_and_chain():
+    """Test depth, breadth and structural virality of the two extreme shapes."""
+    n = 10
+    star = analyze(Cascade.from_edges(_ids(n), [None] + ["0"] * (n - 1)))
+    assert (star.max_depth, star.max_breadth) == (1, n - 1)
+    assert star.structural_virality == pytest.approx(2 * (n - 1) / n, abs=1e-4)
+    assert star.pattern == "broadcast"
+
+    chain = analyze(Cascade.from_edges(_ids(n), [None] + [str(i) for i in range(n - 1)]))
+    assert (chain.max_depth, chain.max_breadth) == (n - 1, 1)
+    assert chain.structural_virality == pytest.approx((n + 1) / 3, abs=1e-4)
+
+    single = analyze(Cascade.from_edges(["0"], [None]))
+    assert (single.node_count, single.pattern, single.structural_virality) == (1, "isolated", 0.0)
+    assert analyze(Cascade.from_edges([], [])).node_count == 0
+
+
+def test_orphans_and_cycles_attach_to_root():
+    """Test reposts of missing posts and parent cycles don't break the tree."""
+    cascade = Cascade.from_edges(
+        ["r", "a", "b", "c", "d"],
+        [None, "gone", "c", "b", "r"],
+    )
+    assert cascade.root == 0
+    assert list(cascade.parent) == [-1, 0, 0, 0, 0]
+    assert analyze(cascade).max_depth == 1
+
+
+def test_growth_and_reach():
+    """Test time windows, half-life and per-poster follower dedupe."""
+    start = 1_400_000_000
+    stats = analyze(Cascade.from_edges(
+        ["0", "1", "2", "3"],
+        [None, "0", "1", "0"],
+        timestamps=[start, start + 600, start + 1800, start + 30 * 3600],
+        followers=[1000, 50, 80, None],
+        uids=[1, 2, 2, None],
+    ))
+    # Poster 2 counts once, at their larger follower count
+    assert stats.estimated_reach == 1080
+    assert [w["nodes"] for w in stats.growth[:2]] == [3, 0]
+    assert stats.growth[5] == {"until_hours": 48, "nodes": 1, "cumulative": 4, "per_hour": 0.042}
+    # Median of 0, 10, 30 minutes and 30 hours
+    assert stats.half_life_hours == pytest.approx(20 / 60, abs=1e-3)
+    assert stats.spread_speed == "fast"
+    assert 0 < stats.influence_score < 1
+
+    assert analyze(Cascade.from_edges(["0", "1"], [None, "0"])).spread_speed is None
+
+
+@pytest.mark.asyncio
+async def test_propagation_stats_cached_until_cascade_grows(db_session):
+    """Test stats are computed once and recomputed after new nodes arrive."""
+    from app.models.detection import Detection, PropagationNode
+    from app.models.user import User
+    from app.services.propagation_service import PropagationService
+
+    user = User(email="cascade@example.com", username="cascade", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    detection = Detection(user_id=user.id, content="网传", is_rumor=True, confidence=0.1, risk_level="high")
+    db_session.add(detection)
+    db_session.add_all([
+        PropagationNode(detection=detection, node_id="0", user_info={"uid": 1, "followers_count": 10}),
+        PropagationNode(detection=detection, node_id="1", parent_id="0", user_info={"uid": 2, "followers_count": 5}),
+    ])
+    await db_session.commit()
+
+    service = PropagationService(db_session)
+    stats = await service.get_stats(detection.id)
+    assert (stats.node_count, stats.estimated_reach) == (2, 15)
+    computed_at = stats.computed_at
+    assert (await service.get_stats(detection.id)).computed_at == computed_at
+
+    db_session.add(PropagationNode(detection_id=detection.id, node_id="2", parent_id="1"))
+    await db_session.commit()
+    stats = await service.get_stats(detection.id)
+    assert (stats.node_count, stats.max_depth) == (3, 2)
+
+
+async def _cascade_detection(db_session, email: str):
+    from datetime import datetime, timedelta, timezone
+
+    from app.models.detection import Detection, PropagationNode
+    from app.models.user import User
+
+    user = (await db_session.execute(select(User).where(User.email == email))).scalar_one_or_none()
+    if user is None:
+        user = User(email=email, username=email.split("@")[0], hashed_password="x")
+        db_session.add(user)
+        await db_session.flush()
+    detection = Detection(user_id=user.id, content="网传", is_rumor=True, confidence=0.1, risk_level="high")
+    db_session.add(detection)
+    start = datetime(2014, 5, 1, tzinfo=timezone.utc)
+    # r -> a -> b, r -> c, and o reposting a post missing from the cascade
+    edges = [("r", None, 0), ("a", "r", 5), ("c", "r", 1), ("b", "a", 2), ("o", "gone", 3)]
+    db_session.add_all(
+        PropagationNode(
+            detection=detection,
+            node_id=node_id,
+            parent_id=parent_id,
+            timestamp=start + timedelta(minutes=minutes),
+        )
+        for node_id, parent_id, minutes in edges
+    )
+    await db_session.commit()
+    return detection
+
+
+@pytest.mark.asyncio
+async def test_get_nodes_walks_subtrees(db_session):
+    """Test depth and time ordering, subtrees, depth limits and paging."""
+    from app.services.propagation_service import PropagationService
+
+    detection = await _cascade_detection(db_session, "tree@example.com")
+    service = PropagationService(db_session)
+
+    rows, total = await service.get_nodes(detection.id)
+    assert total == 5
+    assert [(node.node_id, depth) for node, depth in rows] == [
+        ("r", 0), ("o", 0), ("c", 1), ("a", 1), ("b", 2),
+    ]
+
+    rows, _ = await service.get_nodes(detection.id, order="time")
+    assert [node.node_id for node, _ in rows] == ["r", "c", "b", "o", "a"]
+
+    rows, total = await service.get_nodes(detection.id, root_node_id="a")
+    assert ([(node.node_id, depth) for node, depth in rows], total) == ([("a", 0), ("b", 1)], 2)
+
+    rows, total = await service.get_nodes(detection.id, min_depth=1, max_depth=1)
+    assert ({node.node_id for node, _ in rows}, total) == ({"a", "c"}, 2)
+
+    rows, total = await service.get_nodes(detection.id, page=3, page_size=2)
+    assert ([node.node_id for node, _ in rows], total) == (["b"], 5)
+    assert await service.get_nodes(detection.id, page=4, page_size=2) == ([], 5)
+    assert await service.node_exists(detection.id, "b")
+    assert not await service.node_exists(detection.id, "gone")
+
+
+@pytest.mark.asyncio
+async def test_propagation_endpoint_pages_subtree(client, db_session):
+    """Test the propagation endpoint pages nodes and returns cascade stats."""
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "spread@example.com", "username": "spread", "password": "testpass123"},
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "spread@example.com", "password": "testpass123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    detection = await _cascade_detection(db_session, "spread@example.com")
+    url = f"/api/v1/detection/{detection.id}/propagation"
+
+    response = await client.get(url, params={"page_size": 2}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert [node["node_id"] for node in data["nodes"]] == ["r", "o"]
+    assert (data["total"], data["total_pages"], data["node_count"]) == (5, 3, 5)
+    assert data["pattern"] is not None
+
+    response = await client.get(url, params={"node_id": "a"}, headers=headers)
+    assert [(n["node_id"], n["depth"]) for n in response.json()["nodes"]] == [("a", 0), ("b", 1)]
+
+    response = await client.get(url, params={"node_id": "missing"}, headers=headers)
+    assert response.status_code == 404
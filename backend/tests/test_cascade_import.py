@@ -0,0 +1,113 @@
+"""Tests for the Ma-Weibo cascade importer."""
+
+import json
+
+import pytest
+
+from app.services.cascade_import_service import (
+    CascadeImportService,
+    event_tasks,
+    read_event_cascade,
+)
+
+POSTS = [
+    {"id": "100", "mid": "100", "text": "网传明天全城停水", "uid": 1, "t": 1400000000,
+     "followers_count": 5000, "reposts_count": 2},
+    {"mid": "101", "parent": "100", "text": "转发", "uid": 2, "t": 1400000060},
+    {"mid": "102", "parent": "101", "text": "转发", "uid": 3, "t": 1400000120},
+]
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    """A raw dataset with one cascade and one missing event file."""
+    (tmp_path / "Weibo").mkdir()
+    (tmp_path / "Weibo.txt").write_text("eid:100\tlabel:1\neid:200\tlabel:0\n", encoding="utf-8")
+    (tmp_path / "Weibo" / "100.json").write_text(json.dumps(POSTS, ensure_ascii=False), encoding="utf-8")
+    return tmp_path
+
+
+def test_read_event_cascade(raw_dir):
+    """Test an event file becomes a labeled result and COPY-ready node rows."""
+    tasks = event_tasks(str(raw_dir), skip={"300"})
+    assert [task[0] for task in tasks] == ["100", "200"]
+
+    event = read_event_cascade(tasks[0])
+    assert event.event_id == "100"
+    assert event.result["is_rumor"] is True
+    assert event.result["known_event_id"] == "100"
+    assert [(node[2], node[3]) for node in event.nodes] == [
+        ("100", None), ("101", "100"), ("102", "101"),
+    ]
+    assert all(node[1] == tasks[0][3] for node in event.nodes)
+    assert json.loads(event.nodes[0][5])["followers_count"] == 5000
+    assert event.nodes[1][7].timestamp() == 1400000060
+
+    assert read_event_cascade(tasks[1]) is None
+
+
+@pytest.mark.asyncio
+async def test_import_event_copies_cascade(db_session, raw_dir):
+    """Test an imported event's detection and nodes land in one transaction."""
+    from sqlalchemy import func, select
+
+    from app.models.detection import Detection, PropagationNode
+    from app.models.user import User
+
+    user = User(email="importer@example.com", username="importer", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+
+    service = CascadeImportService(db_session)
+    event = read_event_cascade(event_tasks(str(raw_dir))[0])
+    assert await service.import_event(user.id, event) == 3
+    await db_session.commit()
+
+    detection = await db_session.get(Detection, event.detection_id)
+    assert detection.dataset_event_id == "100"
+    count = await db_session.scalar(
+        select(func.count()).select_from(PropagationNode).where(
+            PropagationNode.detection_id == event.detection_id
+        )
+    )
+    assert count == 3
+    assert await service.imported_event_ids(user.id) == {"100"}
+
+
+@pytest.mark.asyncio
+async def test_import_invalidates_cached_analytics(client, db_session, raw_dir):
+    """Test an import makes cached analytics and their ETags stale."""
+    from sqlalchemy import select
+
+    from app.models.user import User
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "importer@example.com", "username": "importer", "password": "testpass123"},
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "importer@example.com", "password": "testpass123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    before = await client.get("/api/v1/analysis/overview", headers=headers)
+    assert before.json()["total_detections"] == 0
+    etag = before.headers["etag"]
+
+    user = (
+        await db_session.execute(select(User).where(User.email == "importer@example.com"))
+    ).scalar_one()
+    service = CascadeImportService(db_session)
+    await service.import_event(user.id, read_event_cascade(event_tasks(str(raw_dir))[0]))
+    await db_session.commit()
+    await service.finish(user.id)
+    await db_session.commit()
+
+    after = await client.get(
+        "/api/v1/analysis/overview",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+    assert after.json()["total_detections"] == 1
@@ -160,3 +160,260 @@ async def test_get_history(client: AsyncClient, mock_deepseek_response):
     data = response.json()
     assert "items" in data
     assert data["total"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_detect_reuses_near_duplicate_verdict(
+    client: AsyncClient,
+    db_session,
+    mock_deepseek_response,
+):
+    """Test a lightly edited repost reuses the earlier verdict without the model."""
+    from sqlalchemy import select
+
+    from app.models.detection import Detection
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpass123",
+        },
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpass123",
+        },
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    post = "网传某市明天将全面封城，请大家提前囤货，超市蔬菜大米已经被抢购一空，消息来自内部人士"
+
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        return_value=mock_deepseek_response,
+    ) as detect_rumor:
+        first = await client.post(
+            "/api/v1/detection/single",
+            json={"content": post},
+            headers=headers,
+        )
+        second = await client.post(
+            "/api/v1/detection/single",
+            json={"content": f"转发微博 😱😱😱 #封城# {post} http://t.cn/abc"},
+            headers=headers,
+        )
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert detect_rumor.await_count == 1
+    assert second.json()["is_rumor"] is True
+
+    result = await db_session.execute(
+        select(Detection.matched_detection_id, Detection.match_distance).where(
+            Detection.id == second.json()["id"]
+        )
+    )
+    matched_id, distance = result.one()
+    assert str(matched_id) == first.json()["id"]
+    assert distance == 0
+
+
+@pytest.mark.asyncio
+async def test_detect_shares_claim_across_users(
+    client: AsyncClient,
+    db_session,
+    mock_deepseek_response,
+):
+    """Test identical content from two users is verified by the model once."""
+    from sqlalchemy import select
+
+    from app.models.claim import Claim
+    from app.models.detection import Detection
+
+    headers = []
+    for name in ("alice", "bob"):
+        await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": f"{name}@example.com",
+                "username": name,
+                "password": "testpass123",
+            },
+        )
+        login_response = await client.post(
+            "/api/v1/auth/login",
+            data={
+                "username": f"{name}@example.com",
+                "password": "testpass123",
+            },
+        )
+        headers.append({"Authorization": f"Bearer {login_response.json()['access_token']}"})
+    post = "紧急通知：自来水厂被污染，今晚起全城停水三天，请立即储水并转告亲友"
+
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+        return_value=mock_deepseek_response,
+    ) as detect_rumor:
+        first = await client.post(
+            "/api/v1/detection/single",
+            json={"content": post, "include_analysis": False},
+            headers=headers[0],
+        )
+        second = await client.post(
+            "/api/v1/detection/single",
+            json={"content": f"转发微博 {post} http://t.cn/abc", "include_analysis": False},
+            headers=headers[1],
+        )
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert detect_rumor.await_count == 1
+    assert second.json()["explanation"] == mock_deepseek_response["explanation"]
+
+    result = await db_session.execute(
+        select(Detection.claim_id, Detection.raw_response).where(
+            Detection.id.in_([first.json()["id"], second.json()["id"]])
+        )
+    )
+    rows = result.all()
+    assert len({claim_id for claim_id, _ in rows}) == 1
+    assert all(raw_response is None for _, raw_response in rows)
+
+    claim = await db_session.get(Claim, rows[0][0])
+    assert claim.hit_count == 1
+    assert claim.raw_response["keywords"] == mock_deepseek_response["keywords"]
+
+
+@pytest.mark.asyncio
+async def test_reverified_claim_keeps_earlier_verdict(db_session, mock_deepseek_response):
+    """Test re-verifying stale content adds a claim instead of rewriting the old one."""
+    from datetime import timedelta
+
+    from sqlalchemy import update
+
+    from app.models.claim import Claim
+    from app.services.claim_service import ClaimService, claim_fingerprint
+
+    service = ClaimService(db_session)
+    key = claim_fingerprint("紧急通知：自来水厂被污染，今晚起全城停水三天")
+    old_id = await service.store(key, "v1", mock_deepseek_response)
+    await db_session.execute(
+        update(Claim)
+        .where(Claim.id == old_id)
+        .values(verified_at=Claim.verified_at - timedelta(days=30))
+    )
+    assert await service.lookup(key, ["v1"]) is None
+
+    new_id = await service.store(key, "v1", {**mock_deepseek_response, "is_rumor": False})
+    await db_session.commit()
+    assert new_id != old_id
+    assert (await service.lookup(key, ["v1"])).id == new_id
+    old = await db_session.get(Claim, old_id)
+    assert old.is_rumor is True
+    assert old.raw_response["is_rumor"] is True
+
+
+@pytest.mark.asyncio
+async def test_find_match_filters_version_and_age_before_ranking(db_session):
+    """Test the closest fresh verdict of an acceptable version wins among many candidates."""
+    from datetime import datetime, timedelta, timezone
+
+    from app.models.detection import Detection
+    from app.models.user import User
+    from app.services.near_duplicate_service import NearDuplicateService
+
+    user = User(email="match@example.com", username="match", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    service = NearDuplicateService(db_session)
+    fingerprint = 0x0123_4567_89AB_CDEF
+
+    def index(flipped: int, version: str, age_hours: int = 0) -> tuple[Detection, int, str]:
+        row = Detection(
+            user_id=user.id,
+            content="网传",
+            is_rumor=True,
+            confidence=0.35,
+            risk_level="critical",
+            raw_response={"is_rumor": True, "distance": bin(flipped).count("1")},
+            created_at=datetime.now(timezone.utc) - timedelta(hours=age_hours),
+        )
+        db_session.add(row)
+        return row, fingerprint ^ flipped, version
+
+    # Far candidates sharing only the lowest band come first in the table
+    rows = [index(0x5555 << 16 | i << 40, "single") for i in range(250)]
+    rows += [
+        index(0, "single", age_hours=200),
+        index(0b1, "batch"),
+        index(0b11, "single", age_hours=2),
+        index(0b11, "single", age_hours=1),
+    ]
+    await db_session.flush()
+    for row, candidate, version in rows:
+        service.add(row.id, candidate, version)
+    await db_session.commit()
+
+    match = await service.find_match(fingerprint, ["single"])
+    assert (match.detection_id, match.distance) == (rows[-1][0].id, 2)
+    match = await service.find_match(fingerprint, ["single", "batch"])
+    assert (match.detection_id, match.result["distance"]) == (rows[-3][0].id, 1)
+    assert await service.find_match(fingerprint, ["other"]) is None
+
+
+@pytest.mark.asyncio
+async def test_rebuild_near_duplicates_indexes_only_model_verdicts(db_session, mock_deepseek_response):
+    """Test reused verdicts stay out of a rebuilt index, even after their source is deleted."""
+    from datetime import datetime, timedelta, timezone
+
+    from sqlalchemy import select
+
+    from app.models.detection import Detection, DetectionFingerprint
+    from app.models.user import User
+    from app.services.claim_service import ClaimService
+    from app.services.near_duplicate_service import NearDuplicateService
+
+    user = User(email="rebuild@example.com", username="rebuild", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    claim_id = await ClaimService(db_session).store("f" * 64, "v1", mock_deepseek_response)
+    start = datetime.now(timezone.utc)
+
+    def detection(content: str, minutes: int = 0, **kwargs) -> Detection:
+        row = Detection(
+            user_id=user.id,
+            content=content,
+            is_rumor=True,
+            confidence=0.35,
+            risk_level="critical",
+            created_at=start + timedelta(minutes=minutes),
+            **kwargs,
+        )
+        db_session.add(row)
+        return row
+
+    source = detection("紧急通知：自来水厂被污染，今晚起全城停水三天，请立即储水", raw_response={"is_rumor": True})
+    await db_session.flush()
+    reused = detection(
+        "转发：紧急通知：自来水厂被污染，今晚起全城停水三天，请立即储水",
+        matched_detection_id=source.id,
+        match_distance=1,
+    )
+    detection("网传某市明天将全面封城，请大家提前囤货，超市已被抢空", raw_response={"known_event_id": "1"})
+    detection("网传某地发生地震，死亡人数超过一千人，政府隐瞒真相", dataset_event_id="2")
+    first = detection("专家称吃大蒜可以预防新冠病毒感染，每天三瓣效果最好", claim_id=claim_id)
+    detection("专家称吃大蒜可以预防新冠病毒感染，每天三瓣效果最好", 1, claim_id=claim_id)
+    await db_session.commit()
+    await db_session.delete(source)
+    await db_session.commit()
+    await db_session.refresh(reused)
+    assert reused.matched_detection_id is None
+
+    assert await NearDuplicateService(db_session).rebuild() == 1
+    indexed = (await db_session.execute(select(DetectionFingerprint.detection_id))).scalars().all()
+    assert indexed == [first.id]
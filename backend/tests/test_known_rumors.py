@@ -0,0 +1,123 @@
+"""Tests for the known rumor index."""
+
+import os
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+import pytest
+
+from app.services.known_rumor_service import KnownRumorIndex, known_rumor_result
+
+RUMOR = "网传某市明天将全面封城，请大家提前囤货，超市蔬菜大米已经被抢购一空，消息来自内部人士"
+FACT = "市气象台发布暴雨蓝色预警，预计今晚到明天白天全市有大到暴雨，请市民注意出行安全"
+
+
+def _index() -> KnownRumorIndex:
+    index = KnownRumorIndex()
+    index.build(pd.DataFrame({
+        "event_id": [3487465612345678, 3501234567890123, None],
+        "text": [RUMOR, FACT, "缺少事件编号的帖子"],
+        "is_rumor": [True, False, True],
+    }))
+    return index
+
+
+def test_lookup_exact_and_near_duplicate():
+    """Test reposts of labeled events match and unrelated text doesn't."""
+    index = _index()
+    assert len(index) == 2
+
+    exact = index.lookup(f"转发微博 {RUMOR} http://t.cn/abc")
+    assert exact == ("3487465612345678", True, 0)
+
+    near = index.lookup(f"//@某网友: 😱😱😱 #突发# {RUMOR}")
+    assert near.event_id == "3487465612345678"
+    assert near.is_rumor
+
+    assert index.lookup(FACT).is_rumor is False
+    assert index.lookup("今天天气不错，下午去公园散步，风景很好看，晚上和朋友一起吃火锅聊天") is None
+    assert KnownRumorIndex().lookup(RUMOR) is None
+
+
+def test_save_and_load(tmp_path):
+    """Test the saved index matches like the one built from the dataset."""
+    path = str(tmp_path / "known_rumors.npz")
+    _index().save(path)
+
+    loaded = KnownRumorIndex()
+    assert loaded.load_file(path)
+    assert len(loaded) == 2
+    assert loaded.lookup(RUMOR) == ("3487465612345678", True, 0)
+
+
+def test_load_rebuilds_from_newer_dataset(tmp_path):
+    """Test a dataset newer than the saved index is re-indexed."""
+    dataset = tmp_path / "weibo_rumors.csv"
+    index_path = str(tmp_path / "known_rumors.npz")
+    pd.DataFrame({"event_id": ["1"], "text": [RUMOR], "is_rumor": [True]}).to_csv(dataset, index=False)
+
+    assert KnownRumorIndex().load(index_path, str(dataset)) == 1
+    assert os.path.exists(index_path)
+
+    pd.DataFrame({
+        "event_id": ["1", "2"],
+        "text": [RUMOR, FACT],
+        "is_rumor": [True, False],
+    }).to_csv(dataset, index=False)
+    os.utime(index_path, (0, 0))
+    assert KnownRumorIndex().load(index_path, str(dataset)) == 2
+    assert KnownRumorIndex().load(str(tmp_path / "missing.npz"), str(tmp_path / "missing.csv")) == 0
+
+
+def test_result_cites_event():
+    """Test a known rumor verdict cites its event in the model response format."""
+    index = _index()
+    result = known_rumor_result(index.lookup(RUMOR), RUMOR)
+
+    assert result["is_rumor"] is True
+    assert result["confidence"] == 0.0
+    assert "3487465612345678" in result["explanation"]
+    assert result["sources"] == ["Ma-Weibo event 3487465612345678"]
+    assert result["keywords"]
+
+
+@pytest.mark.asyncio
+async def test_detect_known_rumor_off_the_event_loop(client, monkeypatch):
+    """Test known rumor verdicts skip the model and build keywords in a worker thread."""
+    from app.services import detection_service, known_rumor_service
+
+    monkeypatch.setattr(detection_service, "known_rumors", _index())
+    threads = []
+    extract_keywords = known_rumor_service.extract_keywords
+
+    def recording_extract_keywords(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return extract_keywords(*args, **kwargs)
+
+    monkeypatch.setattr(known_rumor_service, "extract_keywords", recording_extract_keywords)
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "known@example.com", "username": "known", "password": "testpass123"},
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "known@example.com", "password": "testpass123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    with patch(
+        "app.services.deepseek_service.DeepSeekService.detect_rumor",
+        new_callable=AsyncMock,
+    ) as detect_rumor:
+        response = await client.post(
+            "/api/v1/detection/single",
+            json={"content": RUMOR},
+            headers=headers,
+        )
+
+    assert response.status_code == 200
+    assert response.json()["is_rumor"] is True
+    assert detect_rumor.await_count == 0
+    assert threads and threading.get_ident() not in threads
@@ -0,0 +1,55 @@
+"""Tests for lexicon matching."""
+
+from app.utils.lexicon import LexiconMatch, LexiconMatcher
+from app.utils.text_processor import (
+    detect_exaggeration_patterns,
+    detect_exaggeration_patterns_batch,
+)
+
+
+def test_matcher_reports_overlapping_spans():
+    """Test every occurrence is found with its category and span."""
+    matcher = LexiconMatcher({"a": ["he", "she", "hers"], "b": ["his", "he"]})
+    text = "ushers his"
+
+    matches = matcher.find_all(text)
+
+    assert LexiconMatch("a", "she", 1, 4) in matches
+    assert LexiconMatch("a", "he", 2, 4) in matches
+    assert LexiconMatch("b", "he", 2, 4) in matches
+    assert LexiconMatch("a", "hers", 2, 6) in matches
+    assert LexiconMatch("b", "his", 7, 10) in matches
+    assert all(text[m.start:m.end] == m.term for m in matches)
+    assert matcher.matched_terms(text) == [
+        ("a", "he"), ("a", "she"), ("a", "hers"), ("b", "his"), ("b", "he"),
+    ]
+
+
+def test_matcher_from_directory(tmp_path):
+    """Test lexicon files are loaded per category, skipping comments."""
+    (tmp_path / "urgent.txt").write_text("# comment\n紧急\n\n速看\n", encoding="utf-8")
+    (tmp_path / "alpha.txt").write_text("据说\n", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("ignored\n", encoding="utf-8")
+
+    matcher = LexiconMatcher.from_directory(str(tmp_path), categories=["urgent"])
+
+    assert matcher.categories == ["urgent", "alpha"]
+    assert len(matcher) == 3
+    assert matcher.find_all_batch(["据说速看", ""]) == [
+        [LexiconMatch("alpha", "据说", 0, 2), LexiconMatch("urgent", "速看", 2, 4)],
+        [],
+    ]
+
+
+def test_detect_exaggeration_patterns():
+    """Test pattern labels keep their format and lexicon order."""
+    text = "紧急！网传数万人感染，据说一定要看，紧急"
+
+    assert detect_exaggeration_patterns(text) == [
+        "large_numbers",
+        "urgent_language:紧急",
+        "vague_source:据说",
+        "vague_source:网传",
+        "emotional_manipulation:一定要看",
+    ]
+    assert detect_exaggeration_patterns_batch([text, "今天天气不错"])[1] == []
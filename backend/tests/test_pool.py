@@ -0,0 +1,56 @@
+"""Tests for connection pool instrumentation."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.pool import PoolMetrics
+
+
+def test_pool_metrics_percentiles():
+    """Test checkout waits are summarized."""
+    metrics = PoolMetrics(window=100)
+    for wait_ms in range(1, 101):
+        metrics.record(float(wait_ms))
+    metrics.record(30000.0, timed_out=True)
+
+    data = metrics.to_dict()
+    assert data["checkouts"] == 100
+    assert data["timeouts"] == 1
+    assert data["max_wait_ms"] == 30000.0
+    # The window keeps the latest 100 attempts
+    assert data["p50_wait_ms"] == 52.0
+    assert data["p99_wait_ms"] == 30000.0
+
+
+@pytest.mark.asyncio
+async def test_database_health(client: AsyncClient, db_session):
+    """Test the pool status endpoint is for superusers only."""
+    from sqlalchemy import update
+
+    from app.models.user import User
+    from app.services.principal_service import PrincipalService
+
+    assert (await client.get("/health/db")).status_code == 401
+
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "ops@example.com", "username": "ops", "password": "testpass123"},
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "ops@example.com", "password": "testpass123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    assert (await client.get("/health/db", headers=headers)).status_code == 403
+
+    result = await db_session.execute(
+        update(User).where(User.email == "ops@example.com").values(is_superuser=True).returning(User.id)
+    )
+    await PrincipalService(db_session).invalidate(result.scalar_one())
+    await db_session.commit()
+
+    response = await client.get("/health/db", headers=headers)
+    assert response.status_code == 200
+    primary = response.json()["primary"]
+    assert primary["size"] >= 1
+    assert "p95_wait_ms" in primary
@@ -0,0 +1,110 @@
+"""Tests for the Ma-Weibo preprocessing script."""
+
+import json
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from app.utils.dataset import load_table, read_frame
+from data.preprocess import preprocess_dataset
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    """A tiny raw dataset: two events, one missing file, one malformed file."""
+    raw = tmp_path / "raw"
+    (raw / "Weibo").mkdir(parents=True)
+    (raw / "Weibo.txt").write_text(
+        "eid:1\tlabel:1\t1 2\neid:2\tlabel:0\t3\neid:3\tlabel:1\t4\neid:4\tlabel:0\t5\n",
+        encoding="utf-8",
+    )
+    for eid, text, reposts in (("1", "网传明天停水", 3), ("2", "暴雨蓝色预警", 1)):
+        posts = [{"id": eid, "text": text, "uid": 10, "t": 1400000000}]
+        posts += [{"id": f"{eid}-{i}", "text": "转发", "parent": eid} for i in range(reposts)]
+        (raw / "Weibo" / f"{eid}.json").write_text(json.dumps(posts, ensure_ascii=False), encoding="utf-8")
+    (raw / "Weibo" / "4.json").write_text("[{", encoding="utf-8")
+    return raw
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_preprocess_streams_events_in_order(raw_dir, tmp_path, workers):
+    """Test chunked, parallel output keeps label order and skips bad events."""
+    output = tmp_path / "processed" / "weibo_rumors.csv"
+
+    stats = preprocess_dataset(
+        str(raw_dir), str(output.parent), ["csv"], workers=workers, chunk_size=1,
+    )
+
+    assert (stats.events, stats.records, stats.rumors) == (4, 2, 1)
+    assert (stats.missing, stats.failed) == (1, 1)
+    df = pd.read_csv(output)
+    assert df["event_id"].tolist() == [1, 2]
+    assert df["total_posts"].tolist() == [4, 2]
+    assert df["is_rumor"].tolist() == [True, False]
+    assert not (tmp_path / "processed" / "weibo_rumors.csv.tmp").exists()
+
+
+def test_preprocess_writes_columnar_outputs(raw_dir, tmp_path):
+    """Test Arrow and Parquet outputs keep dtypes and the full repost chains."""
+    output_dir = tmp_path / "processed"
+    stats = preprocess_dataset(
+        str(raw_dir), str(output_dir), ["arrow", "parquet"], workers=1, chunk_size=1,
+    )
+    assert stats.reposts == 6
+
+    for fmt in ("arrow", "parquet"):
+        posts = load_table(str(output_dir / f"weibo_rumors.{fmt}"))
+        assert posts.column("event_id").to_pylist() == ["1", "2"]
+        assert str(posts.schema.field("is_rumor").type) == "bool"
+        assert str(posts.schema.field("uid").type) == "int64"
+
+        reposts = read_frame(str(output_dir / f"weibo_reposts.{fmt}"), ["event_id", "parent_id"])
+        assert reposts["event_id"].tolist() == ["1"] * 4 + ["2"] * 2
+        assert reposts["parent_id"].isna().sum() == 2
+
+
+def test_preprocess_reruns_incrementally(raw_dir, tmp_path, monkeypatch):
+    """Test reruns parse only new or changed events and drop deleted ones."""
+    from data.preprocess import _Outputs
+
+    # Make carrying over previous output measurably slow
+    copy_existing = _Outputs.copy_existing
+
+    def slow_copy_existing(self, *args):
+        time.sleep(0.05)
+        return copy_existing(self, *args)
+
+    monkeypatch.setattr(_Outputs, "copy_existing", slow_copy_existing)
+    output_dir = str(tmp_path / "processed")
+    first = preprocess_dataset(str(raw_dir), output_dir, ["csv", "arrow"], workers=1)
+    assert (first.parsed, first.reused) == (2, 0)
+
+    # Event 2 deleted, event 1 edited, event 3 added; event 4 still malformed
+    weibo = raw_dir / "Weibo"
+    (raw_dir / "Weibo.txt").write_text(
+        "eid:1\tlabel:1\neid:3\tlabel:1\neid:4\tlabel:0\neid:5\tlabel:0\n", encoding="utf-8",
+    )
+    (weibo / "1.json").write_text(json.dumps([{"id": "1", "text": "网传明天停水一周"}]), encoding="utf-8")
+    (weibo / "3.json").write_text(json.dumps([{"id": "3", "text": "新事件"}]), encoding="utf-8")
+    (weibo / "5.json").write_text(json.dumps([{"id": "5", "text": "不变"}]), encoding="utf-8")
+
+    second = preprocess_dataset(str(raw_dir), output_dir, ["csv", "arrow"], workers=1)
+    assert (second.parsed, second.reused, second.dropped) == (3, 0, 1)
+
+    # Touching a file without changing it only re-hashes it
+    os.utime(weibo / "5.json", (0, 0))
+    third = preprocess_dataset(str(raw_dir), output_dir, ["csv", "arrow"], workers=1)
+    assert (third.parsed, third.reused, third.dropped) == (0, 3, 0)
+    assert min(third.timings.values()) >= 0
+
+    for name in ("weibo_rumors.csv", "weibo_rumors.arrow"):
+        df = read_frame(os.path.join(output_dir, name))
+        assert sorted(df["event_id"].astype(str)) == ["1", "3", "5"]
+        assert df.set_index(df["event_id"].astype(str)).loc["1", "text"] == "网传明天停水一周"
+    reposts = read_frame(os.path.join(output_dir, "weibo_reposts.arrow"))
+    assert sorted(reposts["event_id"]) == ["1", "3", "5"]
+
+    forced = preprocess_dataset(str(raw_dir), output_dir, ["csv", "arrow"], workers=1, force=True)
+    assert (forced.parsed, forced.reused) == (3, 0)
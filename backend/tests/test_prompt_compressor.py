@@ -0,0 +1,67 @@
+"""Tests for prompt input compression."""
+
+from app.services.deepseek_service import DeepSeekService
+from app.utils.prompt_compressor import compress, estimate_tokens, normalize
+
+
+def test_normalize_strips_noise_and_repetition():
+    """Test links, mentions, boilerplate and repeats are removed but numbers kept."""
+    text = "转发微博 //@张三: 震惊！！！！😂😂😂😂 快转快转快转 1000万人 http://t.cn/x 展开全文c"
+
+    assert normalize(text) == "震惊！😂 快转 1000万人"
+    assert normalize(text, keep_mentions=True) == "张三: 震惊！😂 快转 1000万人"
+    assert normalize("同一句话。同一句话。另一句。") == "同一句话。另一句。"
+
+
+def test_compress_keeps_salient_sentences_within_budget():
+    """Test long posts are cut to budget, keeping the claim in original order."""
+    text = (
+        "网传某市明天将全面封城，请大家提前囤货。"
+        "我今天去超市买了很多东西，排队的人特别多，大家都在抢购蔬菜和大米。"
+        "天气还不错，下午去公园散步了，风景很好看。"
+        "另外，我家小狗今天生病了，带它去了宠物医院，医生说没什么大问题，开了一些药。"
+        "据说消息来自内部人士，紧急扩散！"
+    )
+
+    result = compress(text, budget=40)
+
+    assert result.tokens <= 40
+    assert result.original_tokens == estimate_tokens(text)
+    assert result.dropped_sentences >= 1
+    assert result.text.startswith("网传某市明天将全面封城")
+    assert "紧急扩散" in result.text
+
+
+def test_compress_keeps_lead_over_repetitive_background():
+    """Test the opening claim survives however heavily the background scores."""
+    background = "".join(f"管网抢修队第{i}组巡检泵站阀门。" for i in range(12))
+    text = "网传某地自来水被污染。" + background + "请大家不要惊慌。"
+
+    result = compress(text, 60)
+
+    assert result.tokens <= 60
+    assert result.text.startswith("网传某地自来水被污染。")
+
+
+def test_compress_truncates_single_long_sentence():
+    """Test a sentence over budget on its own is truncated."""
+    text = "".join(chr(0x4E00 + i) for i in range(300))
+    result = compress(text, budget=10)
+
+    assert 0 < result.tokens <= 10
+    assert text.startswith(result.text)
+
+
+def test_prepare_content_respects_setting(monkeypatch):
+    """Test compression can be switched off."""
+    service = DeepSeekService()
+    text = "震惊！！！！ http://t.cn/x"
+
+    assert service.prepare_content(text, 100) == "震惊！"
+    monkeypatch.setattr("app.services.deepseek_service.settings.PROMPT_COMPRESSION_ENABLED", False)
+    assert service.prepare_content(text, 100) == text
+
+
+def test_compress_keeps_quoted_sources():
+    """Test the prompt still says whose post is being reposted."""
+    assert compress("//@人民日报: 官方辟谣，网传消息不实", 100).text == "人民日报: 官方辟谣，网传消息不实"
@@ -0,0 +1,60 @@
+"""Tests for replica lag-aware read routing."""
+
+import contextlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.replica import ReplicaMonitor
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _Session:
+    def __init__(self, row):
+        self._row = row
+
+    async def execute(self, statement):
+        return _Result(self._row)
+
+
+def _replica(in_recovery: bool, replayed_at):
+    @contextlib.asynccontextmanager
+    async def session_maker():
+        yield _Session((in_recovery, replayed_at))
+
+    return session_maker
+
+
+@pytest.mark.asyncio
+async def test_replica_serves_users_without_recent_writes():
+    """Test reads go to the replica once it has replayed the user's write."""
+    now = datetime.now(timezone.utc)
+    replica = _replica(True, now)
+
+    assert await ReplicaMonitor().has_replayed(replica, None)
+    assert await ReplicaMonitor().has_replayed(replica, now - timedelta(minutes=1))
+    assert not await ReplicaMonitor().has_replayed(replica, now)
+
+
+@pytest.mark.asyncio
+async def test_replica_fallbacks():
+    """Test unreachable or empty replicas fall back to the primary."""
+
+    @contextlib.asynccontextmanager
+    async def broken():
+        raise ConnectionRefusedError()
+        yield
+
+    assert not await ReplicaMonitor().has_replayed(broken, None)
+    assert not await ReplicaMonitor().has_replayed(_replica(True, None), None)
+    # A server not in recovery never lags
+    assert await ReplicaMonitor().has_replayed(
+        _replica(False, None), datetime.now(timezone.utc)
+    )
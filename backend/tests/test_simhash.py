@@ -0,0 +1,34 @@
+"""Tests for SimHash fingerprints."""
+
+from app.services.near_duplicate_service import fingerprint_text
+from app.utils.simhash import band_keys, hamming_distance, simhash, to_signed, to_unsigned
+
+POST = "网传某市明天将全面封城，请大家提前囤货，超市蔬菜大米已经被抢购一空，消息来自内部人士"
+
+
+def test_reposts_are_near_duplicates():
+    """Test reposts with emoji, mentions and markers stay within a few bits."""
+    repost = f"转发微博 //@某网友: 😱😱😱 #突发# {POST} #封城# http://t.cn/abc"
+    unrelated = "今天天气不错，下午去公园散步，风景很好看，晚上和朋友一起吃火锅聊天"
+
+    original = fingerprint_text(POST)
+    assert hamming_distance(original, fingerprint_text(repost)) <= 3
+    assert hamming_distance(original, fingerprint_text(unrelated)) > 3
+    assert fingerprint_text("转发微博") is None
+
+
+def test_band_keys_find_close_fingerprints():
+    """Test fingerprints within bands - 1 bits share a band key."""
+    fingerprint = simhash(["a", "b", "c", "d"])
+    close = fingerprint ^ (1 << 3) ^ (1 << 20) ^ (1 << 63)
+
+    assert hamming_distance(fingerprint, close) == 3
+    assert set(band_keys(fingerprint, 4)) & set(band_keys(close, 4))
+    assert len(set(band_keys(0, 4))) == 4
+
+
+def test_signed_roundtrip():
+    """Test fingerprints survive storage in a signed BIGINT."""
+    value = (1 << 64) - 5
+    assert -(1 << 63) <= to_signed(value) < 0
+    assert to_unsigned(to_signed(value)) == value
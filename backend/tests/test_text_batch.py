@@ -0,0 +1,34 @@
+"""Tests for batched text processing."""
+
+import pytest
+
+from app.utils.text_batch import process_texts, process_texts_async
+from app.utils.text_processor import extract_keywords, segment_text
+
+TEXTS = [
+    "网传某地自来水被污染，市民请勿饮用",
+    "官方通报称该消息不实",
+    "吃瓜群众纷纷转发，话题迅速登上热搜",
+    "微博辟谣：网传图片系多年前旧图",
+    "今天天气不错",
+]
+
+
+def test_process_texts_keeps_input_order():
+    """Test worker processes return the same results as in-process calls, in order."""
+    results, stats = process_texts(TEXTS, top_n=3, workers=2, chunk_size=2)
+
+    assert [r.words for r in results] == [segment_text(t) for t in TEXTS]
+    assert [r.keywords for r in results] == [extract_keywords(t, 3) for t in TEXTS]
+    assert stats.texts == len(TEXTS)
+    assert stats.workers == 2
+    assert stats.texts_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_process_texts_async():
+    """Test the async wrapper runs a single-chunk batch in-process."""
+    results, stats = await process_texts_async(TEXTS[:2], top_n=3)
+
+    assert results[1].words == segment_text(TEXTS[1])
+    assert stats.workers == 1
@@ -0,0 +1,23 @@
+"""Tests for text processing utilities."""
+
+from app.utils.text_processor import extract_keywords, initialize, segment_text
+
+
+def test_user_dictionary_keeps_weibo_terms_whole():
+    """Test terms from the Weibo user dictionary are not split."""
+    initialize()
+    initialize()  # idempotent
+
+    words = segment_text("网传吃瓜群众上热搜，微博辟谣称官方通报不实 http://t.cn/abc")
+
+    assert "吃瓜群众" in words
+    assert "微博辟谣" in words
+    assert not any(word.startswith("http") for word in words)
+
+
+def test_extract_keywords():
+    """Test keyword extraction returns at most top_n terms."""
+    keywords = extract_keywords("网传吃瓜群众上热搜，微博辟谣称官方通报不实", top_n=3)
+
+    assert len(keywords) == 3
+    assert "吃瓜群众" in keywords
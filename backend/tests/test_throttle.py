@@ -0,0 +1,60 @@
+"""Tests for login throttling and password hashing."""
+
+import pytest
+
+from app.core import security
+from app.core.throttle import AttemptLimiter, LoginThrottle
+
+
+def test_attempt_limiter_blocks_after_limit():
+    """Test a key is blocked once it reaches the failure limit."""
+    limiter = AttemptLimiter(limit=2, window=60)
+    limiter.record_failure("k")
+    assert limiter.retry_after("k") == 0
+
+    limiter.record_failure("k")
+    assert 0 < limiter.retry_after("k") <= 60
+    assert limiter.retry_after("other") == 0
+
+    limiter.reset("k")
+    assert limiter.retry_after("k") == 0
+
+
+def test_login_throttle_success_resets_only_client():
+    """Test a successful login clears the account+IP counter but not the account one."""
+    throttle = LoginThrottle()
+    throttle.by_account_ip.limit = 2
+    throttle.by_account.limit = 3
+
+    throttle.record_failure("User@Example.com", "1.1.1.1")
+    throttle.record_failure("user@example.com", "1.1.1.1")
+    assert throttle.retry_after("user@example.com", "1.1.1.1") > 0
+    assert throttle.retry_after("user@example.com", "2.2.2.2") == 0
+
+    throttle.record_success("user@example.com", "1.1.1.1")
+    assert throttle.retry_after("user@example.com", "1.1.1.1") == 0
+
+    throttle.record_failure("user@example.com", "2.2.2.2")
+    assert throttle.retry_after("user@example.com", "3.3.3.3") > 0
+
+
+@pytest.mark.asyncio
+async def test_password_hash_roundtrip(monkeypatch):
+    """Test hashing runs off the loop and flags hashes below the configured cost."""
+    monkeypatch.setattr(security.settings, "BCRYPT_ROUNDS", 4)
+    hashed = await security.get_password_hash("secret123")
+
+    assert await security.verify_password("secret123", hashed)
+    assert not await security.verify_password("wrong", hashed)
+    assert not security.password_needs_rehash(hashed)
+
+    monkeypatch.setattr(security.settings, "BCRYPT_ROUNDS", 5)
+    assert security.password_needs_rehash(hashed)
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_sheds_load(monkeypatch):
+    """Test hashing is refused once too many calls are queued."""
+    monkeypatch.setattr(security.settings, "BCRYPT_MAX_PENDING", 0)
+    with pytest.raises(security.PasswordHasherBusy):
+        await security.get_password_hash("secret123")
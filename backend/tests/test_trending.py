@@ -0,0 +1,96 @@
+"""Tests for trending keyword sketches."""
+
+import uuid
+
+import pytest
+
+from app.services.trending_service import TrendingTracker
+from app.utils.sketches import CountMinSketch, HyperLogLog, SpaceSaving
+
+
+def test_count_min_never_underestimates():
+    """Test Count-Min estimates are upper bounds."""
+    sketch = CountMinSketch(width=64, depth=4)
+    for i in range(500):
+        sketch.add(f"term-{i % 50}")
+    for i in range(50):
+        assert sketch.estimate(f"term-{i}") >= 10
+
+
+def test_space_saving_keeps_heavy_hitters():
+    """Test Space-Saving tracks items above N/capacity."""
+    summary = SpaceSaving(capacity=10)
+    for i in range(1000):
+        summary.add("疫苗" if i % 4 == 0 else f"noise-{i}")
+    top_item, top_count = summary.top(1)[0]
+    assert top_item == "疫苗"
+    assert top_count >= 250
+    assert len(summary.counts) == 10
+
+
+def test_hyperloglog_estimate_and_merge():
+    """Test HyperLogLog estimates within a few percent and merges as a union."""
+    left, right = HyperLogLog(precision=12), HyperLogLog(precision=12)
+    for i in range(20000):
+        (left if i % 2 else right).add(f"user-{i}")
+    left.merge(right)
+    assert left.count() == pytest.approx(20000, rel=0.05)
+
+
+def test_tracker_windows_and_snapshot(tmp_path):
+    """Test sliding windows expire old buckets and snapshots round-trip."""
+    tracker = TrendingTracker()
+    start = 1_700_000_000.0
+    user = uuid.uuid4()
+
+    tracker.record(["地震", "谣言"], user, now=start)
+    tracker.record(["地震"], uuid.uuid4(), now=start + 30)
+
+    top, distinct_keywords, distinct_users = tracker.top("hour", 10, now=start + 60)
+    assert top[0] == ("地震", 2)
+    assert distinct_keywords == 2
+    assert distinct_users == 2
+
+    # Two hours later the hour window is empty but the day window is not
+    assert tracker.top("hour", 10, now=start + 7200)[0] == []
+    assert tracker.top("day", 10, now=start + 7200)[0][0] == ("地震", 2)
+
+    path = tmp_path / "trending.json"
+    tracker.save_snapshot(str(path))
+    restored = TrendingTracker()
+    assert restored.load_snapshot(str(path))
+    assert restored.top("hour", 10, now=start + 60) == (top, distinct_keywords, distinct_users)
+
+
+def test_snapshots_merge_across_processes(tmp_path, monkeypatch):
+    """Test each process snapshots to its own file and restores the sum once."""
+    import os
+    import time
+
+    start = time.time()
+    path = str(tmp_path / "trending.json")
+    for pid, keywords in ((101, ["地震", "谣言"]), (102, ["地震"])):
+        monkeypatch.setattr(os, "getpid", lambda pid=pid: pid)
+        tracker = TrendingTracker()
+        tracker.record(keywords, uuid.uuid4(), now=start)
+        tracker.save_snapshot(path)
+
+    # A restarted worker sees both, and its own snapshot adds only its own counts
+    monkeypatch.setattr(os, "getpid", lambda: 103)
+    restored = TrendingTracker()
+    assert restored.load_snapshot(path)
+    assert restored.top("hour", 10, now=start)[0] == [("地震", 2), ("谣言", 1)]
+    restored.record(["地震"], now=start)
+    restored.save_snapshot(path)
+
+    monkeypatch.setattr(os, "getpid", lambda: 104)
+    again = TrendingTracker()
+    assert again.load_snapshot(path)
+    top, _, distinct_users = again.top("hour", 10, now=start)
+    assert (top, distinct_users) == ([("地震", 3), ("谣言", 1)], 2)
+
+    # Snapshots older than the day window are dropped
+    stale = tmp_path / "trending.101.json"
+    os.utime(stale, (start - 2 * 86400, start - 2 * 86400))
+    assert TrendingTracker().load_snapshot(path)
+    assert not stale.exists()
@@ -1,10 +1,7 @@
 import api from './index'
-import type { OverviewStats, TrendDataPoint, CategoryStats, KeywordStats, RiskDistribution } from '@/types'
+import type { OverviewStats, TrendSeries, CategoryStats, KeywordStats, RiskDistribution } from '@/types'
 
-export interface TrendResponse {
-  data: TrendDataPoint[]
-  period: string
-}
+export type TrendResponse = TrendSeries
 
 export interface CategoryResponse {
   data: CategoryStats[]
@@ -21,14 +18,31 @@ export interface RiskDistributionResponse {
   total: number
 }
 
+export interface DashboardResponse {
+  overview: OverviewStats
+  trend: TrendResponse
+  category: CategoryResponse
+  keywords: KeywordsResponse
+  risk: RiskDistributionResponse
+}
+
 export const analysisApi = {
+  async getDashboard(days: number = 30, keywordLimit: number = 50): Promise<DashboardResponse> {
+    const response = await api.get<DashboardResponse>(
+      `/analysis/dashboard?days=${days}&keyword_limit=${keywordLimit}`
+    )
+    return response.data
+  },
+
   async getOverview(): Promise<OverviewStats> {
     const response = await api.get<OverviewStats>('/analysis/overview')
     return response.data
   },
 
-  async getTrend(days: number = 30): Promise<TrendResponse> {
-    const response = await api.get<TrendResponse>(`/analysis/trend?days=${days}`)
+  async getTrend(days: number = 30, granularity: string = 'day', timezone?: string): Promise<TrendResponse> {
+    const params = new URLSearchParams({ days: String(days), granularity })
+    if (timezone) params.set('timezone', timezone)
+    const response = await api.get<TrendResponse>(`/analysis/trend?${params}`)
     return response.data
   },
 
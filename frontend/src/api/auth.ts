@@ -38,8 +38,8 @@ export const authApi = {
     return response.data
   },
 
-  async logout(): Promise<void> {
-    await api.post('/auth/logout')
+  async logout(refreshToken?: string | null): Promise<void> {
+    await api.post('/auth/logout', { refresh_token: refreshToken ?? null })
   },
 
   async getCurrentUser(): Promise<User> {
@@ -24,7 +24,7 @@ export function useChart() {
     xAxis: {
       type: 'category',
       boundaryGap: false,
-      data: analysisStore.trendData.map(d => d.date),
+      data: analysisStore.trend?.buckets ?? [],
       axisLabel: {
         rotate: 45,
         fontFamily: 'Instrument Sans, sans-serif',
@@ -37,7 +37,7 @@ export function useChart() {
       {
         name: 'Rumors',
         type: 'line',
-        data: analysisStore.trendData.map(d => d.rumors),
+        data: analysisStore.trend?.rumors ?? [],
         smooth: true,
         lineStyle: { color: '#e53935', width: 2 },
         itemStyle: { color: '#e53935' },
@@ -46,7 +46,7 @@ export function useChart() {
       {
         name: 'Verified',
         type: 'line',
-        data: analysisStore.trendData.map(d => d.verified),
+        data: analysisStore.trend?.verified ?? [],
         smooth: true,
         lineStyle: { color: '#2e7d32', width: 2 },
         itemStyle: { color: '#2e7d32' },
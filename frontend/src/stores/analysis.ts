@@ -1,12 +1,12 @@
 import { defineStore } from 'pinia'
 import { ref } from 'vue'
-import type { OverviewStats, TrendDataPoint, CategoryStats, KeywordStats, RiskDistribution } from '@/types'
+import type { OverviewStats, TrendSeries, CategoryStats, KeywordStats, RiskDistribution } from '@/types'
 import { analysisApi } from '@/api/analysis'
 
 export const useAnalysisStore = defineStore('analysis', () => {
   // State
   const overview = ref<OverviewStats | null>(null)
-  const trendData = ref<TrendDataPoint[]>([])
+  const trend = ref<TrendSeries | null>(null)
   const categories = ref<CategoryStats[]>([])
   const keywords = ref<KeywordStats[]>([])
   const riskDistribution = ref<RiskDistribution | null>(null)
@@ -23,11 +23,11 @@ export const useAnalysisStore = defineStore('analysis', () => {
     }
   }
 
-  async function fetchTrend(days = 30) {
+  async function fetchTrend(days = 30, granularity = 'day', timezone?: string) {
     loading.value = true
     try {
-      const result = await analysisApi.getTrend(days)
-      trendData.value = result.data
+      const result = await analysisApi.getTrend(days, granularity, timezone)
+      trend.value = result
       return result
     } finally {
       loading.value = false
@@ -67,16 +67,17 @@ export const useAnalysisStore = defineStore('analysis', () => {
     }
   }
 
-  async function fetchAll() {
+  async function fetchAll(days = 30, keywordLimit = 50) {
     loading.value = true
     try {
-      await Promise.all([
-        fetchOverview(),
-        fetchTrend(),
-        fetchCategories(),
-        fetchKeywords(),
-        fetchRiskDistribution(),
-      ])
+      // One round trip for every widget
+      const result = await analysisApi.getDashboard(days, keywordLimit)
+      overview.value = result.overview
+      trend.value = result.trend
+      categories.value = result.category.data
+      keywords.value = result.keywords.data
+      riskDistribution.value = result.risk.distribution
+      return result
     } finally {
       loading.value = false
     }
@@ -85,7 +86,7 @@ export const useAnalysisStore = defineStore('analysis', () => {
   return {
     // State
     overview,
-    trendData,
+    trend,
     categories,
     keywords,
     riskDistribution,
@@ -53,7 +53,7 @@ export const useAuthStore = defineStore('auth', () => {
 
   async function logout() {
     try {
-      await authApi.logout()
+      await authApi.logout(refreshToken.value)
     } catch (e) {
       // Ignore logout errors
     } finally {
@@ -48,11 +48,13 @@ export interface OverviewStats {
   avg_confidence: number
 }
 
-export interface TrendDataPoint {
-  date: string
-  rumors: number
-  verified: number
-  total: number
+export interface TrendSeries {
+  period: string
+  timezone: string
+  buckets: string[]
+  total: number[]
+  rumors: number[]
+  verified: number[]
 }
 
 export interface CategoryStats {